@@ -36,7 +36,11 @@
 
 import numpy as np
 import ase
-from typing import Optional, Union, Dict, Any
+import pint
+from functools import lru_cache
+from math import factorial, sqrt
+from types import MappingProxyType
+from typing import Optional, Union, List, Mapping, Any, Tuple
 from structlog.stdlib import BoundLogger
 
 from nomad.units import ureg
@@ -48,6 +52,58 @@ from nomad.datamodel.metainfo.annotations import ELNAnnotation
 from .utils import RussellSaundersState
 
 
+# Lookup tables between the orbitals quantum numbers and symbols, built once at import time
+_ORBITALS: Mapping[int, Mapping[int, str]] = MappingProxyType(
+    {
+        -1: MappingProxyType(dict(zip(range(4), ('s', 'p', 'd', 'f')))),
+        0: MappingProxyType({0: ''}),
+        1: MappingProxyType(dict(zip(range(-1, 2), ('x', 'z', 'y')))),
+        2: MappingProxyType(
+            dict(zip(range(-2, 3), ('xy', 'xz', 'z^2', 'yz', 'x^2-y^2')))
+        ),
+        3: MappingProxyType(
+            dict(
+                zip(
+                    range(-3, 4),
+                    (
+                        'x(x^2-3y^2)',
+                        'xyz',
+                        'xz^2',
+                        'z^3',
+                        'yz^2',
+                        'z(x^2-y^2)',
+                        'y(3x^2-y^2)',
+                    ),
+                )
+            )
+        ),
+    }
+)
+_ORBITALS_MAP: Mapping[str, Any] = MappingProxyType(
+    {
+        'l_symbols': _ORBITALS[-1],
+        'ml_symbols': MappingProxyType({i: _ORBITALS[i] for i in range(4)}),
+        'ms_symbols': MappingProxyType(dict(zip((-0.5, 0.5), ('down', 'up')))),
+        'l_numbers': MappingProxyType({v: k for k, v in _ORBITALS[-1].items()}),
+        'ml_numbers': MappingProxyType(
+            {
+                k: MappingProxyType({v: kk for kk, v in _ORBITALS[k].items()})
+                for k in range(4)
+            }
+        ),
+        'ms_numbers': MappingProxyType(dict(zip(('down', 'up'), (-0.5, 0.5)))),
+    }
+)
+# Array versions of the tables above used for vectorized lookups: `_ML_SYMBOLS[l, ml + 3]`
+_L_SYMBOLS = np.array(list(_ORBITALS[-1].values()), dtype=object)
+_ML_SYMBOLS = np.full((4, 7), None, dtype=object)
+for _l in range(4):
+    for _ml, _ml_symbol in _ORBITALS[_l].items():
+        _ML_SYMBOLS[_l, _ml + 3] = _ml_symbol
+_L_SYMBOLS.setflags(write=False)
+_ML_SYMBOLS.setflags(write=False)
+
+
 class OrbitalsState(ArchiveSection):
     """
     A base section used to define the orbital state of an atom.
@@ -149,36 +205,9 @@ class OrbitalsState(ArchiveSection):
 
     def __init__(self, m_def: Section = None, m_context: Context = None, **kwargs):
         super().__init__(m_def, m_context, **kwargs)
-        self._orbitals = {
-            -1: dict(zip(range(4), ('s', 'p', 'd', 'f'))),
-            0: {0: ''},
-            1: dict(zip(range(-1, 2), ('x', 'z', 'y'))),
-            2: dict(zip(range(-2, 3), ('xy', 'xz', 'z^2', 'yz', 'x^2-y^2'))),
-            3: dict(
-                zip(
-                    range(-3, 4),
-                    (
-                        'x(x^2-3y^2)',
-                        'xyz',
-                        'xz^2',
-                        'z^3',
-                        'yz^2',
-                        'z(x^2-y^2)',
-                        'y(3x^2-y^2)',
-                    ),
-                )
-            ),
-        }
-        self._orbitals_map: Dict[str, Any] = {
-            'l_symbols': self._orbitals[-1],
-            'ml_symbols': {i: self._orbitals[i] for i in range(4)},
-            'ms_symbols': dict((zip((-0.5, 0.5), ('down', 'up')))),
-            'l_numbers': {v: k for k, v in self._orbitals[-1].items()},
-            'ml_numbers': {
-                k: {v: k for k, v in self._orbitals[k].items()} for k in range(4)
-            },
-            'ms_numbers': dict((zip(('down', 'up'), (-0.5, 0.5)))),
-        }
+        # The lookup tables are shared (and immutable) between all the `OrbitalsState` instances
+        self._orbitals = _ORBITALS
+        self._orbitals_map = _ORBITALS_MAP
 
     def resolve_number_and_symbol(
         self, quantum_name: str, quantum_type: str, logger: BoundLogger
@@ -249,40 +278,152 @@ class OrbitalsState(ArchiveSection):
         """
         degeneracy = None
         if (
-            self.l_quantum_number
+            self.l_quantum_number is not None
             and self.ml_quantum_number is None
             and self.j_quantum_number is None
         ):
-            if self.ms_quantum_number:
+            if self.ms_quantum_number is not None:
                 degeneracy = 2 * self.l_quantum_number + 1
             else:
                 degeneracy = 2 * (2 * self.l_quantum_number + 1)
         elif (
-            self.l_quantum_number
-            and self.ml_quantum_number
+            self.l_quantum_number is not None
+            and self.ml_quantum_number is not None
             and self.j_quantum_number is None
         ):
-            if self.ms_quantum_number:
+            if self.ms_quantum_number is not None:
                 degeneracy = 1
             else:
                 degeneracy = 2
         elif self.j_quantum_number is not None:
-            degeneracy = 0
-            for jj in self.j_quantum_number:
-                if self.mj_quantum_number is not None:
-                    mjs = RussellSaundersState.generate_MJs(
-                        self.j_quantum_number[0], rising=True
-                    )
-                    degeneracy += len(
-                        [mj for mj in mjs if mj in self.mj_quantum_number]
-                    )
-                else:
-                    degeneracy += RussellSaundersState(J=jj, occ=1).degeneracy
+            if self.mj_quantum_number is not None:
+                mj_quantum_numbers = set(self.mj_quantum_number)
+                degeneracy = sum(
+                    len(RussellSaundersState.get_MJs_set(jj) & mj_quantum_numbers)
+                    for jj in self.j_quantum_number
+                )
+            else:
+                degeneracy = int(
+                    RussellSaundersState.get_degeneracies(
+                        self.j_quantum_number, np.ones(len(self.j_quantum_number))
+                    ).sum()
+                )
         return degeneracy
 
+    @classmethod
+    def resolve_in_batch(
+        cls, orbitals_states: List['OrbitalsState'], logger: BoundLogger
+    ) -> None:
+        """
+        Resolves the missing quantum numbers and symbols (l, ml, ms) and the `degeneracy` of a list
+        of `OrbitalsState` sections at once. The results are the same as normalizing each section,
+        but the lookups are done over arrays using the module-level tables `_L_SYMBOLS` and
+        `_ML_SYMBOLS`.
+
+        Args:
+            orbitals_states (List[OrbitalsState]): The list of `OrbitalsState` sections to resolve.
+            logger (BoundLogger): The logger to log messages.
+        """
+        if not orbitals_states:
+            return
+        l_numbers_map = _ORBITALS_MAP['l_numbers']
+        ml_numbers_map = _ORBITALS_MAP['ml_numbers']
+        ms_numbers_map = _ORBITALS_MAP['ms_numbers']
+
+        # l quantum numbers and symbols
+        l_symbols = np.array(
+            [o.l_quantum_symbol for o in orbitals_states], dtype=object
+        )
+        l_numbers = np.array(
+            [
+                o.l_quantum_number
+                if o.l_quantum_number is not None
+                else l_numbers_map.get(o.l_quantum_symbol, -1)
+                for o in orbitals_states
+            ]
+        )
+        has_l = (l_numbers >= 0) & (l_numbers < 4)
+        l_symbols = np.where(
+            has_l & (l_symbols == None),  # noqa: E711
+            _L_SYMBOLS[np.clip(l_numbers, 0, 3)],
+            l_symbols,
+        )
+
+        # ml quantum numbers and symbols (resolved only when l is known)
+        ml_symbols = np.array(
+            [o.ml_quantum_symbol for o in orbitals_states], dtype=object
+        )
+        ml_numbers = np.array(
+            [
+                o.ml_quantum_number
+                if o.ml_quantum_number is not None
+                else (
+                    ml_numbers_map[l_number].get(o.ml_quantum_symbol, -99)
+                    if 0 <= l_number < 4
+                    else -99
+                )
+                for o, l_number in zip(orbitals_states, l_numbers)
+            ]
+        )
+        has_ml = has_l & (np.abs(ml_numbers) <= l_numbers)
+        ml_symbols = np.where(
+            has_ml & (ml_symbols == None),  # noqa: E711
+            _ML_SYMBOLS[np.clip(l_numbers, 0, 3), np.clip(ml_numbers + 3, 0, 6)],
+            ml_symbols,
+        )
+
+        # ms quantum numbers and symbols
+        ms_numbers = np.array(
+            [
+                o.ms_quantum_number
+                if o.ms_quantum_number is not None
+                else ms_numbers_map.get(o.ms_quantum_symbol, np.nan)
+                for o in orbitals_states
+            ],
+            dtype=np.float64,
+        )
+        has_ms = ~np.isnan(ms_numbers)
+        ms_symbols = np.where(
+            ms_numbers == 0.5, 'up', np.where(ms_numbers == -0.5, 'down', None)
+        )
+
+        # Degeneracies in the absence of `j_quantum_number`
+        spin_factor = np.where(has_ms, 1, 2)
+        degeneracies = np.where(has_ml, spin_factor, spin_factor * (2 * l_numbers + 1))
+
+        # Only the missing values are assigned, so that each section is touched at most once per quantity
+        resolved = (
+            ('l_quantum_number', has_l, l_numbers),
+            ('l_quantum_symbol', has_l, l_symbols),
+            ('ml_quantum_number', has_ml, ml_numbers),
+            ('ml_quantum_symbol', has_ml, ml_symbols),
+            ('ms_quantum_number', has_ms, ms_numbers),
+            ('ms_quantum_symbol', has_ms & (ms_symbols != None), ms_symbols),  # noqa: E711
+        )
+        for name, mask, values in resolved:
+            missing = np.array(
+                [getattr(orbital, name) is None for orbital in orbitals_states]
+            )
+            for index in np.flatnonzero(mask & missing):
+                setattr(orbitals_states[index], name, values[index])
+        for index, orbital in enumerate(orbitals_states):
+            if orbital.degeneracy is not None:
+                continue
+            if orbital.j_quantum_number is not None:
+                orbital.degeneracy = orbital.resolve_degeneracy()
+            elif has_l[index]:
+                orbital.degeneracy = degeneracies[index]
+
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
 
+        # The orbitals of an `AtomicCell` are resolved at once by `AtomicCell.resolve_orbitals_states`
+        atoms_state = self.m_parent
+        if atoms_state is not None and hasattr(
+            atoms_state.m_parent, 'resolve_orbitals_states'
+        ):
+            return
+
         # Resolving the quantum numbers and symbols if not available
         for quantum_name in ['l', 'ml', 'ms']:
             for quantum_type in ['number', 'symbol']:
@@ -369,6 +510,147 @@ class CoreHole(ArchiveSection):
                 self.resolve_occupation(logger)
 
 
+# Real (cubic) harmonics ordered by the standard `m = -l, ..., l` convention. These are used to
+# map the `ml_quantum_symbol` of the orbitals to the rows of the Coulomb tensors
+_REAL_HARMONICS_SYMBOLS: Mapping[int, Tuple[str, ...]] = MappingProxyType(
+    {
+        0: ('',),
+        1: ('y', 'z', 'x'),
+        2: ('xy', 'yz', 'z^2', 'xz', 'x^2-y^2'),
+        3: (
+            'y(3x^2-y^2)',
+            'xyz',
+            'yz^2',
+            'z^3',
+            'xz^2',
+            'z(x^2-y^2)',
+            'x(x^2-3y^2)',
+        ),
+    }
+)
+
+
+@lru_cache(maxsize=None)
+def _wigner_3j(j1: int, j2: int, j3: int, m1: int, m2: int, m3: int) -> float:
+    """
+    Wigner 3j symbol for integer angular momenta using the Racah formula.
+    """
+    if m1 + m2 + m3 != 0 or abs(m1) > j1 or abs(m2) > j2 or abs(m3) > j3:
+        return 0.0
+    if j3 < abs(j1 - j2) or j3 > j1 + j2:
+        return 0.0
+    triangle = (
+        factorial(j1 + j2 - j3)
+        * factorial(j1 - j2 + j3)
+        * factorial(-j1 + j2 + j3)
+        / factorial(j1 + j2 + j3 + 1)
+    )
+    prefactor = sqrt(
+        triangle
+        * factorial(j1 + m1)
+        * factorial(j1 - m1)
+        * factorial(j2 + m2)
+        * factorial(j2 - m2)
+        * factorial(j3 + m3)
+        * factorial(j3 - m3)
+    )
+    t_min = max(0, j2 - j3 - m1, j1 - j3 + m2)
+    t_max = min(j1 + j2 - j3, j1 - m1, j2 + m2)
+    racah_sum = sum(
+        (-1) ** t
+        / (
+            factorial(t)
+            * factorial(j3 - j2 + t + m1)
+            * factorial(j3 - j1 + t - m2)
+            * factorial(j1 + j2 - j3 - t)
+            * factorial(j1 - t - m1)
+            * factorial(j2 - t + m2)
+        )
+        for t in range(t_min, t_max + 1)
+    )
+    return (-1) ** (j1 - j2 - m3) * prefactor * racah_sum
+
+
+@lru_cache(maxsize=None)
+def _get_coulomb_angular_coefficients(l_number: int) -> np.ndarray:
+    """
+    Gets the angular (Gaunt) coefficients `a_k(m1, m2, m3, m4)` of the Coulomb tensor in the basis of
+    real harmonics for a shell with azimuthal quantum number `l_number`, such that:
+
+        U_{m1 m2 m3 m4} = sum_k F^k a_k(m1, m2, m3, m4),    with k = 0, 2, ..., 2 * l_number.
+
+    The coefficients are computed once per shell and cached.
+
+    Args:
+        l_number (int): The azimuthal quantum number of the shell.
+
+    Returns:
+        (np.ndarray): The angular coefficients, shape (l_number + 1, 2 * l_number + 1, ..., 2 * l_number + 1).
+    """
+    ms = range(-l_number, l_number + 1)
+    n_ms = len(ms)
+    coefficients = np.zeros((l_number + 1, n_ms, n_ms, n_ms, n_ms))
+    for ik, k in enumerate(range(0, 2 * l_number + 1, 2)):
+        prefactor = (2 * l_number + 1) ** 2 * _wigner_3j(
+            l_number, k, l_number, 0, 0, 0
+        ) ** 2
+        for i1, m1 in enumerate(ms):
+            for i2, m2 in enumerate(ms):
+                for i3, m3 in enumerate(ms):
+                    # The 3j symbols vanish unless q = m1 - m3 = m4 - m2
+                    q = m1 - m3
+                    m4 = m2 + q
+                    if abs(q) > k or abs(m4) > l_number:
+                        continue
+                    coefficients[ik, i1, i2, i3, l_number + m4] = (
+                        prefactor
+                        * (-1) ** (m1 + q + m2)
+                        * _wigner_3j(l_number, k, l_number, -m1, q, m3)
+                        * _wigner_3j(l_number, k, l_number, -m2, -q, m4)
+                    )
+
+    # Transformation from complex spherical harmonics (columns) to real harmonics (rows)
+    transformation = np.zeros((n_ms, n_ms), dtype=np.complex128)
+    for i, m in enumerate(ms):
+        if m == 0:
+            transformation[i, l_number] = 1.0
+        elif m > 0:
+            transformation[i, l_number - m] = 1.0 / np.sqrt(2)
+            transformation[i, l_number + m] = (-1) ** m / np.sqrt(2)
+        else:
+            transformation[i, l_number + m] = 1j / np.sqrt(2)
+            transformation[i, l_number - m] = -1j * (-1) ** m / np.sqrt(2)
+    coefficients = np.einsum(
+        'ai,bj,kijcd,ec,fd->kabef',
+        transformation.conj(),
+        transformation.conj(),
+        coefficients,
+        transformation,
+        transformation,
+    ).real
+    coefficients.setflags(write=False)
+    return coefficients
+
+
+# Tolerance relative to the largest element of a Coulomb tensor to compare its elements and to drop
+# the numerical noise in its compressed representation
+_COULOMB_TENSOR_TOLERANCE = 1e-10
+
+# Index permutations (a, b, c, d) leaving a real Coulomb tensor `U_{abcd}` invariant
+_COULOMB_TENSOR_PERMUTATIONS = np.array(
+    [
+        [0, 1, 2, 3],
+        [1, 0, 3, 2],
+        [2, 1, 0, 3],
+        [0, 3, 2, 1],
+        [2, 3, 0, 1],
+        [1, 2, 3, 0],
+        [3, 0, 1, 2],
+        [3, 2, 1, 0],
+    ]
+)
+
+
 class HubbardInteractions(ArchiveSection):
     """
     A base section to define the Hubbard interactions of the system.
@@ -445,13 +727,79 @@ class HubbardInteractions(ArchiveSection):
         """,
     )
 
+    coulomb_tensor = Quantity(
+        type=np.float64,
+        shape=['n_orbitals', 'n_orbitals', 'n_orbitals', 'n_orbitals'],
+        unit='joule',
+        description="""
+        Value of the local orbital-resolved Coulomb interaction tensor `U_{m1 m2 m3 m4}`, entering
+        in the Hamiltonian as:
+
+            H_int = 1/2 sum U_{m1 m2 m3 m4} c^dagger_{m1 s} c^dagger_{m2 s'} c_{m4 s'} c_{m3 s}
+
+        The order of the indices coincide with the elements in `orbitals_ref`. The density-density
+        part of this tensor is stored in `u_matrix`. If not parsed, it is built during normalization
+        for the `orbitals_ref` from the `slater_integrals` or from `u_interaction` and `j_hunds_coupling`.
+
+        After normalization, this tensor is stored in the compressed `coulomb_tensor_indices` and
+        `coulomb_tensor_values`, and it can be recovered with `expand_coulomb_tensor()`.
+        """,
+    )
+
+    n_coulomb_tensor_elements = Quantity(
+        type=np.int32,
+        description="""
+        Number of elements of the `coulomb_tensor` stored in the compressed representation.
+        """,
+    )
+
+    coulomb_tensor_compression = Quantity(
+        type=MEnum('permutational', 'sparse'),
+        description="""
+        Scheme used to store the `coulomb_tensor` in `coulomb_tensor_indices` and `coulomb_tensor_values`:
+
+        | Name      | Description                      |
+        | --------- | -------------------------------- |
+        | `'permutational'` | Only one element per set of indices related by the permutational symmetries of a real tensor (U_{abcd} = U_{badc} = U_{cbad} = U_{adcb} = U_{cdab} = ...) is stored |
+        | `'sparse'` | All the elements are stored independently |
+        """,
+    )
+
+    coulomb_tensor_indices = Quantity(
+        type=np.int16,
+        shape=['n_coulomb_tensor_elements', 4],
+        description="""
+        Indices (a, b, c, d) of the stored elements of the `coulomb_tensor`. See `coulomb_tensor_compression`.
+        """,
+    )
+
+    coulomb_tensor_values = Quantity(
+        type=np.float64,
+        shape=['n_coulomb_tensor_elements'],
+        unit='joule',
+        description="""
+        Values of the stored elements of the `coulomb_tensor` for each of the `coulomb_tensor_indices`.
+        """,
+    )
+
+    coulomb_tensor_threshold = Quantity(
+        type=np.float64,
+        unit='joule',
+        description="""
+        Elements of the `coulomb_tensor` whose absolute value is below or equal to this threshold are
+        not stored in the compressed representation. The elements below a tolerance relative to the largest
+        element are always dropped as numerical noise.
+        """,
+    )
+
     slater_integrals = Quantity(
         type=np.float64,
-        shape=[3],
+        shape=['*'],
         unit='joule',
         description="""
-        Value of the Slater integrals [F0, F2, F4] in spherical harmonics used to derive
-        the local Hubbard interactions:
+        Value of the Slater integrals [F0, F2, F4, ...] in spherical harmonics, with F0 and F2 for
+        p shells, up to F4 for d shells and up to F6 for f shells. They are used to derive the
+        `coulomb_tensor` and, for d shells, the local Hubbard interactions:
 
             u_interaction = ((2.0 / 7.0) ** 2) * (F0 + 5.0 * F2 + 9.0 * F4) / (4.0*np.pi)
 
@@ -483,14 +831,12 @@ class HubbardInteractions(ArchiveSection):
         Returns:
             (Optional[tuple]): The Hubbard interactions (u_interaction, u_interorbital_interaction, j_hunds_coupling).
         """
-        if self.slater_integrals is None or len(self.slater_integrals) == 3:
+        if self.slater_integrals is None or len(self.slater_integrals) != 3:
             logger.warning(
                 'Could not find `slater_integrals` or the length is not three.'
             )
             return None
-        f0 = self.slater_integrals[0]
-        f2 = self.slater_integrals[1]
-        f4 = self.slater_integrals[2]
+        f0, f2, f4 = self.slater_integrals.to('joule').magnitude
         u_interaction = (
             ((2.0 / 7.0) ** 2)
             * (f0 + 5.0 * f2 + 9.0 * f4)
@@ -528,6 +874,241 @@ class HubbardInteractions(ArchiveSection):
             return None
         return self.u_interaction - self.j_local_exchange_interaction
 
+    def resolve_orbitals_indices(
+        self, logger: BoundLogger
+    ) -> Optional[Tuple[int, np.ndarray, Optional[np.ndarray]]]:
+        """
+        Resolves the shell `l` quantum number and the indices of the `orbitals_ref` in the basis of
+        real harmonics (see `_REAL_HARMONICS_SYMBOLS`), as well as their spin (if defined for all
+        orbitals). Orbitals without `ml` (e.g., a whole d shell) are expanded into all the real
+        harmonics of the shell. If `orbitals_ref` is not defined, the full shell with `l` obtained
+        from the number of `slater_integrals` is used.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[Tuple[int, np.ndarray, Optional[np.ndarray]]]): The `l` quantum number, the
+            indices of the orbitals in the real harmonics basis, and their `ms_quantum_number`.
+        """
+        if not self.orbitals_ref:
+            if self.slater_integrals is None:
+                logger.warning(
+                    'Could not find `HubbardInteractions.orbitals_ref` or `HubbardInteractions.slater_integrals`.'
+                )
+                return None
+            l_number = len(self.slater_integrals) - 1
+            return l_number, np.arange(2 * l_number + 1), None
+
+        # The `orbitals_ref` may not be normalized yet (see `AtomicCell.resolve_orbitals_states`)
+        l_numbers = {
+            orbital.resolve_number_and_symbol('l', 'number', logger)
+            for orbital in self.orbitals_ref
+        }
+        if len(l_numbers) != 1 or None in l_numbers:
+            logger.warning(
+                'The `HubbardInteractions.orbitals_ref` do not belong to a single shell with defined `l_quantum_number`.'
+            )
+            return None
+        l_number = int(l_numbers.pop())
+        if l_number not in _REAL_HARMONICS_SYMBOLS:
+            logger.warning('Only s, p, d and f shells are supported.')
+            return None
+        real_harmonics = {
+            symbol: index
+            for index, symbol in enumerate(_REAL_HARMONICS_SYMBOLS[l_number])
+        }
+
+        # A shell-level orbital (without `ml`) is expanded into all its 2l+1 real harmonics
+        indices = []
+        spins = []
+        for orbital in self.orbitals_ref:
+            ml_symbol = orbital.resolve_number_and_symbol('ml', 'symbol', logger)
+            if ml_symbol is None and orbital.ml_quantum_number is None:
+                orbital_indices = list(range(2 * l_number + 1))
+            else:
+                orbital_indices = [real_harmonics.get(ml_symbol, -1)]
+            indices.extend(orbital_indices)
+            spins.extend(
+                [orbital.resolve_number_and_symbol('ms', 'number', logger)]
+                * len(orbital_indices)
+            )
+        indices = np.array(indices)
+        if (indices == -1).any():
+            logger.warning(
+                'Could not resolve the `ml_quantum_symbol` of some `HubbardInteractions.orbitals_ref`.'
+            )
+            return None
+        spins = None if None in spins else np.array(spins)
+        self.m_cache['orbitals_indices'] = (l_number, indices, spins)
+        return l_number, indices, spins
+
+    def resolve_coulomb_tensor(self, logger: BoundLogger) -> Optional[pint.Quantity]:
+        """
+        Resolves the `coulomb_tensor` for the orbitals in `orbitals_ref`. If `slater_integrals` are
+        defined, the full tensor is built from the cached angular coefficients of the shell. Otherwise,
+        the Kanamori parametrization from `u_interaction`, `u_interorbital_interaction` and
+        `j_hunds_coupling` is used.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[pint.Quantity]): The resolved `coulomb_tensor`.
+        """
+        orbitals_indices = self.resolve_orbitals_indices(logger)
+        if orbitals_indices is None:
+            return None
+        l_number, indices, spins = orbitals_indices
+
+        if self.slater_integrals is not None:
+            slater_integrals = self.slater_integrals.to('joule').magnitude
+            if len(slater_integrals) != l_number + 1:
+                logger.warning(
+                    'The number of `HubbardInteractions.slater_integrals` does not coincide with the shell of `orbitals_ref`.'
+                )
+                return None
+            coefficients = _get_coulomb_angular_coefficients(l_number)
+            shell_tensor = np.einsum('k,kabcd->abcd', slater_integrals, coefficients)
+            tensor = shell_tensor[np.ix_(indices, indices, indices, indices)]
+        elif self.u_interaction is not None and self.j_hunds_coupling is not None:
+            u = self.u_interaction.to('joule').magnitude
+            j = self.j_hunds_coupling.to('joule').magnitude
+            u_prime = (
+                self.u_interorbital_interaction.to('joule').magnitude
+                if self.u_interorbital_interaction is not None
+                else u - 2.0 * j
+            )
+            # Kanamori: U (intraorbital), U' (interorbital), J (exchange and pair hopping)
+            same = indices[:, np.newaxis] == indices[np.newaxis, :]
+            delta = same.astype(np.float64)
+            tensor = (
+                np.einsum('ac,bd->abcd', delta, delta)
+                * np.where(same, u, u_prime)[:, :, np.newaxis, np.newaxis]
+                + j
+                * np.einsum('ad,bc->abcd', delta, delta)
+                * (~same)[:, :, np.newaxis, np.newaxis]
+                + j
+                * np.einsum('ab,cd->abcd', delta, delta)
+                * (~same)[:, np.newaxis, :, np.newaxis]
+            )
+        else:
+            logger.warning(
+                'Could not find `HubbardInteractions.slater_integrals` or the Kanamori parameters to resolve `coulomb_tensor`.'
+            )
+            return None
+
+        # Spin conservation in each creation-annihilation pair for spin-resolved `orbitals_ref`
+        if spins is not None:
+            same_spin = spins[:, np.newaxis] == spins[np.newaxis, :]
+            tensor = tensor * np.einsum('ac,bd->abcd', same_spin, same_spin)
+        return tensor * ureg('joule')
+
+    def resolve_u_matrix(
+        self, coulomb_tensor: pint.Quantity
+    ) -> Optional[pint.Quantity]:
+        """
+        Resolves the density-density `u_matrix` from the `coulomb_tensor` as `U_{m m'} = U_{m m' m m'}`.
+
+        Args:
+            coulomb_tensor (pint.Quantity): The local Coulomb interaction tensor.
+
+        Returns:
+            (Optional[pint.Quantity]): The resolved `u_matrix`.
+        """
+        if coulomb_tensor is None:
+            return None
+        return np.einsum('abab->ab', coulomb_tensor.to('joule').magnitude) * ureg(
+            'joule'
+        )
+
+    def compress_coulomb_tensor(
+        self, coulomb_tensor: pint.Quantity, logger: BoundLogger
+    ) -> Tuple[np.ndarray, pint.Quantity, str]:
+        """
+        Compresses the `coulomb_tensor` by keeping only one element per set of indices related by
+        the permutational symmetries in `_COULOMB_TENSOR_PERMUTATIONS` and dropping the elements
+        below `coulomb_tensor_threshold`. If the tensor does not fulfill these symmetries, only the
+        elements below the threshold are dropped. The symmetries are checked, and the noise dropped,
+        with the tolerance `_COULOMB_TENSOR_TOLERANCE` relative to the largest element.
+
+        Args:
+            coulomb_tensor (pint.Quantity): The dense local Coulomb interaction tensor.
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Tuple[np.ndarray, pint.Quantity, str]): The stored indices, values and the compression scheme.
+        """
+        values = np.asarray(coulomb_tensor.to('joule').magnitude)
+        n_orbitals = len(values)
+        indices = np.indices(values.shape).reshape(4, -1).T
+        flat_values = values.reshape(-1)
+
+        # The representative of each element is the smallest flat index among its permutations
+        permuted_flat_indices = np.ravel_multi_index(
+            indices[:, _COULOMB_TENSOR_PERMUTATIONS].transpose(2, 0, 1),
+            (n_orbitals,) * 4,
+        )
+        representatives = permuted_flat_indices.min(axis=1)
+        tolerance = _COULOMB_TENSOR_TOLERANCE * np.abs(flat_values).max(initial=0.0)
+        if np.allclose(
+            flat_values, flat_values[representatives], rtol=0, atol=tolerance
+        ):
+            compression = 'permutational'
+            mask = representatives == np.arange(len(flat_values))
+        else:
+            logger.info(
+                'The `coulomb_tensor` does not fulfill the permutational symmetries of a real tensor; it is stored as sparse.'
+            )
+            compression = 'sparse'
+            mask = np.ones(len(flat_values), dtype=bool)
+
+        threshold = (
+            max(self.coulomb_tensor_threshold.to('joule').magnitude, tolerance)
+            if self.coulomb_tensor_threshold is not None
+            else tolerance
+        )
+        mask &= np.abs(flat_values) > threshold
+        return (
+            indices[mask].astype(np.int16),
+            flat_values[mask] * ureg('joule'),
+            compression,
+        )
+
+    def expand_coulomb_tensor(self, logger: BoundLogger) -> Optional[pint.Quantity]:
+        """
+        Expands the compressed `coulomb_tensor_indices` and `coulomb_tensor_values` back into the
+        dense `coulomb_tensor`. This is only done on request, the dense tensor is not stored.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[pint.Quantity]): The dense local Coulomb interaction tensor.
+        """
+        if self.coulomb_tensor is not None:
+            return self.coulomb_tensor
+        if (
+            self.coulomb_tensor_indices is None
+            or self.coulomb_tensor_values is None
+            or self.n_orbitals is None
+        ):
+            logger.warning(
+                'Could not find the compressed `coulomb_tensor_indices` and `coulomb_tensor_values`.'
+            )
+            return None
+        indices = np.asarray(self.coulomb_tensor_indices, dtype=np.intp)
+        values = self.coulomb_tensor_values.to('joule').magnitude
+        coulomb_tensor = np.zeros((self.n_orbitals,) * 4)
+        permutations = (
+            _COULOMB_TENSOR_PERMUTATIONS
+            if self.coulomb_tensor_compression == 'permutational'
+            else _COULOMB_TENSOR_PERMUTATIONS[:1]
+        )
+        for permutation in permutations:
+            coulomb_tensor[tuple(indices[:, permutation].T)] = values
+        return coulomb_tensor * ureg('joule')
+
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
 
@@ -536,6 +1117,8 @@ class HubbardInteractions(ArchiveSection):
             self.u_interaction is None
             and self.u_interorbital_interaction is None
             and self.j_hunds_coupling is None
+            and self.slater_integrals is not None
+            and len(self.slater_integrals) == 3
         ):
             (
                 self.u_interaction,
@@ -547,9 +1130,45 @@ class HubbardInteractions(ArchiveSection):
         if self.u_effective is None:
             self.u_effective = self.resolve_u_effective(logger)
 
-        # Check if length of `orbitals_ref` is the same as the length of `umn`:
+        # Build the orbital-resolved `coulomb_tensor` and its density-density `u_matrix` only for the
+        # `orbitals_ref` with Slater integrals or Kanamori parameters (plain DFT+U `u_interaction` is kept as is)
+        coulomb_tensor = self.coulomb_tensor
+        if (
+            coulomb_tensor is None
+            and self.coulomb_tensor_values is None
+            and self.orbitals_ref
+            and (
+                self.slater_integrals is not None
+                or (
+                    self.u_interaction is not None and self.j_hunds_coupling is not None
+                )
+            )
+        ):
+            coulomb_tensor = self.resolve_coulomb_tensor(logger)
+            if coulomb_tensor is not None:
+                self.n_orbitals = len(coulomb_tensor)
+        if self.u_matrix is None and coulomb_tensor is not None:
+            self.u_matrix = self.resolve_u_matrix(coulomb_tensor)
+
+        # Store the `coulomb_tensor` in its compressed representation only
+        if coulomb_tensor is not None and self.coulomb_tensor_values is None:
+            (
+                self.coulomb_tensor_indices,
+                self.coulomb_tensor_values,
+                self.coulomb_tensor_compression,
+            ) = self.compress_coulomb_tensor(coulomb_tensor, logger)
+            self.n_coulomb_tensor_elements = len(self.coulomb_tensor_indices)
+            self.coulomb_tensor = None
+
+        # Check if the number of orbitals in `orbitals_ref` (with shells expanded) is the same as the length of `umn`:
         if self.u_matrix is not None and self.orbitals_ref is not None:
-            if len(self.u_matrix) != len(self.orbitals_ref):
+            orbitals_indices = self.m_cache.get('orbitals_indices')
+            n_orbitals = (
+                len(orbitals_indices[1])
+                if orbitals_indices is not None
+                else len(self.orbitals_ref)
+            )
+            if len(self.u_matrix) != n_orbitals:
                 logger.error(
                     'The length of `HubbardInteractions.u_matrix` does not coincide with length of `HubbardInteractions.orbitals_ref`.'
                 )
@@ -624,5 +1243,9 @@ class AtomsState(ArchiveSection):
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
 
+        # The atoms of an `AtomicCell` are resolved at once by `AtomicCell.resolve_chemical_symbols_and_numbers`
+        if hasattr(self.m_parent, 'resolve_chemical_symbols_and_numbers'):
+            return
+
         # Get chemical_symbol from atomic_number and viceversa
         self.resolve_chemical_symbol_and_number(logger)
@@ -34,13 +34,87 @@
 # limitations under the License.
 #
 
-# import typing
-# from structlog.stdlib import BoundLogger
+import os
 import numpy as np
+import pint
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from scipy import sparse
+from scipy.sparse.linalg import eigsh
+from structlog.stdlib import BoundLogger
+from typing import Any, Iterator, List, Optional, Tuple, Union
 
 from nomad.datamodel.data import ArchiveSection
+from nomad.units import ureg
 from nomad.metainfo import Quantity
 
+# Maximum memory (in bytes) of a chunk of H(k) matrices evaluated at once
+_HAMILTONIAN_CHUNK_BYTES = 2**26
+
+# Number of supercells searched on each side when building the Wigner-Seitz supercell (as in Wannier90)
+_WIGNER_SEITZ_SEARCH_SIZE = 2
+
+# Maximum number of Wigner-Seitz candidates whose distances to the supercell images are evaluated at once
+_WIGNER_SEITZ_CHUNK_SIZE = 2**15
+
+
+@lru_cache(maxsize=4)
+def _get_wigner_seitz_points(
+    grid: Tuple[int, int, int], lattice_vectors: Tuple[float, ...]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the lattice points inside the Wigner-Seitz cell of the supercell defined by `grid` and their degeneracies,
+    as in Wannier90. A point R belongs to the cell if it is at least as close to the origin as to any other
+    supercell lattice point T, and its degeneracy is the number of T at the minimal distance. The distances of the
+    candidates to all the supercell images are computed in chunks of candidates. The result is read-only and only
+    the last few (grid, lattice) are cached.
+
+    Args:
+        grid (Tuple[int, int, int]): The number of k-points along each reciprocal lattice vector.
+        lattice_vectors (Tuple[float, ...]): The flattened (3, 3) lattice vectors, in any length unit.
+
+    Returns:
+        (Tuple[np.ndarray, np.ndarray]): The (n_wigner_seitz_points, 3) points in units of the lattice vectors and
+            their (n_wigner_seitz_points) degeneracies.
+    """
+    grid = np.array(grid)
+    lattice_vectors = np.reshape(lattice_vectors, (3, 3))
+    metric = lattice_vectors @ lattice_vectors.T
+    metric /= np.abs(metric).max()
+
+    # Candidates in the search box and the supercell images, ordered row-major as in Wannier90
+    ranges = [np.arange(-n, n + 1) for n in _WIGNER_SEITZ_SEARCH_SIZE * grid]
+    candidates = np.stack(np.meshgrid(*ranges, indexing='ij'), axis=-1).reshape(-1, 3)
+    search = np.arange(-_WIGNER_SEITZ_SEARCH_SIZE, _WIGNER_SEITZ_SEARCH_SIZE + 1)
+    images = np.stack(np.meshgrid(search, search, search, indexing='ij'), axis=-1)
+    images = images.reshape(-1, 3) * grid
+    image_norms = np.einsum('ti,ij,tj->t', images, metric, images)
+    origin = len(images) // 2
+    tolerance = 1e-8 * max(1.0, np.max(grid) ** 2)
+
+    # The candidates are processed in chunks to bound the memory of the (candidates, images) distances
+    points, degeneracies = [], []
+    for start in range(0, len(candidates), _WIGNER_SEITZ_CHUNK_SIZE):
+        chunk = candidates[start : start + _WIGNER_SEITZ_CHUNK_SIZE]
+        distances = (
+            np.einsum('ci,ij,cj->c', chunk, metric, chunk)[:, np.newaxis]
+            - 2 * chunk @ metric @ images.T
+            + image_norms[np.newaxis, :]
+        )
+        minimum = distances.min(axis=-1)
+        inside = distances[:, origin] <= minimum + tolerance
+        points.append(chunk[inside])
+        degeneracies.append(
+            np.count_nonzero(
+                distances[inside] <= minimum[inside, np.newaxis] + tolerance, axis=-1
+            )
+        )
+    points = np.concatenate(points).astype(np.int32)
+    degeneracies = np.concatenate(degeneracies).astype(np.int32)
+    points.setflags(write=False)
+    degeneracies.setflags(write=False)
+    return points, degeneracies
+
 
 # TODO check this once outputs.py is defined
 class HoppingMatrix(ArchiveSection):
@@ -72,6 +146,27 @@ class HoppingMatrix(ArchiveSection):
         """,
     )
 
+    wigner_seitz_points = Quantity(
+        type=np.int32,
+        shape=['n_wigner_seitz_points', 3],
+        description="""
+        Wigner-Seitz cell vectors (n_x, n_y, n_z) in fractional coordinates, i.e., in units of the
+        lattice vectors.
+        """,
+    )
+
+    blocks = Quantity(
+        type=np.complex128,
+        shape=['n_wigner_seitz_points', 'n_orbitals', 'n_orbitals'],
+        unit='joule',
+        description="""
+        Real space hopping matrix for each Wigner-Seitz grid point stored as complex blocks, so that
+        `blocks[i, orb_1, orb_2]` is the hopping amplitude between orb_1 and orb_2 for the Wigner-Seitz
+        cell vector `wigner_seitz_points[i]`.
+        """,
+    )
+
+    # ! deprecated, use `wigner_seitz_points` and `blocks` instead
     value = Quantity(
         type=np.float64,
         shape=['n_wigner_seitz_points', 'n_orbitals * n_orbitals', 7],
@@ -85,8 +180,722 @@ class HoppingMatrix(ArchiveSection):
         where (n_x, n_y, n_z) define the Wigner-Seitz cell vector in fractional coordinates,
         (orb_1, orb_2) indicates the hopping amplitude between orb_1 and orb_2, and the
         real and imaginary parts of the hopping.
+
+        This legacy format is converted into `wigner_seitz_points` and `blocks` during normalization, and
+        kept as parsed for the existing readers.
+        """,
+    )
+
+    sparse_cutoff = Quantity(
+        type=np.float64,
+        unit='joule',
+        description="""
+        Magnitude cutoff below which the hopping amplitudes are discarded in the sparse storage.
+        """,
+    )
+
+    sparse_truncation_error = Quantity(
+        type=np.float64,
+        unit='joule',
+        description="""
+        Upper bound of the error introduced by `sparse_cutoff` in the eigenvalues of H(k), computed as the sum over
+        the Wigner-Seitz points of the Frobenius norm of the discarded elements divided by the `degeneracy_factors`.
+        """,
+    )
+
+    n_sparse_elements = Quantity(
+        type=np.int32,
+        description="""
+        Number of stored elements in the sparse storage.
+        """,
+    )
+
+    sparse_indptr = Quantity(
+        type=np.int64,
+        shape=['n_wigner_seitz_points', 'n_orbitals + 1'],
+        description="""
+        Row pointers of the compressed sparse row (CSR) blocks for each Wigner-Seitz point. The pointers index
+        `sparse_columns` and `sparse_values` globally, so that the elements of the row `orb_1` of the block `i` are
+        stored in the slice `sparse_indptr[i, orb_1]:sparse_indptr[i, orb_1 + 1]`.
+        """,
+    )
+
+    sparse_columns = Quantity(
+        type=np.int32,
+        shape=['n_sparse_elements'],
+        description="""
+        Column (orb_2) indices of the CSR blocks.
+        """,
+    )
+
+    sparse_values = Quantity(
+        type=np.complex128,
+        shape=['n_sparse_elements'],
+        unit='joule',
+        description="""
+        Hopping amplitudes of the CSR blocks.
         """,
     )
 
+    @staticmethod
+    def from_legacy_value(
+        value: np.ndarray,
+        logger: BoundLogger,
+        dtype: type = np.complex128,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Converts the legacy 7-columns `value` format into the Wigner-Seitz points and the complex blocks.
+        The orbital indices can be 0- or 1-based (e.g., as in Wannier90), the latter being detected when
+        their minimum is 1.
+
+        Args:
+            value (np.ndarray): The legacy (n_wigner_seitz_points, n_orbitals * n_orbitals, 7) array, in
+            the energy units of the resulting blocks.
+            logger (BoundLogger): The logger to log messages.
+            dtype (type, optional): The complex type of the blocks. Defaults to np.complex128.
+
+        Returns:
+            (Optional[Tuple[np.ndarray, np.ndarray]]): The (n_wigner_seitz_points, 3) int array of Wigner-Seitz
+            points and the (n_wigner_seitz_points, n_orbitals, n_orbitals) complex array of blocks.
+        """
+        value = np.asarray(value)
+        if value.ndim != 3 or value.shape[-1] != 7:
+            logger.warning(
+                'The legacy `HoppingMatrix.value` does not have the expected shape (n_wigner_seitz_points, n_orbitals * n_orbitals, 7).'
+            )
+            return None
+        n_ws, n_elements, _ = value.shape
+        n_orbitals = int(round(np.sqrt(n_elements)))
+        if n_orbitals * n_orbitals != n_elements:
+            logger.warning(
+                'The number of elements per Wigner-Seitz point in `HoppingMatrix.value` is not a square number.'
+            )
+            return None
+
+        wigner_seitz_points = np.rint(value[:, 0, :3]).astype(np.int32)
+        orbital_indices = np.rint(value[..., 3:5]).astype(np.int64)
+        if n_elements > 0 and orbital_indices.min() == 1:
+            orbital_indices -= 1
+        if n_elements > 0 and (
+            orbital_indices.min() < 0 or orbital_indices.max() >= n_orbitals
+        ):
+            logger.warning(
+                'The orbital indices in `HoppingMatrix.value` are out of range.'
+            )
+            return None
+
+        blocks = np.zeros((n_ws, n_orbitals, n_orbitals), dtype=dtype)
+        ws_indices = np.broadcast_to(np.arange(n_ws)[:, np.newaxis], (n_ws, n_elements))
+        blocks[ws_indices, orbital_indices[..., 0], orbital_indices[..., 1]] = (
+            value[..., 5] + 1j * value[..., 6]
+        )
+        return wigner_seitz_points, blocks
+
+    @staticmethod
+    def to_legacy_value(
+        wigner_seitz_points: np.ndarray, blocks: np.ndarray, one_based: bool = False
+    ) -> np.ndarray:
+        """
+        Converts the Wigner-Seitz points and the complex blocks into the legacy 7-columns `value` format.
+
+        Args:
+            wigner_seitz_points (np.ndarray): The (n_wigner_seitz_points, 3) int array of Wigner-Seitz points.
+            blocks (np.ndarray): The (n_wigner_seitz_points, n_orbitals, n_orbitals) complex array of blocks.
+            one_based (bool, optional): If True, the orbital indices start at 1. Defaults to False.
+
+        Returns:
+            (np.ndarray): The legacy (n_wigner_seitz_points, n_orbitals * n_orbitals, 7) array.
+        """
+        n_ws, n_orbitals, _ = blocks.shape
+        orb_1, orb_2 = np.divmod(np.arange(n_orbitals * n_orbitals), n_orbitals)
+        value = np.empty((n_ws, n_orbitals * n_orbitals, 7), dtype=np.float64)
+        value[..., :3] = np.asarray(wigner_seitz_points)[:, np.newaxis, :]
+        value[..., 3] = orb_1 + int(one_based)
+        value[..., 4] = orb_2 + int(one_based)
+        flat_blocks = blocks.reshape(n_ws, -1)
+        value[..., 5] = flat_blocks.real
+        value[..., 6] = flat_blocks.imag
+        return value
+
+    def get_block(
+        self, wigner_seitz_point: Tuple[int, int, int]
+    ) -> Optional[np.ndarray]:
+        """
+        Gets a zero-copy view of the hopping block (in joules) for a given Wigner-Seitz cell vector. The map
+        between Wigner-Seitz points and indices is cached in `m_cache['wigner_seitz_indices']`.
+
+        Args:
+            wigner_seitz_point (Tuple[int, int, int]): The Wigner-Seitz cell vector (n_x, n_y, n_z).
+
+        Returns:
+            (Optional[np.ndarray]): The (n_orbitals, n_orbitals) complex block or None if not found.
+        """
+        if self.wigner_seitz_points is None or self.blocks is None:
+            return None
+        indices = self.m_cache.get('wigner_seitz_indices')
+        if indices is None:
+            indices = {
+                tuple(point): i
+                for i, point in enumerate(self.wigner_seitz_points.tolist())
+            }
+            self.m_cache['wigner_seitz_indices'] = indices
+        index = indices.get(tuple(int(n) for n in wigner_seitz_point))
+        if index is None:
+            return None
+        return self.blocks.magnitude[index]
+
+    @staticmethod
+    def resolve_wigner_seitz_points(
+        grid: Any, lattice_vectors: Any, logger: BoundLogger
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Resolves the Wigner-Seitz points and their degeneracy factors from the k-point `grid` (e.g., `KMesh.grid`)
+        and the lattice vectors, as in Wannier90. The points are cached per (grid, lattice).
+
+        Args:
+            grid (Any): The number of k-points along each reciprocal lattice vector (padded with ones to 3 axes).
+            lattice_vectors (Any): The (3, 3) lattice vectors, as a pint quantity or in any length unit.
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[Tuple[np.ndarray, np.ndarray]]): The (n_wigner_seitz_points, 3) Wigner-Seitz points and their
+            (n_wigner_seitz_points) degeneracy factors.
+        """
+        if grid is None or lattice_vectors is None:
+            logger.warning(
+                'Could not resolve the Wigner-Seitz points without the k-point grid and the lattice vectors.'
+            )
+            return None
+        if isinstance(lattice_vectors, pint.Quantity):
+            lattice_vectors = lattice_vectors.to('angstrom').magnitude
+        lattice_vectors = np.asarray(lattice_vectors, dtype=np.float64)
+        grid = np.asarray(grid, dtype=np.int64).ravel()
+        grid = np.pad(grid, (0, 3 - len(grid)), constant_values=1)
+        if lattice_vectors.shape != (3, 3) or np.any(grid < 1):
+            logger.warning(
+                'The k-point grid or the lattice vectors do not have the expected shapes.'
+            )
+            return None
+        if (
+            abs(np.linalg.det(lattice_vectors))
+            < 1e-12 * np.abs(lattice_vectors).max() ** 3
+        ):
+            logger.warning('The lattice vectors are linearly dependent.')
+            return None
+
+        # The scale of the lattice does not change the Wigner-Seitz points
+        lattice_vectors = lattice_vectors / np.abs(lattice_vectors).max()
+        return _get_wigner_seitz_points(
+            tuple(int(n) for n in grid), tuple(np.round(lattice_vectors, 8).ravel())
+        )
+
+    def check_wigner_seitz_points(
+        self, grid: Any, lattice_vectors: Any, logger: BoundLogger
+    ) -> bool:
+        """
+        Checks if the stored `wigner_seitz_points` and `degeneracy_factors` coincide (in any order) with those
+        generated from the k-point `grid` and the lattice vectors.
+
+        Args:
+            grid (Any): The number of k-points along each reciprocal lattice vector.
+            lattice_vectors (Any): The (3, 3) lattice vectors.
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (bool): True if the stored and generated Wigner-Seitz points coincide.
+        """
+        generated = self.resolve_wigner_seitz_points(grid, lattice_vectors, logger)
+        if generated is None or self.wigner_seitz_points is None:
+            return False
+        points, degeneracies = generated
+        if len(points) != len(self.wigner_seitz_points):
+            return False
+        stored_order = np.lexsort(np.asarray(self.wigner_seitz_points).T)
+        order = np.lexsort(points.T)
+        if not np.array_equal(
+            np.asarray(self.wigner_seitz_points)[stored_order], points[order]
+        ):
+            return False
+        if self.degeneracy_factors is None:
+            return True
+        return np.array_equal(
+            np.asarray(self.degeneracy_factors)[stored_order], degeneracies[order]
+        )
+
+    @staticmethod
+    def resolve_k_points(k_points: Any, logger: BoundLogger) -> np.ndarray:
+        """
+        Resolves the k-points in units of the reciprocal lattice vectors as a (n_k_points, 3) float array.
+        The input can be an array or any section with `points` (e.g., `KMesh` or `LinePathSegment`). Implicit
+        meshes are materialized through their `get_points` method. Points with lower dimensionality are padded
+        with zeros.
+
+        Args:
+            k_points (Any): The array of k-points or a section containing them in `points`.
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (np.ndarray): The (n_k_points, 3) array of k-points.
+        """
+        if hasattr(k_points, 'get_points'):
+            k_points = k_points.get_points(logger)
+        elif hasattr(k_points, 'points'):
+            k_points = k_points.points
+        if k_points is None:
+            return np.zeros((0, 3))
+        k_points = np.atleast_2d(np.real(np.asarray(k_points))).astype(np.float64)
+        if k_points.shape[-1] < 3:
+            k_points = np.pad(k_points, ((0, 0), (0, 3 - k_points.shape[-1])))
+        return k_points
+
+    def resolve_weighted_blocks(
+        self, logger: BoundLogger
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Resolves the Wigner-Seitz points and the hopping blocks (in joules) divided by the `degeneracy_factors`,
+        converting the legacy `value` if the compact storage is not populated. The result is cached in
+        `m_cache['weighted_blocks']`.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[Tuple[np.ndarray, np.ndarray]]): The (n_wigner_seitz_points, 3) Wigner-Seitz points and the
+            (n_wigner_seitz_points, n_orbitals, n_orbitals) weighted blocks.
+        """
+        cached = self.m_cache.get('weighted_blocks')
+        if cached is not None:
+            return cached
+
+        if self.blocks is not None and self.wigner_seitz_points is not None:
+            wigner_seitz_points = self.wigner_seitz_points
+            blocks = self.blocks.to('joule').magnitude
+        elif self.value is not None:
+            compact = self.from_legacy_value(self.value.to('joule').magnitude, logger)
+            if compact is None:
+                return None
+            wigner_seitz_points, blocks = compact
+        else:
+            logger.warning(
+                'Could not find the hoppings in `HoppingMatrix.blocks` or `HoppingMatrix.value`.'
+            )
+            return None
+
+        if self.degeneracy_factors is not None:
+            if len(self.degeneracy_factors) != len(blocks):
+                logger.warning(
+                    'The length of `HoppingMatrix.degeneracy_factors` does not coincide with the number of Wigner-Seitz points.'
+                )
+                return None
+            blocks = blocks / self.degeneracy_factors[:, np.newaxis, np.newaxis]
+
+        weighted_blocks = (np.asarray(wigner_seitz_points, dtype=np.float64), blocks)
+        self.m_cache['weighted_blocks'] = weighted_blocks
+        return weighted_blocks
+
+    @staticmethod
+    def _interpolate_hamiltonian(
+        k_points: np.ndarray, wigner_seitz_points: np.ndarray, blocks: np.ndarray
+    ) -> np.ndarray:
+        """
+        Fourier-interpolates the weighted `blocks` into H(k) for a chunk of `k_points` with a single matrix product.
+        """
+        n_ws, n_orbitals, _ = blocks.shape
+        phases = np.exp(2j * np.pi * (k_points @ wigner_seitz_points.T))
+        return (phases @ blocks.reshape(n_ws, -1)).reshape(-1, n_orbitals, n_orbitals)
+
+    def iter_hamiltonian(
+        self,
+        k_points: Any,
+        logger: BoundLogger,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Tuple[slice, np.ndarray]]:
+        """
+        Iterates over chunks of the Fourier-interpolated Hamiltonian:
+
+            H(k) = sum_R exp(2 pi i k.R) H(R) / deg(R)
+
+        Each chunk is evaluated with a single matrix product, and its size is bounded so that the chunk of
+        H(k) matrices does not exceed `_HAMILTONIAN_CHUNK_BYTES`.
+
+        Args:
+            k_points (Any): The k-points in units of the reciprocal lattice vectors, or a section containing them in `points`.
+            logger (BoundLogger): The logger to log messages.
+            chunk_size (Optional[int], optional): The number of k-points per chunk. Defaults to None (resolved from the memory bound).
+
+        Yields:
+            (Tuple[slice, np.ndarray]): The slice of the k-points in the chunk and the (n_chunk, n_orbitals, n_orbitals)
+            H(k) matrices in joules.
+        """
+        weighted_blocks = self.resolve_weighted_blocks(logger)
+        if weighted_blocks is None:
+            return
+        n_ws, n_orbitals, _ = weighted_blocks[1].shape
+
+        k_points = self.resolve_k_points(k_points, logger)
+        if chunk_size is None:
+            chunk_size = max(
+                1, _HAMILTONIAN_CHUNK_BYTES // (16 * max(n_orbitals**2, n_ws))
+            )
+        for start in range(0, len(k_points), chunk_size):
+            chunk = slice(start, min(start + chunk_size, len(k_points)))
+            yield (
+                chunk,
+                self._interpolate_hamiltonian(k_points[chunk], *weighted_blocks),
+            )
+
+    def compute_hamiltonian(
+        self,
+        k_points: Any,
+        logger: BoundLogger,
+        chunk_size: Optional[int] = None,
+    ) -> Optional[pint.Quantity]:
+        """
+        Computes the Fourier-interpolated Hamiltonian H(k) for an array of k-points. See `iter_hamiltonian`.
+
+        Args:
+            k_points (Any): The k-points in units of the reciprocal lattice vectors, or a section containing them in `points`.
+            logger (BoundLogger): The logger to log messages.
+            chunk_size (Optional[int], optional): The number of k-points per chunk. Defaults to None.
+
+        Returns:
+            (Optional[pint.Quantity]): The (n_k_points, n_orbitals, n_orbitals) H(k) matrices.
+        """
+        chunks = list(self.iter_hamiltonian(k_points, logger, chunk_size))
+        if not chunks:
+            return None
+        return np.concatenate([hamiltonian for _, hamiltonian in chunks]) * ureg.joule
+
+    def compute_bands(
+        self,
+        k_points: Any,
+        logger: BoundLogger,
+        eigenvectors: bool = False,
+        chunk_size: Optional[int] = None,
+        n_threads: Optional[int] = None,
+    ) -> Optional[Union[pint.Quantity, Tuple[pint.Quantity, np.ndarray]]]:
+        """
+        Computes the band energies (and optionally the eigenvectors) of the TB model for an array of k-points. The
+        chunks of H(k) are built and diagonalized in a thread pool, as the numpy linear algebra releases the GIL.
+
+        Args:
+            k_points (Any): The k-points in units of the reciprocal lattice vectors, or a section containing them in `points`.
+            logger (BoundLogger): The logger to log messages.
+            eigenvectors (bool, optional): If True, the eigenvectors are also returned. Defaults to False.
+            chunk_size (Optional[int], optional): The number of k-points per chunk. Defaults to None.
+            n_threads (Optional[int], optional): The number of threads. Defaults to None (number of CPUs).
+
+        Returns:
+            (Optional[Union[pint.Quantity, Tuple[pint.Quantity, np.ndarray]]]): The (n_k_points, n_orbitals) band
+            energies in ascending order and, if `eigenvectors` is True, the (n_k_points, n_orbitals, n_orbitals)
+            eigenvectors stored in columns.
+        """
+        k_points = self.resolve_k_points(k_points, logger)
+        weighted_blocks = self.resolve_weighted_blocks(logger)
+        if weighted_blocks is None:
+            return None
+        n_ws, n_orbitals, _ = weighted_blocks[1].shape
+
+        energies = np.empty((len(k_points), n_orbitals), dtype=np.float64)
+        vectors = (
+            np.empty((len(k_points), n_orbitals, n_orbitals), dtype=np.complex128)
+            if eigenvectors
+            else None
+        )
+
+        def _solve(chunk: slice) -> None:
+            hamiltonian = self._interpolate_hamiltonian(
+                k_points[chunk], *weighted_blocks
+            )
+            if eigenvectors:
+                energies[chunk], vectors[chunk] = np.linalg.eigh(hamiltonian)
+            else:
+                energies[chunk] = np.linalg.eigvalsh(hamiltonian)
+
+        # chunks smaller than the memory bound balance the load among the threads
+        n_workers = n_threads or os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(
+                1,
+                min(
+                    _HAMILTONIAN_CHUNK_BYTES // (16 * max(n_orbitals**2, n_ws)),
+                    -(-len(k_points) // n_workers),
+                ),
+            )
+        chunks = [
+            slice(start, min(start + chunk_size, len(k_points)))
+            for start in range(0, len(k_points), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(_solve, chunks))
+
+        if eigenvectors:
+            return energies * ureg.joule, vectors
+        return energies * ureg.joule
+
+    def set_sparse_blocks(
+        self,
+        wigner_seitz_points: np.ndarray,
+        sparse_blocks: List[Any],
+        cutoff: float,
+        logger: BoundLogger,
+    ) -> None:
+        """
+        Stores the hoppings as CSR blocks, discarding the amplitudes with magnitude below `cutoff`. The blocks can be
+        dense arrays or scipy sparse matrices (in joules), and they are processed one by one to bound the memory. The
+        truncation error is stored in `sparse_truncation_error` and reported to the logger.
+
+        Args:
+            wigner_seitz_points (np.ndarray): The (n_wigner_seitz_points, 3) Wigner-Seitz points.
+            sparse_blocks (List[Any]): The (n_orbitals, n_orbitals) hopping blocks for each Wigner-Seitz point.
+            cutoff (float): The magnitude cutoff in joules.
+            logger (BoundLogger): The logger to log messages.
+        """
+        n_ws = len(sparse_blocks)
+        if len(wigner_seitz_points) != n_ws:
+            logger.error(
+                'The number of Wigner-Seitz points does not coincide with the number of sparse blocks.'
+            )
+            return
+        if self.degeneracy_factors is not None and len(self.degeneracy_factors) != n_ws:
+            logger.error(
+                'The length of `HoppingMatrix.degeneracy_factors` does not coincide with the number of Wigner-Seitz points.'
+            )
+            return
+        degeneracy_factors = (
+            self.degeneracy_factors
+            if self.degeneracy_factors is not None
+            else np.ones(n_ws, dtype=np.int32)
+        )
+
+        indptr, columns, values = [], [], []
+        offset = 0
+        truncation_error = 0.0
+        max_discarded = 0.0
+        for block, degeneracy in zip(sparse_blocks, degeneracy_factors):
+            block = sparse.csr_matrix(block, dtype=np.complex128)
+            block.sum_duplicates()
+            magnitudes = np.abs(block.data)
+            discarded = magnitudes < cutoff
+            if discarded.any():
+                truncation_error += (
+                    np.sqrt(np.sum(magnitudes[discarded] ** 2)) / degeneracy
+                )
+                max_discarded = max(max_discarded, magnitudes[discarded].max())
+                block.data[discarded] = 0
+                block.eliminate_zeros()
+            indptr.append(block.indptr + offset)
+            columns.append(block.indices.astype(np.int32))
+            values.append(block.data)
+            offset += block.nnz
+
+        self.n_wigner_seitz_points = n_ws
+        self.n_orbitals = sparse_blocks[0].shape[0] if n_ws > 0 else 0
+        self.wigner_seitz_points = wigner_seitz_points
+        self.sparse_cutoff = cutoff * ureg.joule
+        self.sparse_truncation_error = truncation_error * ureg.joule
+        self.n_sparse_elements = offset
+        self.sparse_indptr = np.array(indptr, dtype=np.int64)
+        self.sparse_columns = (
+            np.concatenate(columns) if columns else np.zeros(0, dtype=np.int32)
+        )
+        self.sparse_values = (
+            np.concatenate(values) if values else np.zeros(0, dtype=np.complex128)
+        ) * ureg.joule
+        self.m_cache.pop('sparse_pattern', None)
+        logger.info(
+            'Stored `HoppingMatrix` as sparse blocks.',
+            n_sparse_elements=offset,
+            density=offset / max(1, n_ws * self.n_orbitals**2),
+            truncation_error=truncation_error,
+            max_discarded_magnitude=max_discarded,
+        )
+
+    def compress_sparse(
+        self, cutoff: float, logger: BoundLogger, drop_dense: bool = True
+    ) -> None:
+        """
+        Converts the dense `blocks` (or the legacy `value`) into the sparse storage. See `set_sparse_blocks`.
+        The legacy `value` is never removed.
+
+        Args:
+            cutoff (float): The magnitude cutoff in joules.
+            logger (BoundLogger): The logger to log messages.
+            drop_dense (bool, optional): If True, the dense `blocks` are removed after the conversion. Defaults to True.
+        """
+        if self.blocks is not None and self.wigner_seitz_points is not None:
+            wigner_seitz_points = self.wigner_seitz_points
+            blocks = self.blocks.to('joule').magnitude
+        elif self.value is not None:
+            compact = self.from_legacy_value(self.value.to('joule').magnitude, logger)
+            if compact is None:
+                return
+            wigner_seitz_points, blocks = compact
+        else:
+            logger.warning(
+                'Could not find the dense hoppings in `HoppingMatrix.blocks` or `HoppingMatrix.value`.'
+            )
+            return
+        self.set_sparse_blocks(wigner_seitz_points, blocks, cutoff, logger)
+        if drop_dense:
+            self.blocks = None
+
+    def get_sparse_blocks(self) -> Optional[List[sparse.csr_matrix]]:
+        """
+        Gets the CSR hopping blocks (in joules) for each Wigner-Seitz point. The `data` and `indices` of the blocks
+        are zero-copy views of `sparse_values` and `sparse_columns`.
+
+        Returns:
+            (Optional[List[sparse.csr_matrix]]): The CSR blocks or None if the sparse storage is not populated.
+        """
+        if self.sparse_indptr is None or self.sparse_values is None:
+            return None
+        values = self.sparse_values.to('joule').magnitude
+        shape = (self.n_orbitals, self.n_orbitals)
+        blocks = []
+        for indptr in self.sparse_indptr:
+            start, end = indptr[0], indptr[-1]
+            blocks.append(
+                sparse.csr_matrix(
+                    (values[start:end], self.sparse_columns[start:end], indptr - start),
+                    shape=shape,
+                    copy=False,
+                )
+            )
+        return blocks
+
+    def resolve_sparse_pattern(self, logger: BoundLogger) -> Optional[dict]:
+        """
+        Resolves the union sparsity pattern of all the CSR blocks, used to assemble H(k) by scattering the phase-weighted
+        values. The pattern is cached in `m_cache['sparse_pattern']`.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[dict]): The pattern with the CSR `indptr` and `columns` of H(k), the map `inverse` of each stored
+            element into the pattern, the Wigner-Seitz index of each stored element, and the weighted `values`.
+        """
+        pattern = self.m_cache.get('sparse_pattern')
+        if pattern is not None:
+            return pattern
+        if self.sparse_indptr is None or self.sparse_values is None:
+            logger.warning('Could not find the sparse storage of `HoppingMatrix`.')
+            return None
+
+        n_orbitals = self.n_orbitals
+        indptr = self.sparse_indptr
+        row_lengths = np.diff(indptr, axis=1)
+        rows = np.repeat(
+            np.tile(np.arange(n_orbitals), len(indptr)), row_lengths.ravel()
+        )
+        ws_indices = np.repeat(np.arange(len(indptr)), row_lengths.sum(axis=1))
+        keys = rows.astype(np.int64) * n_orbitals + self.sparse_columns
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        unique_rows, unique_columns = np.divmod(unique_keys, n_orbitals)
+
+        values = self.sparse_values.to('joule').magnitude
+        if self.degeneracy_factors is not None:
+            values = values / self.degeneracy_factors[ws_indices]
+        pattern = {
+            'indptr': np.searchsorted(unique_rows, np.arange(n_orbitals + 1)),
+            'columns': unique_columns.astype(np.int32),
+            'inverse': inverse,
+            'ws_indices': ws_indices,
+            'values': values,
+        }
+        self.m_cache['sparse_pattern'] = pattern
+        return pattern
+
+    def compute_sparse_hamiltonian(
+        self, k_point: np.ndarray, logger: BoundLogger
+    ) -> Optional[sparse.csr_matrix]:
+        """
+        Assembles the sparse H(k) (in joules) for a single k-point by scattering the phase-weighted CSR values into
+        the union sparsity pattern.
+
+        Args:
+            k_point (np.ndarray): The k-point in units of the reciprocal lattice vectors.
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[sparse.csr_matrix]): The (n_orbitals, n_orbitals) sparse H(k).
+        """
+        pattern = self.resolve_sparse_pattern(logger)
+        if pattern is None:
+            return None
+        k_point = self.resolve_k_points(k_point, logger)[0]
+        phases = np.exp(2j * np.pi * (self.wigner_seitz_points @ k_point))
+        weighted = pattern['values'] * phases[pattern['ws_indices']]
+        n_unique = len(pattern['columns'])
+        data = np.bincount(
+            pattern['inverse'], weights=weighted.real, minlength=n_unique
+        ) + 1j * np.bincount(
+            pattern['inverse'], weights=weighted.imag, minlength=n_unique
+        )
+        return sparse.csr_matrix(
+            (data, pattern['columns'], pattern['indptr']),
+            shape=(self.n_orbitals, self.n_orbitals),
+        )
+
+    def compute_sparse_bands(
+        self,
+        k_points: Any,
+        logger: BoundLogger,
+        n_bands: int = 6,
+        sigma: Optional[float] = None,
+    ) -> Optional[pint.Quantity]:
+        """
+        Computes a window of `n_bands` band energies with the iterative Lanczos solver (ARPACK) on the sparse H(k).
+        If `sigma` is given, the bands closest to this energy are found using shift-invert mode, otherwise the lowest
+        bands are returned.
+
+        Args:
+            k_points (Any): The k-points in units of the reciprocal lattice vectors, or a section containing them in `points`.
+            logger (BoundLogger): The logger to log messages.
+            n_bands (int, optional): The number of bands in the window. Defaults to 6.
+            sigma (Optional[float], optional): The energy (in joules) at the center of the window. Defaults to None.
+
+        Returns:
+            (Optional[pint.Quantity]): The (n_k_points, n_bands) band energies in ascending order.
+        """
+        if self.resolve_sparse_pattern(logger) is None:
+            return None
+        if n_bands >= self.n_orbitals:
+            logger.warning(
+                'The number of bands has to be smaller than `HoppingMatrix.n_orbitals` for the sparse eigensolver.'
+            )
+            return None
+
+        k_points = self.resolve_k_points(k_points, logger)
+        energies = np.empty((len(k_points), n_bands), dtype=np.float64)
+        for i, k_point in enumerate(k_points):
+            hamiltonian = self.compute_sparse_hamiltonian(k_point, logger)
+            if sigma is None:
+                values = eigsh(
+                    hamiltonian, k=n_bands, which='SA', return_eigenvectors=False
+                )
+            else:
+                values = eigsh(
+                    hamiltonian, k=n_bands, sigma=sigma, return_eigenvectors=False
+                )
+            energies[i] = np.sort(values)
+        return energies * ureg.joule
+
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
+
+        # Reset the cached lookups, as the hoppings could have changed
+        self.m_cache.pop('weighted_blocks', None)
+        self.m_cache.pop('wigner_seitz_indices', None)
+        self.m_cache.pop('sparse_pattern', None)
+
+        # Convert the legacy `value` into the compact `wigner_seitz_points` and `blocks` (`value` is kept)
+        if self.value is not None and self.blocks is None:
+            compact = self.from_legacy_value(self.value.to('joule').magnitude, logger)
+            if compact is not None:
+                self.wigner_seitz_points, blocks = compact
+                self.blocks = blocks * ureg.joule
+
+        if self.blocks is not None:
+            self.n_wigner_seitz_points, self.n_orbitals, _ = self.blocks.shape
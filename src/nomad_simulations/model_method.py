@@ -17,10 +17,12 @@
 #
 
 import numpy as np
-import re
+import pint
 from structlog.stdlib import BoundLogger
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Mapping, Tuple
 
+from nomad.units import ureg
 from nomad.datamodel.data import ArchiveSection
 from nomad.datamodel.metainfo.annotations import ELNAnnotation
 from nomad.metainfo import (
@@ -33,8 +35,18 @@ from nomad.metainfo import (
 
 from .numerical_settings import NumericalSettings, KMesh
 from .model_system import ModelSystem
-from .atoms_state import OrbitalsState, CoreHole
+from .atoms_state import OrbitalsState, CoreHole, _ORBITALS
+from .common import HoppingMatrix
 from .utils import is_not_representative
+from .utils.libxc_functionals import (
+    LIBXC_FUNCTIONALS,
+    LIBXC_FAMILY_JACOBS_LADDER,
+    JACOBS_LADDER_ORDER,
+    get_libxc_family,
+)
+
+# Sentinel for undefined quantum numbers in the `TB` orbital index map
+_UNDEFINED_QUANTUM_NUMBER = -128
 
 
 class ModelMethod(ArchiveSection):
@@ -261,16 +273,6 @@ class DFT(ModelMethodElectronic):
         a_eln=ELNAnnotation(component='EnumEditQuantity'),
     )
 
-    def __init__(self, m_def: Section = None, m_context: Context = None, **kwargs):
-        super().__init__(m_def, m_context, **kwargs)
-        self._jacobs_ladder_map = {
-            'lda': 'LDA',
-            'gga': 'GGA',
-            'mgg': 'meta-GGA',
-            'hyb_mgg': 'hyper-GGA',
-            'hyb': 'hybrid',
-        }
-
     def resolve_libxc_names(
         self, xc_functionals: List[XCFunctional]
     ) -> Optional[List[str]]:
@@ -291,12 +293,36 @@ class DFT(ModelMethodElectronic):
             ]
         )
 
+    @staticmethod
+    def _strip_libxc_weight(libxc_name: str) -> str:
+        """
+        Strips the weight prefix of a weighted libxc name, e.g., '0.75*GGA_X_PBE' -> 'GGA_X_PBE'.
+        """
+        return libxc_name.rpartition('*')[2].strip()
+
+    def resolve_unknown_libxc_names(self, libxc_names: List[str]) -> List[str]:
+        """
+        Resolves which of the `libxc_names` are not present in the `LIBXC_FUNCTIONALS` registry.
+
+        Args:
+            libxc_names (List[str]): The list of `libxc_names`.
+
+        Returns:
+            (List[str]): The `libxc_names` not found in the registry.
+        """
+        return [
+            name
+            for name in libxc_names
+            if self._strip_libxc_weight(name) not in LIBXC_FUNCTIONALS
+        ]
+
     def resolve_jacobs_ladder(
         self,
         libxc_names: List[str],
     ) -> str:
         """
-        Resolves the `jacobs_ladder` from the `libxc_names`. The mapping (libxc -> NOMAD) is set in `self._jacobs_ladder_map`.
+        Resolves the `jacobs_ladder` from the `libxc_names` using the `LIBXC_FUNCTIONALS` registry. The
+        names which are not in the registry are classified using their libxc family prefix.
 
         Args:
             libxc_names (List[str]): The list of `libxc_names`.
@@ -307,29 +333,27 @@ class DFT(ModelMethodElectronic):
         if libxc_names is None:
             return 'unavailable'
 
-        rung_order = {x: i for i, x in enumerate(self._jacobs_ladder_map.keys())}
-        re_abbrev = re.compile(r'((HYB_)?[A-Z]{3})')
-
-        abbrevs = []
+        rungs = []
         for xc_name in libxc_names:
-            try:
-                abbrev = re_abbrev.match(xc_name).group(1)
-                abbrev = abbrev.lower() if abbrev == 'HYB_MGG' else abbrev[:3].lower()
-                abbrevs.append(abbrev)
-            except AttributeError:
+            xc_name = self._strip_libxc_weight(xc_name)
+            functional = LIBXC_FUNCTIONALS.get(xc_name)
+            if functional is not None:
+                rungs.append(functional.jacobs_ladder)
                 continue
+            family = get_libxc_family(xc_name)
+            if family is not None:
+                rungs.append(LIBXC_FAMILY_JACOBS_LADDER[family])
 
-        try:
-            highest_rung_abbrev = max(abbrevs, key=lambda x: rung_order[x])
-        except KeyError:
+        if not rungs:
             return 'unavailable'
-        return self._jacobs_ladder_map.get(highest_rung_abbrev, 'unavailable')
+        return max(rungs, key=JACOBS_LADDER_ORDER.get)
 
     def resolve_exact_exchange_mixing_factor(
         self, xc_functionals: List[XCFunctional], libxc_names: List[str]
     ) -> Optional[float]:
         """
-        Resolves the `exact_exchange_mixing_factor` from the `xc_functionals` and `libxc_names`.
+        Resolves the `exact_exchange_mixing_factor` from the `xc_functionals` and `libxc_names`. For
+        range-separated hybrids, the short-range fraction of exact exchange is returned.
 
         Args:
             xc_functionals (List[XCFunctional]): The list of `XCFunctional` sections.
@@ -338,33 +362,18 @@ class DFT(ModelMethodElectronic):
         Returns:
             (Optional[float]): The resolved `exact_exchange_mixing_factor`.
         """
-
         for functional in xc_functionals:
-            if functional.name == 'hybrid':
-                return functional.parameters.get('exact_exchange_mixing_factor')
-
-        def _scan_patterns(patterns: List[str], xc_name: str) -> bool:
-            return any(x for x in patterns if re.search('_' + x + '$', xc_name))
+            parameters = getattr(functional, 'parameters', None)
+            if functional.name == 'hybrid' and parameters is not None:
+                return parameters.get('exact_exchange_mixing_factor')
 
         for xc_name in libxc_names:
-            if not re.search('_XC?_', xc_name):
-                continue
-            if re.search('_B3LYP[35]?$', xc_name):
-                return 0.2
-            elif _scan_patterns(['HSE', 'PBEH', 'PBE_MOL0', 'PBE_SOL0'], xc_name):
-                return 0.25
-            elif re.search('_M05$', xc_name):
-                return 0.28
-            elif re.search('_PBE0_13$', xc_name):
-                return 1 / 3
-            elif re.search('_PBE38$', xc_name):
-                return 3 / 8
-            elif re.search('_PBE50$', xc_name):
-                return 0.5
-            elif re.search('_M06_2X$', xc_name):
-                return 0.54
-            elif _scan_patterns(['M05_2X', 'PBE_2X'], xc_name):
-                return 0.56
+            functional = LIBXC_FUNCTIONALS.get(self._strip_libxc_weight(xc_name))
+            if (
+                functional is not None
+                and functional.exact_exchange_mixing_factor is not None
+            ):
+                return functional.exact_exchange_mixing_factor
         return None
 
     def normalize(self, archive, logger) -> None:
@@ -372,6 +381,13 @@ class DFT(ModelMethodElectronic):
 
         libxc_names = self.resolve_libxc_names(self.xc_functionals)
         if libxc_names is not None:
+            unknown_libxc_names = self.resolve_unknown_libxc_names(libxc_names)
+            if unknown_libxc_names:
+                logger.warning(
+                    'Could not find some `libxc_names` in the libxc functionals registry.',
+                    libxc_names=unknown_libxc_names,
+                )
+
             # Resolves the `jacobs_ladder` from `libxc` mapping
             jacobs_ladder = self.resolve_jacobs_ladder(libxc_names)
             self.jacobs_ladder = (
@@ -465,14 +481,25 @@ class TB(ModelMethodElectronic):
             else None
         )
 
-    def resolve_orbital_references(
+    def resolve_orbital_index_map(
         self,
         model_systems: List[ModelSystem],
         logger: BoundLogger,
         model_index: int = -1,
-    ) -> Optional[List[OrbitalsState]]:
+    ) -> Optional[Dict[str, Any]]:
         """
-        Resolves the references to the `OrbitalsState` sections from the child `ModelSystem` section.
+        Resolves in one pass the map between the orbitals of the `TB` model and the atoms in the `AtomicCell`
+        from the child `ModelSystem` sections of type 'active_atom'. The quantum numbers of the orbitals are first
+        resolved from their symbols with `OrbitalsState.resolve_in_batch`, as the `OrbitalsState` sections may not be
+        normalized yet. The map is stored in `m_cache['orbital_index_map']` only if the `l_quantum_number` of all
+        the orbitals is resolved, and contains:
+            - 'orbitals_ref': the flattened list of `OrbitalsState` sections.
+            - 'orbital_atom_indices': (n_orbitals,) int array with the index of the atom in `AtomicCell` for each orbital.
+            - 'orbital_quantum_numbers': (n_orbitals, 3) int array with `l_quantum_number`, `ml_quantum_number`, and
+            `2 * ms_quantum_number` for each orbital (`-128` if not defined, e.g., `ml` for a whole shell).
+            - 'atom_indices': (n_active_atoms,) int array with the index of each active atom in `AtomicCell`.
+            - 'atom_orbital_offsets': (n_active_atoms + 1,) int array such that the orbitals of the active atom `i`
+            are in the slice `atom_orbital_offsets[i]:atom_orbital_offsets[i + 1]`.
 
         Args:
             model_systems (List[ModelSystem]): The list of `ModelSystem` sections.
@@ -480,7 +507,7 @@ class TB(ModelMethodElectronic):
             model_index (int, optional): The `ModelSystem` section index from which resolve the references. Defaults to -1.
 
         Returns:
-            Optional[List[OrbitalsState]]: The resolved references to the `OrbitalsState` sections.
+            (Optional[Dict[str, Any]]): The resolved orbital index map.
         """
         model_system = model_systems[model_index]
 
@@ -489,31 +516,125 @@ class TB(ModelMethodElectronic):
             return None
 
         # If `AtomicCell` is not found, the normalization will not run
-        atomic_cell = model_system.cell[0]
-        if atomic_cell is None:
+        if not model_system.cell:
             logger.warning('`AtomicCell` section was not found.')
             return None
+        atoms_state = model_system.cell[0].atoms_state
 
         # If there is no child `ModelSystem`, the normalization will not run
-        atoms_state = atomic_cell.atoms_state
         model_system_child = model_system.model_system
         if model_system_child is None:
             logger.warning('No child `ModelSystem` section was found.')
             return None
 
-        # We flatten the `OrbitalsState` sections from the `ModelSystem` section
+        # Only the children of type "active_atom" are considered
+        active_indices = [
+            active_atom.atom_indices
+            for active_atom in model_system_child
+            if active_atom.type == 'active_atom'
+            and active_atom.atom_indices is not None
+        ]
+        atom_indices = (
+            np.concatenate(active_indices).astype(np.int32)
+            if active_indices
+            else np.zeros(0, dtype=np.int32)
+        )
+
+        # We flatten the `OrbitalsState` sections from the active atoms
         orbitals_ref = []
-        for active_atom in model_system_child:
-            # If the child is not an "active_atom", the normalization will not run
-            if active_atom.type != 'active_atom':
-                continue
-            indices = active_atom.atom_indices
-            for index in indices:
-                active_atoms_state = atoms_state[index]
-                orbitals_state = active_atoms_state.orbitals_state
-                for orbital in orbitals_state:
-                    orbitals_ref.append(orbital)
-        return orbitals_ref
+        n_orbitals_per_atom = np.zeros(len(atom_indices), dtype=np.int32)
+        for i, index in enumerate(atom_indices):
+            orbitals_state = atoms_state[index].orbitals_state
+            n_orbitals_per_atom[i] = len(orbitals_state)
+            orbitals_ref.extend(orbitals_state)
+        OrbitalsState.resolve_in_batch(orbitals_ref, logger)
+
+        undefined = _UNDEFINED_QUANTUM_NUMBER
+        quantum_numbers = np.array(
+            [
+                (
+                    undefined if orb.l_quantum_number is None else orb.l_quantum_number,
+                    undefined
+                    if orb.ml_quantum_number is None
+                    else orb.ml_quantum_number,
+                    undefined
+                    if orb.ms_quantum_number is None
+                    else round(2 * orb.ms_quantum_number),
+                )
+                for orb in orbitals_ref
+            ],
+            dtype=np.int32,
+        ).reshape(-1, 3)
+
+        orbital_index_map = {
+            'orbitals_ref': orbitals_ref,
+            'orbital_atom_indices': np.repeat(atom_indices, n_orbitals_per_atom),
+            'orbital_quantum_numbers': quantum_numbers,
+            'atom_indices': atom_indices,
+            'atom_orbital_offsets': np.concatenate(
+                ([0], np.cumsum(n_orbitals_per_atom))
+            ).astype(np.int32),
+        }
+        if (quantum_numbers[:, 0] == undefined).any():
+            logger.warning(
+                'Could not resolve the `l_quantum_number` of some `OrbitalsState` of the active atoms.'
+            )
+        else:
+            self.m_cache['orbital_index_map'] = orbital_index_map
+        return orbital_index_map
+
+    def resolve_orbital_references(
+        self,
+        model_systems: List[ModelSystem],
+        logger: BoundLogger,
+        model_index: int = -1,
+    ) -> Optional[List[OrbitalsState]]:
+        """
+        Resolves the references to the `OrbitalsState` sections from the child `ModelSystem` section.
+
+        Args:
+            model_systems (List[ModelSystem]): The list of `ModelSystem` sections.
+            logger (BoundLogger): The logger to log messages.
+            model_index (int, optional): The `ModelSystem` section index from which resolve the references. Defaults to -1.
+
+        Returns:
+            Optional[List[OrbitalsState]]: The resolved references to the `OrbitalsState` sections.
+        """
+        orbital_index_map = self.resolve_orbital_index_map(
+            model_systems, logger, model_index
+        )
+        if orbital_index_map is None:
+            return None
+        return orbital_index_map['orbitals_ref']
+
+    def resolve_orbital_positions(
+        self,
+        model_systems: List[ModelSystem],
+        logger: BoundLogger,
+        model_index: int = -1,
+    ) -> Optional[pint.Quantity]:
+        """
+        Resolves the positions of the atoms for each orbital of the `TB` model, using the cached
+        `m_cache['orbital_index_map']` (or resolving it if not available).
+
+        Args:
+            model_systems (List[ModelSystem]): The list of `ModelSystem` sections.
+            logger (BoundLogger): The logger to log messages.
+            model_index (int, optional): The `ModelSystem` section index from which resolve the positions. Defaults to -1.
+
+        Returns:
+            (Optional[pint.Quantity]): The (n_orbitals, 3) positions of the atoms for each orbital.
+        """
+        orbital_index_map = self.m_cache.get(
+            'orbital_index_map'
+        ) or self.resolve_orbital_index_map(model_systems, logger, model_index)
+        if orbital_index_map is None:
+            return None
+        positions = model_systems[model_index].cell[0].positions
+        if positions is None:
+            logger.warning('Could not find `AtomicCell.positions`.')
+            return None
+        return positions[orbital_index_map['orbital_atom_indices']]
 
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
@@ -614,6 +735,99 @@ class Wannier(TB):
         self.localization_type = self.resolve_localization_type(logger)
 
 
+# Slater-Koster bond names: name -> (l_symbol_1, l_symbol_2, bond component with 0 = sigma, 1 = pi, 2 = delta)
+_SLATER_KOSTER_BONDS: Mapping[str, Tuple[str, str, int]] = MappingProxyType(
+    {
+        'sss': ('s', 's', 0),
+        'sps': ('s', 'p', 0),
+        'pps': ('p', 'p', 0),
+        'ppp': ('p', 'p', 1),
+        'sds': ('s', 'd', 0),
+        'pds': ('p', 'd', 0),
+        'pdp': ('p', 'd', 1),
+        'dds': ('d', 'd', 0),
+        'ddp': ('d', 'd', 1),
+        'ddd': ('d', 'd', 2),
+    }
+)
+# Inverse map for the pairs of `l_quantum_symbol` which define a unique bond name (only sigma bonds exist)
+_SLATER_KOSTER_BOND_NAMES: Mapping[Tuple[str, str], str] = MappingProxyType(
+    {
+        pair: name
+        for name, (l_1, l_2, _) in _SLATER_KOSTER_BONDS.items()
+        if l_1 == 's'
+        for pair in ((l_1, l_2), (l_2, l_1))
+    }
+)
+
+# Real orbitals used in the Slater-Koster tables: (l_quantum_number, ml_quantum_symbol) -> index
+_SLATER_KOSTER_ORBITALS: Mapping[Tuple[int, str], int] = MappingProxyType(
+    {
+        (0, ''): 0,
+        (1, 'x'): 1,
+        (1, 'y'): 2,
+        (1, 'z'): 3,
+        (2, 'xy'): 4,
+        (2, 'yz'): 5,
+        (2, 'xz'): 6,
+        (2, 'x^2-y^2'): 7,
+        (2, 'z^2'): 8,
+    }
+)
+# Channel of each real orbital when the bond is oriented along z: sigma, pi_x, pi_y, delta_(x^2-y^2), and delta_xy
+_SLATER_KOSTER_CHANNELS = np.eye(5)[[0, 1, 2, 0, 4, 2, 1, 3, 0]]
+# Bond component (sigma, pi, delta) of each channel
+_SLATER_KOSTER_COMPONENTS = np.eye(3)[[0, 1, 1, 2, 2]]
+# Orthonormal traceless tensors Q representing the real d orbitals, d(r) ~ r.Q.r
+_D_ORBITAL_TENSORS = np.zeros((5, 3, 3))
+for _i, (_a, _b) in enumerate([(0, 1), (1, 2), (0, 2)]):
+    _D_ORBITAL_TENSORS[_i, _a, _b] = _D_ORBITAL_TENSORS[_i, _b, _a] = 1 / np.sqrt(2)
+_D_ORBITAL_TENSORS[3] = np.diag([1, -1, 0]) / np.sqrt(2)
+_D_ORBITAL_TENSORS[4] = np.diag([-1, -1, 2]) / np.sqrt(6)
+_SLATER_KOSTER_CHANNELS.flags.writeable = False
+_SLATER_KOSTER_COMPONENTS.flags.writeable = False
+_D_ORBITAL_TENSORS.flags.writeable = False
+
+
+def _slater_koster_coefficients(bond_vectors: np.ndarray) -> np.ndarray:
+    """
+    Computes the Slater-Koster angular coefficients for the s, p, and d real orbitals, vectorized over bonds.
+    The orbitals are expanded in a frame with the z axis along each bond, where the two-center integrals only
+    couple orbitals in the same angular channel (see `_SLATER_KOSTER_CHANNELS`). This reproduces the direction-cosine
+    tables in https://doi.org/10.1103/PhysRev.94.1498.
+
+    Args:
+        bond_vectors (np.ndarray): The (n_bonds, 3) non-zero bond vectors.
+
+    Returns:
+        (np.ndarray): The (n_bonds, 9, 9, 3) coefficients `C` such that the matrix element between the real
+        orbitals `i` and `j` (see `_SLATER_KOSTER_ORBITALS`) is `sum_c C[:, i, j, c] * V_c`.
+    """
+    e_z = bond_vectors / np.linalg.norm(bond_vectors, axis=1, keepdims=True)
+    helper = np.where(
+        np.abs(e_z[:, 2:3]) < 0.9, np.array([0.0, 0.0, 1.0]), np.array([1.0, 0.0, 0.0])
+    )
+    e_x = np.cross(helper, e_z)
+    e_x /= np.linalg.norm(e_x, axis=1, keepdims=True)
+    e_y = np.cross(e_z, e_x)
+    rotations = np.stack((e_x, e_y, e_z), axis=2)  # columns are the bond frame axes
+
+    # expansion of the lab real orbitals in the bond frame real orbitals
+    expansion = np.zeros((len(bond_vectors), 9, 9))
+    expansion[:, 0, 0] = 1.0
+    expansion[:, 1:4, 1:4] = rotations
+    expansion[:, 4:, 4:] = np.einsum(
+        'aij,bik,bjl,dkl->bad',
+        _D_ORBITAL_TENSORS,
+        rotations,
+        rotations,
+        _D_ORBITAL_TENSORS,
+        optimize=True,
+    )
+    channels = expansion @ _SLATER_KOSTER_CHANNELS
+    return np.einsum('bik,bjk,kc->bijc', channels, channels, _SLATER_KOSTER_COMPONENTS)
+
+
 class SlaterKosterBond(ArchiveSection):
     """
     A base section used to define the Slater-Koster bond information betwee two orbitals.
@@ -646,38 +860,37 @@ class SlaterKosterBond(ArchiveSection):
         """,
     )
 
-    # TODO add more names and in the table
     name = Quantity(
-        type=MEnum('sss', 'sps', 'sds'),
+        type=MEnum(*_SLATER_KOSTER_BONDS.keys()),
         description="""
         The name of the Slater-Koster bond. The name is composed by the `l_quantum_symbol` of the orbitals
-        and the cell index. Table of possible values:
-
-        | Value   | `orbital_1.l_quantum_symbol` | `orbital_2.l_quantum_symbol` | `bravais_vector` |
-        | ------- | ---------------------------- | ---------------------------- | ------------ |
-        | `'sss'` | 's' | 's' | [0, 0, 0] |
-        | `'sps'` | 's' | 'p' | [0, 0, 0] |
-        | `'sds'` | 's' | 'd' | [0, 0, 0] |
+        and the bond component (s = sigma, p = pi, d = delta). Table of possible values:
+
+        | Value   | `orbital_1.l_quantum_symbol` | `orbital_2.l_quantum_symbol` | Bond component |
+        | ------- | ---------------------------- | ---------------------------- | -------------- |
+        | `'sss'` | 's' | 's' | sigma |
+        | `'sps'` | 's' | 'p' | sigma |
+        | `'pps'` | 'p' | 'p' | sigma |
+        | `'ppp'` | 'p' | 'p' | pi |
+        | `'sds'` | 's' | 'd' | sigma |
+        | `'pds'` | 'p' | 'd' | sigma |
+        | `'pdp'` | 'p' | 'd' | pi |
+        | `'dds'` | 'd' | 'd' | sigma |
+        | `'ddp'` | 'd' | 'd' | pi |
+        | `'ddd'` | 'd' | 'd' | delta |
+
+        The orbitals can also be given in reversed order (e.g., 'p' and 's' for `'sps'`).
         """,
     )
 
-    # ? units
     integral_value = Quantity(
         type=np.float64,
+        unit='joule',
         description="""
         The Slater-Koster bond integral value.
         """,
     )
 
-    def __init__(self, m_def: Section = None, m_context: Context = None, **kwargs):
-        super().__init__(m_def, m_context, **kwargs)
-        # TODO extend this to cover all bond names
-        self._bond_name_map = {
-            'sss': ['s', 's', (0, 0, 0)],
-            'sps': ['s', 'p', (0, 0, 0)],
-            'sds': ['s', 'd', (0, 0, 0)],
-        }
-
     def resolve_bond_name_from_references(
         self,
         orbital_1: OrbitalsState,
@@ -686,30 +899,27 @@ class SlaterKosterBond(ArchiveSection):
         logger: BoundLogger,
     ) -> Optional[str]:
         """
-        Resolves the `name` of the `SlaterKosterBond` from the references to the `OrbitalsState` sections.
+        Resolves the `name` of the `SlaterKosterBond` from the references to the `OrbitalsState` sections. Only
+        the sigma bonds involving s orbitals can be resolved, as for the other pairs of orbitals the bond component
+        is not defined by the references.
 
         Args:
             orbital_1 (OrbitalsState): The first `OrbitalsState` section.
             orbital_2 (OrbitalsState): The second `OrbitalsState` section.
-            bravais_vector (tuple): The bravais vector of the cell.
+            bravais_vector (tuple): The bravais vector of the cell. The bond name does not depend on it.
             logger (BoundLogger): The logger to log messages.
 
         Returns:
             (Optional[str]): The resolved `name` of the `SlaterKosterBond`.
         """
-        bond_name = None
         if orbital_1.l_quantum_symbol is None or orbital_2.l_quantum_symbol is None:
             logger.warning(
                 'The `l_quantum_symbol` of the `OrbitalsState` bonds are not defined.'
             )
             return None
-        value = [orbital_1.l_quantum_symbol, orbital_2.l_quantum_symbol, bravais_vector]
-        # Check if `value` is found in the `self._bond_name_map` and return the key
-        for key, val in self._bond_name_map.items():
-            if val == value:
-                bond_name = key
-                break
-        return bond_name
+        return _SLATER_KOSTER_BOND_NAMES.get(
+            (orbital_1.l_quantum_symbol, orbital_2.l_quantum_symbol)
+        )
 
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
@@ -734,6 +944,198 @@ class SlaterKoster(TB):
 
     overlaps = SubSection(sub_section=SlaterKosterBond.m_def, repeats=True)
 
+    def resolve_hopping_matrix(
+        self,
+        bonds: List[SlaterKosterBond],
+        model_systems: List[ModelSystem],
+        logger: BoundLogger,
+        model_index: int = -1,
+    ) -> Optional[HoppingMatrix]:
+        """
+        Builds the real space `HoppingMatrix` from a list of `SlaterKosterBond` sections (e.g., `bonds` or `overlaps`)
+        in the two-center approximation. The basis is given by the `orbitals_ref` of the `TB` model, and the quantum
+        numbers of the basis and bond orbitals are resolved from their symbols with `OrbitalsState.resolve_in_batch`.
+        Each bond couples all the orbitals of the shells (same atom, `n_quantum_number` and `l_quantum_number`)
+        referenced in `orbital_1` and `orbital_2`, and the matrix elements of all bonds are computed in a single
+        vectorized pass. Each bond has to be defined only once, as its Hermitian partner (at `-bravais_vector`) is
+        added as well. When the orbitals are given in reversed order with respect to `name` (e.g., 'd' and 'p' for
+        `'pds'`), the integral is multiplied by the parity factor `(-1)^(l_1 + l_2)`.
+
+        This method is not called during normalization, as the schema does not store a `HoppingMatrix` under
+        `SlaterKoster`; parsers call it explicitly (e.g., with `bonds` for the hoppings or `overlaps` for the
+        overlap matrix) and store the returned section.
+
+        Args:
+            bonds (List[SlaterKosterBond]): The list of `SlaterKosterBond` sections.
+            model_systems (List[ModelSystem]): The list of `ModelSystem` sections.
+            logger (BoundLogger): The logger to log messages.
+            model_index (int, optional): The `ModelSystem` section index. Defaults to -1.
+
+        Returns:
+            (Optional[HoppingMatrix]): The resolved `HoppingMatrix` section.
+        """
+        orbital_index_map = self.m_cache.get(
+            'orbital_index_map'
+        ) or self.resolve_orbital_index_map(model_systems, logger, model_index)
+        if orbital_index_map is None:
+            return None
+        atomic_cell = model_systems[model_index].cell[0]
+        if atomic_cell.positions is None or atomic_cell.lattice_vectors is None:
+            logger.warning(
+                'Could not find `AtomicCell.positions` or `AtomicCell.lattice_vectors`.'
+            )
+            return None
+        positions = atomic_cell.positions.to('angstrom').magnitude
+        lattice_vectors = atomic_cell.lattice_vectors.to('angstrom').magnitude
+
+        # Shells of the basis: (atom index, n, l) -> basis and table indices, padded with -1
+        orbitals_ref = orbital_index_map['orbitals_ref']
+        shells = {}
+        for i, (orbital, atom_index, (l_number, ml_number, _)) in enumerate(
+            zip(
+                orbitals_ref,
+                orbital_index_map['orbital_atom_indices'],
+                orbital_index_map['orbital_quantum_numbers'].tolist(),
+            )
+        ):
+            ml_number = 0 if l_number == 0 else ml_number
+            table_index = _SLATER_KOSTER_ORBITALS.get(
+                (l_number, _ORBITALS.get(l_number, {}).get(ml_number))
+            )
+            if table_index is None:
+                logger.warning(
+                    'Could not resolve the real s, p, or d orbital of the `TB` basis.',
+                    orbital_index=i,
+                )
+                return None
+            key = (int(atom_index), orbital.n_quantum_number, l_number)
+            shells.setdefault(key, []).append((i, table_index))
+        shell_ids = {key: i for i, key in enumerate(shells)}
+        shell_members = np.full((len(shells) + 1, 5, 2), -1, dtype=np.int64)
+        for key, members in shells.items():
+            shell_members[shell_ids[key], : len(members)] = members
+
+        def _shell_id(orbital: OrbitalsState) -> int:
+            atoms_state = orbital.m_parent
+            key = (
+                atoms_state.m_parent_index,
+                orbital.n_quantum_number,
+                orbital.l_quantum_number,
+            )
+            return shell_ids.get(key, -1)  # -1 points to the empty padding shell
+
+        # Gather the bond data (one hashed lookup per bond)
+        OrbitalsState.resolve_in_batch(
+            [
+                orbital
+                for bond in bonds
+                for orbital in (bond.orbital_1, bond.orbital_2)
+                if orbital is not None
+            ],
+            logger,
+        )
+        n_bonds = len(bonds)
+        shell_1 = np.empty(n_bonds, dtype=np.int64)
+        shell_2 = np.empty(n_bonds, dtype=np.int64)
+        components = np.empty(n_bonds, dtype=np.int64)
+        integrals = np.empty(n_bonds, dtype=np.float64)
+        bravais_vectors = np.empty((n_bonds, 3), dtype=np.int32)
+        atoms = np.empty((n_bonds, 2), dtype=np.int64)
+        for i, bond in enumerate(bonds):
+            bond_info = _SLATER_KOSTER_BONDS.get(bond.name)
+            if (
+                bond_info is None
+                or bond.orbital_1 is None
+                or bond.orbital_2 is None
+                or bond.integral_value is None
+            ):
+                logger.warning(
+                    'Could not resolve the `name`, `orbital_1`, `orbital_2`, or `integral_value` of a `SlaterKosterBond`.',
+                    bond_index=i,
+                )
+                return None
+            # parity of the integral if the orbitals are given in reversed order
+            l_1, l_2, components[i] = bond_info
+            l_number_1 = bond.orbital_1.l_quantum_number
+            l_number_2 = bond.orbital_2.l_quantum_number
+            l_symbols = (_ORBITALS[-1].get(l_number_1), _ORBITALS[-1].get(l_number_2))
+            if l_symbols == (l_1, l_2):
+                parity = 1
+            elif l_symbols == (l_2, l_1):
+                parity = (-1) ** (l_number_1 + l_number_2)
+            else:
+                logger.warning(
+                    'The `l_quantum_number` of the `SlaterKosterBond` orbitals do not match its `name`.',
+                    bond_index=i,
+                )
+                return None
+            integrals[i] = parity * bond.integral_value.to('joule').magnitude
+            shell_1[i] = _shell_id(bond.orbital_1)
+            shell_2[i] = _shell_id(bond.orbital_2)
+            atoms[i] = (
+                bond.orbital_1.m_parent.m_parent_index,
+                bond.orbital_2.m_parent.m_parent_index,
+            )
+            bravais_vectors[i] = bond.bravais_vector
+        if np.any(shell_1 < 0) or np.any(shell_2 < 0):
+            logger.warning(
+                'Some `SlaterKosterBond` orbitals are not part of the `TB` basis and will be ignored.'
+            )
+
+        # Bond vectors and angular coefficients for all bonds at once
+        bond_vectors = (
+            positions[atoms[:, 1]]
+            + bravais_vectors @ lattice_vectors
+            - positions[atoms[:, 0]]
+        )
+        is_zero = np.linalg.norm(bond_vectors, axis=1) < 1e-8
+        if np.any(is_zero):
+            logger.warning(
+                'Some `SlaterKosterBond` have zero length and will be ignored.',
+                bond_indices=np.flatnonzero(is_zero).tolist(),
+            )
+            shell_1[is_zero] = -1
+            bond_vectors[is_zero] = [0.0, 0.0, 1.0]
+        coefficients = _slater_koster_coefficients(bond_vectors)
+        elements = (
+            coefficients[np.arange(n_bonds), :, :, components]
+            * integrals[:, np.newaxis, np.newaxis]
+        )
+
+        # Scatter the (n_bonds, 5, 5) shell blocks into the Wigner-Seitz blocks
+        members_1 = shell_members[shell_1]
+        members_2 = shell_members[shell_2]
+        bond_range = np.arange(n_bonds)[:, np.newaxis, np.newaxis]
+        values = elements[
+            bond_range, members_1[:, :, np.newaxis, 1], members_2[:, np.newaxis, :, 1]
+        ]
+        rows = np.broadcast_to(members_1[:, :, np.newaxis, 0], values.shape)
+        columns = np.broadcast_to(members_2[:, np.newaxis, :, 0], values.shape)
+        valid = (rows >= 0) & (columns >= 0)
+
+        wigner_seitz_points, ws_indices = np.unique(
+            np.concatenate((bravais_vectors, -bravais_vectors)),
+            axis=0,
+            return_inverse=True,
+        )
+        ws_indices = ws_indices.reshape(2, n_bonds)
+        n_orbitals = len(orbitals_ref)
+        blocks = np.zeros(
+            (len(wigner_seitz_points), n_orbitals, n_orbitals), dtype=np.complex128
+        )
+        ws_1 = np.broadcast_to(ws_indices[0][:, np.newaxis, np.newaxis], values.shape)
+        ws_2 = np.broadcast_to(ws_indices[1][:, np.newaxis, np.newaxis], values.shape)
+        np.add.at(blocks, (ws_1[valid], rows[valid], columns[valid]), values[valid])
+        np.add.at(blocks, (ws_2[valid], columns[valid], rows[valid]), values[valid])
+
+        return HoppingMatrix(
+            n_orbitals=n_orbitals,
+            n_wigner_seitz_points=len(wigner_seitz_points),
+            degeneracy_factors=np.ones(len(wigner_seitz_points), dtype=np.int32),
+            wigner_seitz_points=wigner_seitz_points,
+            blocks=blocks * ureg.joule,
+        )
+
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
 
@@ -60,9 +60,13 @@ from nomad.datamodel.data import ArchiveSection
 from nomad.datamodel.metainfo.basesections import Entity, System
 from nomad.datamodel.metainfo.annotations import ELNAnnotation
 
-from .atoms_state import AtomsState
+from .atoms_state import AtomsState, OrbitalsState
 from .utils import get_sibling_section, is_not_representative
 
+# Periodic table lookup array used to resolve the chemical symbols of whole cells at once
+_CHEMICAL_SYMBOLS = np.array(ase.data.chemical_symbols, dtype=object)
+_CHEMICAL_SYMBOLS.setflags(write=False)
+
 
 class GeometricSpace(Entity):
     """
@@ -383,12 +387,89 @@ class AtomicCell(Cell):
 
         return ase_atoms
 
+    def resolve_orbitals_states(self, logger: BoundLogger) -> None:
+        """
+        Resolves the quantum numbers, symbols and degeneracies of all the `OrbitalsState` sections
+        of the `AtomicCell` in a single pass. It is called in `normalize`, and the per-section
+        `OrbitalsState.normalize` is skipped for the orbitals of an `AtomicCell`.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+        """
+        orbitals_states = [
+            orbital
+            for atom_state in self.atoms_state
+            for orbital in atom_state.orbitals_state
+        ]
+        OrbitalsState.resolve_in_batch(orbitals_states, logger)
+
+    def resolve_chemical_symbols_and_numbers(self, logger: BoundLogger) -> None:
+        """
+        Resolves the missing `chemical_symbol` from `atomic_number` (and viceversa) for all the
+        `AtomsState` sections of the `AtomicCell` at once using periodic table lookup arrays. The
+        values which cannot be resolved are reported in a single log message.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+        """
+        if not self.atoms_state:
+            return
+        symbols = np.array(
+            [atom_state.chemical_symbol for atom_state in self.atoms_state],
+            dtype=object,
+        )
+        numbers = np.array(
+            [
+                atom_state.atomic_number if atom_state.atomic_number else -1
+                for atom_state in self.atoms_state
+            ],
+            dtype=np.int64,
+        )
+
+        # Resolve `chemical_symbol` from `atomic_number`
+        missing_symbols = (symbols == None) & (numbers != -1)  # noqa: E711
+        valid_numbers = (numbers > 0) & (numbers < len(_CHEMICAL_SYMBOLS))
+        resolved_symbols = _CHEMICAL_SYMBOLS[np.where(valid_numbers, numbers, 0)]
+        if (invalid := missing_symbols & ~valid_numbers).any():
+            logger.error(
+                'The `AtomsState.atomic_number` is out of range of the periodic table.',
+                atom_indices=np.flatnonzero(invalid).tolist(),
+                atomic_numbers=numbers[invalid].tolist(),
+            )
+
+        # Resolve `atomic_number` from `chemical_symbol`
+        missing_numbers = (symbols != None) & (numbers == -1)  # noqa: E711
+        resolved_numbers = np.array(
+            [
+                ase.data.atomic_numbers.get(symbol, -1) if missing else -1
+                for symbol, missing in zip(symbols, missing_numbers)
+            ],
+            dtype=np.int64,
+        )
+        if (invalid := missing_numbers & (resolved_numbers == -1)).any():
+            logger.error(
+                'The `AtomsState.chemical_symbol` is not recognized in the periodic table.',
+                atom_indices=np.flatnonzero(invalid).tolist(),
+                chemical_symbols=symbols[invalid].tolist(),
+            )
+
+        for index in np.flatnonzero(missing_symbols & valid_numbers):
+            self.atoms_state[index].chemical_symbol = resolved_symbols[index]
+        for index in np.flatnonzero(missing_numbers & (resolved_numbers != -1)):
+            self.atoms_state[index].atomic_number = resolved_numbers[index]
+
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
 
         # Set the name of the section
         self.name = self.m_def.name if self.name is None else self.name
 
+        # Resolve the chemical symbols and atomic numbers of all the atoms at once
+        self.resolve_chemical_symbols_and_numbers(logger)
+
+        # Resolve the quantum numbers and degeneracies of all the orbitals at once
+        self.resolve_orbitals_states(logger)
+
 
 class Symmetry(ArchiveSection):
     """
@@ -491,6 +572,33 @@ class Symmetry(ArchiveSection):
         """,
     )
 
+    n_symmetry_operations = Quantity(
+        type=np.int32,
+        description="""
+        Number of symmetry operations of the space group.
+        """,
+    )
+
+    rotation_matrices = Quantity(
+        type=np.int8,
+        shape=['n_symmetry_operations', 3, 3],
+        description="""
+        Rotational part `W` of each symmetry operation in fractional coordinates of the
+        originally parsed `AtomicCell`. Together with `translation_vectors` (`w`), each operation
+        maps the fractional coordinates `x` into:
+            `x'` = `W` `x` + `w`.
+        """,
+    )
+
+    translation_vectors = Quantity(
+        type=np.float64,
+        shape=['n_symmetry_operations', 3],
+        description="""
+        Translational part `w` of each symmetry operation in fractional coordinates of the
+        originally parsed `AtomicCell`. See `rotation_matrices`.
+        """,
+    )
+
     atomic_cell_ref = Quantity(
         type=AtomicCell,
         description="""
@@ -499,6 +607,38 @@ class Symmetry(ArchiveSection):
         a_eln=ELNAnnotation(component='ReferenceEditQuantity'),
     )
 
+    def apply_symmetry_operations(
+        self, points: np.ndarray, logger: BoundLogger, reciprocal: bool = False
+    ) -> Optional[np.ndarray]:
+        """
+        Applies all the stored symmetry operations at once to an array of points in fractional
+        coordinates. For real space points (e.g., atomic positions), the full operation
+        `W` `x` + `w` is applied. For reciprocal space points (e.g., k-points in units of the
+        reciprocal lattice vectors), only the rotational part is applied as `(W^-1)^T` `k`, so
+        that the i-th transformed points correspond to the i-th symmetry operation.
+
+        Args:
+            points (np.ndarray): The points in fractional coordinates, shape (n_points, 3).
+            logger (BoundLogger): The logger to log messages.
+            reciprocal (bool, optional): If the points are in reciprocal space. Defaults to False.
+
+        Returns:
+            (Optional[np.ndarray]): The transformed points, shape (n_symmetry_operations, n_points, 3).
+        """
+        if self.rotation_matrices is None:
+            logger.warning('Could not find `Symmetry.rotation_matrices`.')
+            return None
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        rotations = np.asarray(self.rotation_matrices, dtype=np.float64)
+        if reciprocal:
+            inverse_rotations = np.rint(np.linalg.inv(rotations))
+            return np.einsum('oji,pj->opi', inverse_rotations, points)
+        if self.translation_vectors is None:
+            logger.warning('Could not find `Symmetry.translation_vectors`.')
+            return None
+        transformed = np.einsum('oij,pj->opi', rotations, points)
+        return transformed + np.asarray(self.translation_vectors)[:, np.newaxis, :]
+
     def resolve_analyzed_atomic_cell(
         self, symmetry_analyzer: SymmetryAnalyzer, cell_type: str, logger: BoundLogger
     ) -> Optional[AtomicCell]:
@@ -588,6 +728,15 @@ class Symmetry(ArchiveSection):
         symmetry[
             'transformation_matrix'
         ] = symmetry_analyzer._get_spglib_transformation_matrix()
+        # Storing the symmetry operations to avoid re-running spglib in other normalizers
+        symmetry_operations = symmetry_analyzer.get_symmetry_operations()
+        symmetry['rotation_matrices'] = np.asarray(
+            symmetry_operations.get('rotations'), dtype=np.int8
+        )
+        symmetry['translation_vectors'] = np.asarray(
+            symmetry_operations.get('translations'), dtype=np.float64
+        )
+        symmetry['n_symmetry_operations'] = len(symmetry['rotation_matrices'])
 
         # Populating the originally parsed AtomicCell wyckoff_letters and equivalent_atoms information
         original_wyckoff = symmetry_analyzer.get_wyckoff_letters_original()
@@ -16,11 +16,14 @@
 # limitations under the License.
 #
 
+import itertools
 import numpy as np
 import pint
+from functools import lru_cache
 from structlog.stdlib import BoundLogger
-from typing import Optional, List, Tuple
-from ase.dft.kpoints import monkhorst_pack, get_monkhorst_pack_size_and_offset
+from typing import Optional, List, Tuple, Generator, Dict, Any
+from ase.cell import Cell
+from ase.dft.kpoints import parse_path_string
 
 from nomad.units import ureg
 from nomad.datamodel.data import ArchiveSection
@@ -34,7 +37,159 @@ from nomad.metainfo import (
 )
 
 from .model_system import ModelSystem
-from .utils import is_not_representative
+
+# Maximum number of k-points of the full mesh evaluated at once
+_KMESH_CHUNK_SIZE = 2**16
+
+# Maximum number of (tetrahedron, band, energy) values evaluated at once in the tetrahedron integration
+_TETRAHEDRON_CHUNK_SIZE = 2**22
+
+# Number of points in each of the generated standard line path segments
+_N_LINE_POINTS = 100
+
+# Primitive lattice vectors (as rows, in units of the conventional ones) for each centring of the Pearson symbols
+_CENTRING_MATRICES = {
+    'F': (np.array([[0.0, 0.5, 0.5], [0.5, 0.0, 0.5], [0.5, 0.5, 0.0]]),),
+    'I': (np.array([[-0.5, 0.5, 0.5], [0.5, -0.5, 0.5], [0.5, 0.5, -0.5]]),),
+    'S': (
+        np.array([[0.5, 0.5, 0.0], [-0.5, 0.5, 0.0], [0.0, 0.0, 1.0]]),
+        np.array([[1.0, 0.0, 0.0], [0.0, 0.5, 0.5], [0.0, -0.5, 0.5]]),
+        np.array([[0.5, 0.0, 0.5], [0.0, 1.0, 0.0], [-0.5, 0.0, 0.5]]),
+    ),
+    'R': (np.array([[2, 1, 1], [-1, 1, 1], [-1, -2, 1]]) / 3,),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_quadrature_rule(
+    quadrature: str, spacing: str, n_points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the nodes and integration weights of a quadrature rule for a unit frequency scale, so that
+    `sum(weights * f(nodes))` approximates the integral of f. The rules on [-1, 1] are mapped depending on `spacing`:
+
+        | Spacing         | Mapping                        | Interval    |
+        | --------------- | ------------------------------ | ----------- |
+        | `'Equidistant'` | w = (1 + x) / 2                | [0, 1]      |
+        | `'Logarithmic'` | ln(w) = artanh(x)              | (0, inf)    |
+        | `'Tan'`         | w = tan(pi (1 + x) / 4)        | [0, inf)    |
+
+    'Clenshaw-Curtis' and 'Newton-Cotes' are used in their open forms (Fejér's second rule and the midpoint rule), so
+    that no node falls on the end points of the semi-infinite mappings. 'Gauss-Laguerre' ([0, inf)) and
+    'Gauss-Hermite' ((-inf, inf)) do not depend on `spacing`, and their weights include the inverse of the weight
+    functions. The result is cached and read-only.
+
+    Args:
+        quadrature (str): The quadrature rule, as in `Mesh.quadrature`.
+        spacing (str): The spacing, as in `Mesh.spacing`.
+        n_points (int): The number of nodes.
+
+    Returns:
+        (Tuple[np.ndarray, np.ndarray]): The nodes and weights of the rule.
+    """
+    if quadrature == 'Gauss-Laguerre':
+        nodes, weights = np.polynomial.laguerre.laggauss(n_points)
+        weights = weights * np.exp(nodes)
+    elif quadrature == 'Gauss-Hermite':
+        nodes, weights = np.polynomial.hermite.hermgauss(n_points)
+        weights = weights * np.exp(nodes**2)
+    else:
+        if quadrature == 'Gauss-Legendre':
+            x, weights = np.polynomial.legendre.leggauss(n_points)
+        elif quadrature == 'Clenshaw-Curtis':
+            theta = np.arange(1, n_points + 1) * np.pi / (n_points + 1)
+            odd = 2 * np.arange(1, (n_points + 1) // 2 + 1) - 1
+            x = np.cos(theta)[::-1]
+            weights = (
+                4
+                * np.sin(theta)
+                / (n_points + 1)
+                * (np.sin(np.outer(theta, odd)) / odd).sum(axis=-1)
+            )[::-1]
+        else:
+            x = -1 + (2 * np.arange(n_points) + 1) / n_points
+            weights = np.full(n_points, 2 / n_points)
+        if spacing == 'Logarithmic':
+            nodes = np.sqrt((1 + x) / (1 - x))
+            jacobian = nodes / (1 - x**2)
+        elif spacing == 'Tan':
+            nodes = np.tan(np.pi * (1 + x) / 4)
+            jacobian = np.pi / 4 / np.cos(np.pi * (1 + x) / 4) ** 2
+        else:
+            nodes, jacobian = (1 + x) / 2, np.full(n_points, 0.5)
+        weights = weights * jacobian
+    nodes.setflags(write=False)
+    weights.setflags(write=False)
+    return nodes, weights
+
+
+@lru_cache(maxsize=4)
+def _get_tetrahedron_corners(grid: Tuple[int, int, int], diagonal: int) -> np.ndarray:
+    """
+    Gets the corners of the tetrahedra decomposing a regular mesh, following Blöchl et al., Phys. Rev. B 49, 16223
+    (1994). Each subcell of the mesh is split into 6 tetrahedra sharing one of its main diagonals. The table is
+    read-only and only the last few (grid, diagonal) are cached, as large tables take hundreds of MB; the reduced
+    tetrahedra are cached per section in `KMesh.m_cache['tetrahedra']`.
+
+    Args:
+        grid (Tuple[int, int, int]): The number of points along each axis.
+        diagonal (int): The main diagonal shared by the tetrahedra: 0 for (0, 0, 0) -> (1, 1, 1), and 1, 2, or 3
+            for the diagonals mirrored along the x, y, or z axis respectively.
+
+    Returns:
+        (np.ndarray): The (6 * n_cells, 4) row-major indices of the corners in the full mesh.
+    """
+    steps = np.eye(3, dtype=np.int64)
+    vertices = np.array(
+        [
+            [
+                np.zeros(3, dtype=np.int64),
+                steps[a],
+                steps[a] + steps[b],
+                np.ones(3, dtype=np.int64),
+            ]
+            for a, b, _ in itertools.permutations(range(3))
+        ]
+    )
+    flips = np.eye(4, 3, k=-1, dtype=bool)[diagonal]
+    vertices = np.where(flips, 1 - vertices, vertices)
+    cells = np.stack(np.unravel_index(np.arange(np.prod(grid)), grid), axis=-1)
+    corners = (cells[:, np.newaxis, np.newaxis] + vertices) % np.array(grid)
+    corners = np.ravel_multi_index(np.moveaxis(corners, -1, 0), grid).reshape(-1, 4)
+    corners = corners.astype(np.int32 if np.prod(grid) < 2**31 else np.int64)
+    corners.setflags(write=False)
+    return corners
+
+
+@lru_cache(maxsize=64)
+def _get_bandpath_template(
+    cell_parameters: Tuple[float, ...],
+) -> Tuple[str, Tuple[Tuple[str, Tuple[float, ...]], ...], Tuple[Tuple[str, str], ...]]:
+    """
+    Gets the standard band path of a lattice using ASE. The fractional coordinates of the high-symmetry points only
+    depend on the metric of the lattice, so the template is cached per (rounded) cell parameters and shared by all the
+    entries with the same lattice. The cache is bounded, as relaxed cells rarely share their parameters.
+
+    Args:
+        cell_parameters (Tuple[float, ...]): The cell parameters [a, b, c, alpha, beta, gamma] in angstrom and degrees.
+
+    Returns:
+        (Tuple[str, Tuple, Tuple]): The Pearson symbol of the lattice, the high-symmetry points and their coordinates
+            in units of the reciprocal lattice vectors, and the pairs of labels defining each line path segment.
+    """
+    cell = Cell.new(cell_parameters)
+    bandpath = cell.bandpath(npoints=0)
+    labels = {'G': 'Gamma'}
+    special_points = tuple(
+        (labels.get(label, label), tuple(float(x) for x in point))
+        for label, point in bandpath.special_points.items()
+    )
+    segments = tuple(
+        (labels.get(start, start), labels.get(end, end))
+        for path in parse_path_string(bandpath.path)
+        for start, end in zip(path[:-1], path[1:])
+    )
+    return cell.get_bravais_lattice().pearson_symbol, special_points, segments
 
 
 class NumericalSettings(ArchiveSection):
@@ -147,7 +302,17 @@ class Mesh(NumericalSettings):
         The amount of times the same point reappears. A value larger than 1, typically indicates
         a symmtery operation that was applied to the `Mesh`. This quantity is equivalent to `weights`:
 
-            multiplicities = 1 / weights
+            weights = multiplicities / sum(multiplicities)
+        """,
+    )
+
+    is_implicit = Quantity(
+        type=bool,
+        default=False,
+        description="""
+        If True, the mesh is fully determined by its generator parameters (e.g., `grid` and `offset` in a `KMesh`,
+        or `quadrature`, `spacing` and `n_points` in a `QuasiparticlesFrequencyMesh`). In this case, `points` are not
+        stored and are generated on access with `get_points`.
         """,
     )
 
@@ -155,10 +320,11 @@ class Mesh(NumericalSettings):
         type=np.float64,
         shape=['n_points'],
         description="""
-        Weight of each point. A value smaller than 1, typically indicates a symmtery operation that was
-        applied to the mesh. This quantity is equivalent to `multiplicities`:
+        Weight of each point. The weights are normalized to sum up to 1 and a value larger than
+        `1 / sum(multiplicities)` typically indicates a symmtery operation that was applied to the mesh. This
+        quantity is equivalent to `multiplicities`:
 
-            weights = 1 / multiplicities
+            weights = multiplicities / sum(multiplicities)
         """,
     )
 
@@ -202,7 +368,8 @@ class LinePathSegment(ArchiveSection):
         logger: BoundLogger,
     ) -> Optional[np.ndarray]:
         """
-        Resolves the `points` of the `LinePathSegment` from the `high_symmetry_path` and the `n_line_points`.
+        Resolves the `points` of the `LinePathSegment` from the `high_symmetry_path` and the `n_line_points`. The
+        points are a zero-copy slice of the path buffer generated for all the segments by `KMesh.resolve_line_path`.
 
         Args:
             high_symmetry_path (List[str]): The high-symmetry path of the `LinePathSegment`.
@@ -217,14 +384,16 @@ class LinePathSegment(ArchiveSection):
                 'Could not resolve `LinePathSegment.points` from `LinePathSegment.high_symmetry_path` and `LinePathSegment.n_line_points`.'
             )
             return None
-        if self.m_parent.high_symmetry_points is None:
+        if not hasattr(self.m_parent, 'resolve_line_path'):
             logger.warning(
-                'Could not resolve the parent of `LinePathSegment` to extract `LinePathSegment.m_parent.high_symmetry_points`.'
+                'Could not resolve the parent `KMesh` of `LinePathSegment` to extract the path points.'
             )
             return None
-        start_point = self.m_parent.high_symmetry_points.get(self.high_symmetry_path[0])
-        end_point = self.m_parent.high_symmetry_points.get(self.high_symmetry_path[1])
-        return np.linspace(start_point, end_point, self.n_line_points)
+        line_path = self.m_parent.resolve_line_path(logger)
+        if line_path is None:
+            return None
+        points, _, offsets = line_path
+        return points[offsets[self.m_parent_index] : offsets[self.m_parent_index + 1]]
 
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
@@ -259,6 +428,15 @@ class KMesh(Mesh):
         """,
     )
 
+    points = Quantity(
+        type=np.float64,
+        shape=['n_points', 'dimensionality'],
+        description="""
+        List of all the (symmetry-reduced) points in the mesh in units of the `reciprocal_lattice_vectors`. Only
+        stored for irregular meshes, see `is_implicit`. For implicit meshes, `all_points` is not stored either.
+        """,
+    )
+
     all_points = Quantity(
         type=np.float64,
         shape=['*', 3],
@@ -268,6 +446,48 @@ class KMesh(Mesh):
         """,
     )
 
+    irreducible_indices = Quantity(
+        type=np.int32,
+        shape=['*'],
+        description="""
+        Index map from the full mesh to the (symmetry-reduced) `points`. The full mesh is ordered row-major over
+        the `grid` indices, i.e., the point with indices [i, j, k] is at position (i * ny + j) * nz + k, and
+        `points[irreducible_indices[p]]` is the point equivalent by symmetry to the full mesh point p.
+        """,
+    )
+
+    rotation_indices = Quantity(
+        type=np.int8,
+        shape=['*'],
+        description="""
+        Index of the rotation in `rotation_matrices` generating each point of the full mesh (ordered as in
+        `irreducible_indices`) from its irreducible partner in `points`:
+
+            full_points[p] = points[irreducible_indices[p]] @ rotation_matrices[rotation_indices[p]]
+
+        modulo reciprocal lattice vectors.
+        """,
+    )
+
+    rotation_matrices = Quantity(
+        type=np.int8,
+        shape=['*', 3, 3],
+        description="""
+        Rotation matrices acting on the k-points in units of the `reciprocal_lattice_vectors` (as row vectors) used
+        to reduce the mesh. These are the symmetry operations of the `ModelSystem` compatible with the `grid`, extended
+        by time reversal.
+        """,
+    )
+
+    is_time_reversed = Quantity(
+        type=bool,
+        shape=['*'],
+        description="""
+        Flags of the `rotation_matrices` which are only a symmetry when combined with time reversal, i.e., the complex
+        conjugate of the irreducible quantities has to be taken when unfolding them to the full mesh.
+        """,
+    )
+
     high_symmetry_points = Quantity(
         type=JSON,
         description="""
@@ -291,46 +511,1004 @@ class KMesh(Mesh):
         """,
     )
 
-    line_path_segments = SubSection(sub_section=LinePathSegment.m_def, repeats=True)
+    line_path_distances = Quantity(
+        type=np.float64,
+        shape=['*'],
+        unit='1/meter',
+        description="""
+        Cumulative Cartesian distance along the points of all the concatenated `line_path_segments`. The
+        distance does not increase between the last point of a segment and the first point of the next one.
+        """,
+    )
 
-    # TODO add extraction of `high_symmetry_points` using BandStructureNormalizer idea (left for later when defining outputs.py)
+    is_line_path = Quantity(
+        type=bool,
+        default=False,
+        description="""
+        If the `KMesh` samples a band structure line path instead of a `grid` or explicit `points`. If no
+        `line_path_segments` are defined, the standard path of the Bravais lattice is generated.
+        """,
+    )
+
+    line_path_segments = SubSection(sub_section=LinePathSegment.m_def, repeats=True)
 
     def __init__(self, m_def: Section = None, m_context: Context = None, **kwargs):
         super().__init__(m_def, m_context, **kwargs)
         # Set the name of the section
         self.name = self.m_def.name
 
-    def resolve_points_and_offset(
-        self, logger: BoundLogger
-    ) -> Tuple[Optional[List[np.ndarray]], Optional[np.ndarray]]:
+    def resolve_offset(self, logger: BoundLogger) -> Optional[np.ndarray]:
         """
-        Resolves the `points` and `offset` of the `KMesh` from the `grid` and the `center`.
+        Resolves the `offset` of the `KMesh` from the `center` and the `grid`. The offset is given in units of
+        the `reciprocal_lattice_vectors`, i.e., half a grid step along the even axes of a `'Monkhorst-Pack'` mesh.
 
         Args:
             logger (BoundLogger): The logger to log messages.
 
         Returns:
-            (Optional[List[pint.Quantity, pint.Quantity]]): The resolved `points` and `offset` of the `KMesh`.
+            (Optional[np.ndarray]): The resolved `offset` of the `KMesh`.
         """
-        points = None
-        offset = None
+        grid = self.resolve_full_grid()
         if self.center == 'Gamma-centered':
-            grid_space = [np.linspace(0, 1, n) for n in self.grid]
-            points = np.meshgrid(grid_space)
-            offset = np.array([0, 0, 0])
+            return np.zeros(3)
         elif self.center == 'Monkhorst-Pack':
-            try:
-                points = monkhorst_pack(self.grid)
-                offset = get_monkhorst_pack_size_and_offset(points)[-1]
-            except ValueError:
+            return np.where(grid % 2 == 0, 0.5 / grid, 0.0)
+        if self.offset is None:
+            logger.warning(
+                'Could not resolve `KMesh.offset` from `KMesh.center` and `KMesh.grid`.'
+            )
+            return None
+        return np.asarray(self.offset, dtype=np.float64)
+
+    def resolve_full_grid(self) -> np.ndarray:
+        """
+        Resolves the `grid` padded with ones to three axes, so that 1D and 2D meshes can be treated as 3D ones.
+
+        Returns:
+            (np.ndarray): The number of points along each of the three reciprocal lattice vectors.
+        """
+        grid = np.ones(3, dtype=np.int64)
+        grid[: len(self.grid)] = self.grid
+        return grid
+
+    def resolve_grid_shift(self, offset: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Resolves the shift of the mesh in units of half a grid step. Only meshes shifted by integer multiples of
+        half a grid step can be mapped onto themselves by the symmetry operations.
+
+        Args:
+            offset (np.ndarray): The offset of the mesh in units of the `reciprocal_lattice_vectors`.
+
+        Returns:
+            (Optional[np.ndarray]): The shift (0 or 1) along each axis, or None if the offset is not commensurate.
+        """
+        shift = 2 * self.resolve_full_grid() * np.asarray(offset, dtype=np.float64)
+        if not np.allclose(shift, np.rint(shift), atol=1e-6):
+            return None
+        return np.rint(shift).astype(np.int64) % 2
+
+    def iter_full_points(
+        self, offset: np.ndarray, chunk_size: int = _KMESH_CHUNK_SIZE
+    ) -> Generator[np.ndarray, None, None]:
+        """
+        Iterates over the points of the full mesh defined by `grid` and `offset` in chunks of at most
+        `chunk_size` points. The points are ordered row-major over the `grid` indices and given in units of
+        the `reciprocal_lattice_vectors`, wrapped into the interval [-0.5, 0.5).
+
+        Args:
+            offset (np.ndarray): The offset of the mesh in units of the `reciprocal_lattice_vectors`.
+            chunk_size (int, optional): The maximum number of points in each chunk.
+
+        Yields:
+            (np.ndarray): The points of the full mesh in the current chunk.
+        """
+        grid = self.resolve_full_grid()
+        n_total = int(np.prod(grid))
+        for start in range(0, n_total, chunk_size):
+            linear = np.arange(start, min(start + chunk_size, n_total))
+            points = np.stack(np.unravel_index(linear, grid), axis=-1) / grid + offset
+            yield points - np.floor(points + 0.5)
+
+    def resolve_points_and_offset(
+        self, logger: BoundLogger
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Resolves the `points` and `offset` of the full `KMesh` (without symmetry reduction) from the `grid`
+        and the `center`.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Tuple[Optional[np.ndarray], Optional[np.ndarray]]): The resolved `points` and `offset` of the `KMesh`.
+        """
+        offset = self.resolve_offset(logger)
+        if offset is None:
+            return None, None
+        points = np.concatenate(list(self.iter_full_points(offset)))
+        return points[:, : self.dimensionality], offset
+
+    def resolve_reciprocal_rotations(
+        self,
+        rotation_matrices: Optional[np.ndarray],
+        shift: np.ndarray,
+        time_reversal: bool = True,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Resolves the rotation matrices acting on the k-points in units of the `reciprocal_lattice_vectors`
+        (as row vectors, k' = k R), and flags those which map the whole mesh onto itself. The point group is
+        extended by time reversal (k -> -k) if `time_reversal` is True. The spatial rotations are listed first.
+
+        Args:
+            rotation_matrices (Optional[np.ndarray]): The rotation matrices of the symmetry operations in
+                fractional coordinates, as stored in `Symmetry.rotation_matrices`.
+            shift (np.ndarray): The shift of the mesh in units of half a grid step.
+            time_reversal (bool, optional): If True, the time reversal symmetry is included.
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray, np.ndarray]): The rotation matrices, the flags of the rotations which are
+                only a symmetry combined with time reversal, and the flags of the rotations mapping the whole mesh
+                onto itself.
+        """
+        rotations = np.eye(3, dtype=np.int64)[np.newaxis]
+        if rotation_matrices is not None and len(rotation_matrices) > 0:
+            rotations = np.asarray(rotation_matrices, dtype=np.int64).reshape(-1, 3, 3)
+        rotations = np.unique(rotations, axis=0)
+        is_time_reversed = np.zeros(len(rotations), dtype=bool)
+        if time_reversal:
+            reversed_rotations = np.unique(-rotations, axis=0)
+            new = ~np.any(
+                np.all(reversed_rotations[:, None] == rotations[None], axis=(2, 3)),
+                axis=1,
+            )
+            rotations = np.concatenate([rotations, reversed_rotations[new]])
+            is_time_reversed = np.concatenate(
+                [is_time_reversed, np.ones(new.sum(), bool)]
+            )
+
+        # The whole mesh is mapped onto itself if the images of the shifted origin and of its neighbours along
+        # each axis are mesh points, i.e., integers with the parity of `shift` in doubled grid coordinates
+        grid = self.resolve_full_grid()
+        scale = np.lcm.reduce(grid) // grid
+        generators = (2 * np.eye(4, 3, k=-1, dtype=np.int64) + shift) * scale
+        images = generators @ rotations
+        maps_grid = np.all(images % scale == 0, axis=(1, 2))
+        maps_grid &= np.all((images // scale - shift) % 2 == 0, axis=(1, 2))
+        return rotations, is_time_reversed, maps_grid
+
+    def resolve_irreducible_points(
+        self,
+        rotation_matrices: Optional[np.ndarray],
+        logger: BoundLogger,
+        time_reversal: bool = True,
+        chunk_size: int = _KMESH_CHUNK_SIZE,
+    ) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Reduces the full mesh defined by `grid` and `offset` to the irreducible wedge of the Brillouin zone using
+        the symmetry operations. Each full mesh point is mapped onto the representative of its star (restricted to
+        the mesh points) with the smallest row-major index, and the rotation generating it from the representative
+        is recorded:
+
+            full_points[p] = points[irreducible_indices[p]] @ rotations[rotation_indices[p]]  (modulo G)
+
+        Rotations which do not map the whole mesh onto itself are applied per point, i.e., only to the points whose
+        image is a mesh point. The full mesh is never stored: its points are evaluated in chunks of at most
+        `chunk_size` points.
+
+        Args:
+            rotation_matrices (Optional[np.ndarray]): The rotation matrices of the symmetry operations in
+                fractional coordinates. If None, only the identity (and time reversal) is used.
+            logger (BoundLogger): The logger to log messages.
+            time_reversal (bool, optional): If True, the time reversal symmetry is included.
+            chunk_size (int, optional): The maximum number of full mesh points evaluated at once.
+
+        Returns:
+            (Optional[Tuple[np.ndarray, ...]]): The irreducible `points`, their `multiplicities`, the
+                `irreducible_indices` and `rotation_indices` of each full mesh point, and the `rotation_matrices`
+                with their `is_time_reversed` flags.
+        """
+        offset = self.offset if self.offset is not None else self.resolve_offset(logger)
+        if offset is None:
+            return None
+        shift = self.resolve_grid_shift(offset)
+        if shift is None:
+            logger.warning(
+                'The `KMesh.offset` is not commensurate with the `KMesh.grid`, the mesh will not be symmetry reduced.'
+            )
+            rotations = np.eye(3, dtype=np.int64)[np.newaxis]
+            is_time_reversed = np.zeros(1, dtype=bool)
+            maps_grid = np.ones(1, dtype=bool)
+            shift = np.zeros(3, dtype=np.int64)
+        else:
+            rotations, is_time_reversed, maps_grid = self.resolve_reciprocal_rotations(
+                rotation_matrices, shift, time_reversal
+            )
+
+        # Working in doubled integer coordinates K = 2 * m + shift (k = K / (2 * grid)), scaled by
+        # `scale` to a common denominator so that the rotations act on integers
+        grid = self.resolve_full_grid()
+        n_total = int(np.prod(grid))
+        scale = np.lcm.reduce(grid) // grid
+        dtype = np.int32 if 6 * np.lcm.reduce(grid) < 2**31 else np.int64
+        strides = np.array([grid[1] * grid[2], grid[2], 1], dtype=dtype)
+        representatives = np.empty(
+            n_total, dtype=np.int32 if n_total < 2**31 else np.int64
+        )
+        # The rotation mapping a point onto its representative is the inverse of the one generating it
+        rotation_indices = np.empty(n_total, dtype=np.int8)
+        inverses = np.array(
+            [
+                np.flatnonzero(np.all(rotations @ rotation == np.eye(3), axis=(1, 2)))[
+                    0
+                ]
+                for rotation in rotations
+            ],
+            dtype=np.int8,
+        )
+        # Lookup tables wrapping the rotated coordinates back into the mesh and into row-major offsets
+        bounds = 2 * grid * np.abs(rotations).sum(axis=1).max(axis=0)
+        wrap_tables = [
+            (
+                np.arange(-bounds[j], bounds[j] + 1) % (2 * grid[j]) // 2 * strides[j]
+            ).astype(dtype)
+            for j in range(3)
+        ]
+        for start in range(0, n_total, chunk_size):
+            stop = min(start + chunk_size, n_total)
+            indices = np.unravel_index(np.arange(start, stop, dtype=dtype), grid)
+            scaled = [(2 * indices[i] + shift[i]) * scale[i] for i in range(3)]
+            best = np.full(stop - start, np.iinfo(dtype).max, dtype=dtype)
+            best_rotations = np.zeros(stop - start, dtype=np.int8)
+            image = np.empty(stop - start, dtype=dtype)
+            for index, rotation in enumerate(rotations):
+                linear = np.zeros(stop - start, dtype=dtype)
+                on_grid = None if maps_grid[index] else np.ones(stop - start, bool)
+                for j in range(3):
+                    image.fill(0)
+                    for i in np.flatnonzero(rotation[:, j]):
+                        if rotation[i, j] == 1:
+                            image += scaled[i]
+                        elif rotation[i, j] == -1:
+                            image -= scaled[i]
+                        else:
+                            image += rotation[i, j] * scaled[i]
+                    if on_grid is not None:
+                        # Images off the mesh are not integers with the parity of `shift` in doubled coordinates
+                        on_grid &= image % (2 * scale[j]) == shift[j] * scale[j]
+                    if scale[j] > 1:
+                        image //= scale[j]
+                    image += bounds[j]
+                    linear += wrap_tables[j][image]
+                if on_grid is not None:
+                    linear[~on_grid] = np.iinfo(dtype).max
+                smaller = linear < best
+                best[smaller] = linear[smaller]
+                best_rotations[smaller] = index
+            representatives[start:stop] = best
+            rotation_indices[start:stop] = inverses[best_rotations]
+
+        irreducible, irreducible_indices, multiplicities = np.unique(
+            representatives, return_inverse=True, return_counts=True
+        )
+        indices = np.stack(np.unravel_index(irreducible, grid), axis=-1)
+        points = (indices + 0.5 * shift) / grid
+        points -= np.floor(points + 0.5)
+        return (
+            points,
+            multiplicities.astype(np.float64),
+            irreducible_indices.astype(representatives.dtype),
+            rotation_indices,
+            rotations.astype(np.int8),
+            is_time_reversed,
+        )
+
+    def resolve_stored_irreducible_mesh(
+        self, logger: BoundLogger
+    ) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Resolves the irreducible mesh from the stored `irreducible_indices`, `rotation_indices` and
+        `rotation_matrices`, so that the points always match the stored maps and `weights`. The representative of
+        each star is the full mesh point with the smallest index mapped onto it.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[Tuple[np.ndarray, ...]]): The irreducible points, their multiplicities, and the unfolding maps,
+                as returned by `resolve_irreducible_points`.
+        """
+        offset = self.offset if self.offset is not None else self.resolve_offset(logger)
+        if offset is None:
+            return None
+        grid = self.resolve_full_grid()
+        irreducible_indices = np.asarray(self.irreducible_indices)
+        if len(irreducible_indices) != int(np.prod(grid)):
+            logger.warning(
+                'The length of `KMesh.irreducible_indices` does not match the `KMesh.grid`.'
+            )
+            return None
+        shift = self.resolve_grid_shift(offset)
+        if shift is None:
+            shift = np.zeros(3, dtype=np.int64)
+        _, representatives, multiplicities = np.unique(
+            irreducible_indices, return_index=True, return_counts=True
+        )
+        points = (
+            np.stack(np.unravel_index(representatives, grid), axis=-1) + 0.5 * shift
+        ) / grid
+        points -= np.floor(points + 0.5)
+        rotation_matrices = np.asarray(self.rotation_matrices, dtype=np.int8)
+        is_time_reversed = (
+            np.asarray(self.is_time_reversed, dtype=bool)
+            if self.is_time_reversed is not None
+            else np.zeros(len(rotation_matrices), dtype=bool)
+        )
+        return (
+            points,
+            multiplicities.astype(np.float64),
+            irreducible_indices,
+            np.asarray(self.rotation_indices),
+            rotation_matrices,
+            is_time_reversed,
+        )
+
+    def resolve_irreducible_mesh(
+        self, logger: BoundLogger
+    ) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Resolves the irreducible mesh from `grid`, `offset` and the unfolding maps stored in the `KMesh`, or from
+        the symmetry operations of the last `ModelSystem.symmetry` section if the maps are not stored yet. The result
+        is cached in `m_cache['irreducible_mesh']`.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[Tuple[np.ndarray, ...]]): The irreducible points (padded to 3D), their multiplicities, and the
+                unfolding maps, as returned by `resolve_irreducible_points`.
+        """
+        mesh = self.m_cache.get('irreducible_mesh')
+        if mesh is None:
+            if self.grid is None:
+                logger.warning('Could not find `KMesh.grid`.')
+                return None
+            if (
+                self.irreducible_indices is not None
+                and self.rotation_indices is not None
+                and self.rotation_matrices is not None
+            ):
+                mesh = self.resolve_stored_irreducible_mesh(logger)
+            else:
+                rotation_matrices = None
+                model_systems = self.m_xpath(
+                    'm_parent.m_parent.model_system', dict=False
+                )
+                if model_systems and model_systems[-1].symmetry:
+                    rotation_matrices = model_systems[-1].symmetry[0].rotation_matrices
+                mesh = self.resolve_irreducible_points(rotation_matrices, logger)
+            if mesh is None:
+                return None
+            self.m_cache['irreducible_mesh'] = mesh
+        return mesh
+
+    def unfold(
+        self,
+        values: np.ndarray,
+        logger: BoundLogger,
+        conjugate_time_reversed: bool = False,
+    ) -> Optional[np.ndarray]:
+        """
+        Unfolds an array indexed by the irreducible `points` (along its first axis) onto the full mesh, ordered
+        row-major over the `grid` indices. Scalar quantities are copied from the irreducible partner of each full
+        mesh point in a single gather.
+
+        Args:
+            values (np.ndarray): The (n_points, ...) values at the irreducible points.
+            logger (BoundLogger): The logger to log messages.
+            conjugate_time_reversed (bool, optional): If True, the complex conjugate is taken for the points
+                generated with a rotation combined with time reversal (e.g., for wavefunction coefficients).
+
+        Returns:
+            (Optional[np.ndarray]): The (n_full_points, ...) values on the full mesh.
+        """
+        irreducible_indices = self.irreducible_indices
+        rotation_indices = self.rotation_indices
+        is_time_reversed = self.is_time_reversed
+        if irreducible_indices is None:
+            mesh = self.resolve_irreducible_mesh(logger)
+            if mesh is None:
+                return None
+            irreducible_indices, rotation_indices, _, is_time_reversed = mesh[2:]
+        values = np.asarray(values)
+        if len(values) != irreducible_indices.max(initial=-1) + 1:
+            logger.warning(
+                'The first axis of `values` does not match the number of irreducible `points`.'
+            )
+            return None
+
+        unfolded = np.take(values, irreducible_indices, axis=0)
+        if (
+            conjugate_time_reversed
+            and np.iscomplexobj(unfolded)
+            and is_time_reversed is not None
+            and np.any(is_time_reversed)
+        ):
+            conjugate = is_time_reversed[rotation_indices]
+            unfolded[conjugate] = np.conj(unfolded[conjugate])
+        return unfolded
+
+    def resolve_tetrahedra(
+        self, logger: BoundLogger
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Resolves the tetrahedra of the linear tetrahedron method on the mesh with their corners mapped onto the
+        irreducible `points`. The subcells are split along their shortest main diagonal in Cartesian coordinates,
+        and the tetrahedra with the same irreducible corners are merged into one with a larger weight. The corner
+        tables are cached per `grid` and the result in `m_cache['tetrahedra']`.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[Tuple[np.ndarray, np.ndarray]]): The (n_tetrahedra, 4) indices of the corners in `points` and
+                the (n_tetrahedra) weights of the tetrahedra, normalized to 1.
+        """
+        tetrahedra = self.m_cache.get('tetrahedra')
+        if tetrahedra is not None:
+            return tetrahedra
+        irreducible_indices = self.irreducible_indices
+        if irreducible_indices is None:
+            mesh = self.resolve_irreducible_mesh(logger)
+            if mesh is None:
                 logger.warning(
-                    'Could not resolve `KMesh.points` and `KMesh.offset` from `KMesh.grid`. ASE `monkhorst_pack` failed.'
+                    'Could not resolve the tetrahedra of an irregular `KMesh`.'
+                )
+                return None
+            irreducible_indices = mesh[2]
+
+        # Blöchl's choice of the shortest main diagonal of the subcells
+        grid = self.resolve_full_grid()
+        diagonal = 0
+        if self.reciprocal_lattice_vectors is not None:
+            signs = 1 - 2 * np.eye(4, 3, k=-1)
+            steps = self.reciprocal_lattice_vectors.magnitude / grid[:, np.newaxis]
+            diagonal = int(np.argmin(np.linalg.norm(signs @ steps, axis=-1)))
+
+        corners = np.sort(
+            irreducible_indices[_get_tetrahedron_corners(tuple(grid), diagonal)],
+            axis=-1,
+        )
+        corners, counts = np.unique(corners, axis=0, return_counts=True)
+        tetrahedra = (corners, counts / counts.sum())
+        self.m_cache['tetrahedra'] = tetrahedra
+        return tetrahedra
+
+    def compute_tetrahedron_dos(
+        self,
+        energies: Any,
+        energy_grid: Any,
+        logger: BoundLogger,
+    ) -> Optional[Tuple[Any, np.ndarray]]:
+        """
+        Computes the density of states (DOS) and the integrated DOS of the `energies` at the irreducible `points`
+        with the linear tetrahedron method (Blöchl et al., Phys. Rev. B 49, 16223 (1994)). The tetrahedra are
+        processed in chunks, with the contributions of all bands and energies of each chunk evaluated at once.
+        Each band contributes one state to the integrated DOS.
+
+        Args:
+            energies (Any): The (n_points, n_bands) energies, as a pint quantity or in the units of `energy_grid`.
+            energy_grid (Any): The (n_energies) energies at which the DOS is evaluated.
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[Tuple[Any, np.ndarray]]): The (n_energies) DOS (in 1/joule for pint inputs) and integrated DOS.
+        """
+        tetrahedra = self.resolve_tetrahedra(logger)
+        if tetrahedra is None:
+            return None
+        corners, weights = tetrahedra
+        is_quantity = isinstance(energies, pint.Quantity)
+        if is_quantity:
+            energies = energies.to('joule').magnitude
+            energy_grid = energy_grid.to('joule').magnitude
+        energies = np.asarray(energies, dtype=np.float64).reshape(len(energies), -1)
+        energy_grid = np.asarray(energy_grid, dtype=np.float64)
+        if len(energies) <= corners.max():
+            logger.warning(
+                'The first axis of `energies` does not match the number of irreducible `points`.'
+            )
+            return None
+
+        dos = np.zeros(len(energy_grid))
+        idos = np.zeros(len(energy_grid))
+        chunk_size = max(
+            1, _TETRAHEDRON_CHUNK_SIZE // (energies.shape[1] * len(energy_grid))
+        )
+        for start in range(0, len(corners), chunk_size):
+            # Sorted corner energies of each (tetrahedron, band), broadcast against the energy grid
+            e = np.sort(energies[corners[start : start + chunk_size]], axis=1)
+            e1, e2, e3, e4 = (e[:, i, :, np.newaxis] for i in range(4))
+            x = energy_grid
+            with np.errstate(divide='ignore', invalid='ignore'):
+                d21, d31, d41 = e2 - e1, e3 - e1, e4 - e1
+                d32, d42, d43 = e3 - e2, e4 - e2, e4 - e3
+                ratio = (d31 + d42) / (d32 * d42)
+                lower, middle, upper = (
+                    (x >= e1) & (x < e2),
+                    (x >= e2) & (x < e3),
+                    (x >= e3) & (x < e4),
+                )
+                chunk_dos = np.where(lower, 3 * (x - e1) ** 2 / (d21 * d31 * d41), 0)
+                chunk_dos = np.where(
+                    middle,
+                    (3 * d21 + 6 * (x - e2) - 3 * ratio * (x - e2) ** 2) / (d31 * d41),
+                    chunk_dos,
+                )
+                chunk_dos = np.where(
+                    upper, 3 * (e4 - x) ** 2 / (d41 * d42 * d43), chunk_dos
+                )
+                chunk_idos = np.where(x >= e4, 1.0, 0)
+                chunk_idos = np.where(
+                    lower, (x - e1) ** 3 / (d21 * d31 * d41), chunk_idos
+                )
+                chunk_idos = np.where(
+                    middle,
+                    (
+                        d21**2
+                        + 3 * d21 * (x - e2)
+                        + 3 * (x - e2) ** 2
+                        - ratio * (x - e2) ** 3
+                    )
+                    / (d31 * d41),
+                    chunk_idos,
                 )
-                return None  # this is a quick workaround: k_mesh.grid should be symmetry reduced
-        return points, offset
+                chunk_idos = np.where(
+                    upper, 1 - (e4 - x) ** 3 / (d41 * d42 * d43), chunk_idos
+                )
+            chunk_weights = weights[start : start + chunk_size]
+            dos += np.einsum('t,tbe->e', chunk_weights, chunk_dos)
+            idos += np.einsum('t,tbe->e', chunk_weights, chunk_idos)
+        if is_quantity:
+            return dos / ureg.joule, idos
+        return dos, idos
+
+    @staticmethod
+    def is_regular_mesh(points: np.ndarray, reference: np.ndarray) -> bool:
+        """
+        Checks if the `points` are the `reference` mesh points up to reciprocal lattice vectors, in the same order.
+
+        Args:
+            points (np.ndarray): The points to be checked in units of the `reciprocal_lattice_vectors`.
+            reference (np.ndarray): The generated mesh points in units of the `reciprocal_lattice_vectors`.
+
+        Returns:
+            (bool): True if both lists describe the same points.
+        """
+        points = np.real(np.asarray(points))
+        reference = reference[:, : points.shape[-1]]
+        if points.shape != reference.shape:
+            return False
+        difference = points - reference
+        return np.allclose(difference, np.rint(difference), atol=1e-6)
+
+    def get_points(self, logger: BoundLogger) -> Optional[np.ndarray]:
+        """
+        Gets the (symmetry-reduced) `points` of the `KMesh` as a real array, generating them from `grid` and
+        `offset` if the mesh is stored implicitly.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[np.ndarray]): The (n_points, dimensionality) points in units of the `reciprocal_lattice_vectors`.
+        """
+        if not self.is_implicit:
+            return self.points
+        mesh = self.resolve_irreducible_mesh(logger)
+        if mesh is None:
+            return None
+        return mesh[0][:, : self.dimensionality]
+
+    def get_weights(self, logger: BoundLogger) -> Optional[np.ndarray]:
+        """
+        Gets the `weights` of the `KMesh`, generating them from the symmetry reduction if they are not stored.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[np.ndarray]): The (n_points) weights normalized to 1.
+        """
+        if self.weights is not None or not self.is_implicit:
+            return self.weights
+        mesh = self.resolve_irreducible_mesh(logger)
+        if mesh is None:
+            return None
+        return mesh[1] / mesh[1].sum()
+
+    def iter_points(
+        self,
+        logger: BoundLogger,
+        full: bool = False,
+        chunk_size: int = _KMESH_CHUNK_SIZE,
+    ) -> Generator[np.ndarray, None, None]:
+        """
+        Iterates over the points of the `KMesh` in chunks of at most `chunk_size` points. The points of the full
+        mesh of an implicit `KMesh` are generated chunk by chunk and never stored.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+            full (bool, optional): If True, the points of the full mesh are iterated instead of `points`.
+            chunk_size (int, optional): The maximum number of points in each chunk.
+
+        Yields:
+            (np.ndarray): The (n_chunk, dimensionality) points in units of the `reciprocal_lattice_vectors`.
+        """
+        if full and self.all_points is not None:
+            points = self.all_points
+        elif full and self.is_implicit:
+            for chunk in self.iter_full_points(self.offset, chunk_size):
+                yield chunk[:, : self.dimensionality]
+            return
+        elif full:
+            logger.warning('Could not resolve the full mesh of the `KMesh`.')
+            return
+        else:
+            points = self.get_points(logger)
+        if points is None:
+            return
+        for start in range(0, len(points), chunk_size):
+            yield points[start : start + chunk_size]
+
+    def resolve_bandpath_template(
+        self, model_systems: List[ModelSystem], logger: BoundLogger
+    ) -> Optional[Tuple[Dict[str, List[float]], List[Tuple[str, str]]]]:
+        """
+        Resolves the high-symmetry points and the standard line path segments of the last `ModelSystem`. The band
+        path is built from the primitive cell of the lattice. This is the `AtomicCell` of type 'primitive' (if the
+        `KMesh` lattice is a supercell of it in the same frame), the `KMesh` lattice itself, or the centring of
+        `Symmetry.bravais_lattice` applied to the `KMesh` lattice (e.g., the fcc path of a conventional cubic cell
+        with `bravais_lattice = 'cF'`), whichever comes first with a Bravais lattice matching `Symmetry.bravais_lattice`.
+        The high-symmetry points are returned in units of the `reciprocal_lattice_vectors` of the `KMesh` if defined,
+        or of the first `ModelSystem.cell` otherwise.
+
+        Args:
+            model_systems (List[ModelSystem]): The list of `ModelSystem` sections.
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[Tuple[Dict[str, List[float]], List[Tuple[str, str]]]]): The `high_symmetry_points` and the
+                pairs of high-symmetry points defining each line path segment.
+        """
+        model_system = model_systems[-1] if model_systems else None
+        atomic_cells = (model_system.cell or []) if model_system is not None else []
+        symmetry = (model_system.symmetry or []) if model_system is not None else []
+        if self.reciprocal_lattice_vectors is not None:
+            lattice_vectors = (
+                2
+                * np.pi
+                * np.linalg.inv(
+                    self.reciprocal_lattice_vectors.to('1/angstrom').magnitude
+                ).T
+            )
+        elif atomic_cells and atomic_cells[0].lattice_vectors is not None:
+            lattice_vectors = atomic_cells[0].lattice_vectors.to('angstrom').magnitude
+        else:
+            logger.warning(
+                'Could not find the lattice vectors to resolve the band path.'
+            )
+            return None
+        bravais_lattice = symmetry[0].bravais_lattice if symmetry else None
+
+        # Candidate primitive cells, in the same Cartesian frame as `lattice_vectors`
+        candidates = []
+        for atomic_cell in atomic_cells:
+            if atomic_cell.type != 'primitive' or atomic_cell.lattice_vectors is None:
+                continue
+            primitive_vectors = atomic_cell.lattice_vectors.to('angstrom').magnitude
+            transformation = lattice_vectors @ np.linalg.pinv(primitive_vectors)
+            if np.allclose(transformation, np.rint(transformation), atol=1e-4):
+                candidates.append(primitive_vectors)
+        candidates.append(lattice_vectors)
+        if bravais_lattice:
+            candidates.extend(
+                centring @ lattice_vectors
+                for centring in _CENTRING_MATRICES.get(bravais_lattice[1:], ())
+            )
+
+        templates = []
+        for primitive_vectors in candidates:
+            try:
+                template = _get_bandpath_template(
+                    tuple(np.round(Cell(primitive_vectors).cellpar(), 6))
+                )
+            except (ValueError, RuntimeError, np.linalg.LinAlgError):
+                continue
+            templates.append((primitive_vectors, template))
+            if bravais_lattice is None or template[0] == bravais_lattice:
+                break
+        if not templates:
+            logger.warning('Could not resolve the band path of the lattice with ASE.')
+            return None
+        primitive_vectors, (pearson_symbol, special_points, segments) = next(
+            (item for item in templates if item[1][0] == bravais_lattice),
+            templates[0],
+        )
+        if bravais_lattice is not None and pearson_symbol != bravais_lattice:
+            logger.warning(
+                'The Bravais lattice resolved for the band path does not coincide with `Symmetry.bravais_lattice`.',
+                data={'bravais_lattice': bravais_lattice, 'band_path': pearson_symbol},
+            )
+
+        # Points in units of the reciprocal lattice of `lattice_vectors`: k = f_p B_p = f B
+        transformation = (lattice_vectors @ np.linalg.inv(primitive_vectors)).T
+        return {
+            label: (np.asarray(point) @ transformation).tolist()
+            for label, point in special_points
+        }, list(segments)
+
+    def is_periodic_system(self, model_systems: List[ModelSystem]) -> bool:
+        """
+        Checks if the `KMesh` samples a periodic system in all three directions, i.e., if a band path can be defined.
+        Atoms and molecules, low-dimensional cells, and cells without lattice vectors are not periodic.
+
+        Args:
+            model_systems (List[ModelSystem]): The list of `ModelSystem` sections.
+
+        Returns:
+            (bool): True if the last `ModelSystem` (or the `reciprocal_lattice_vectors`) defines a 3D periodic lattice.
+        """
+        if not model_systems:
+            return self.reciprocal_lattice_vectors is not None
+        model_system = model_systems[-1]
+        if model_system.type in ['atom', 'active_atom', 'molecule / cluster']:
+            return False
+        if not model_system.cell:
+            return self.reciprocal_lattice_vectors is not None
+        atomic_cell = model_system.cell[0]
+        periodic = atomic_cell.periodic_boundary_conditions
+        if periodic is not None and not all(periodic):
+            return False
+        return (
+            self.reciprocal_lattice_vectors is not None
+            or atomic_cell.lattice_vectors is not None
+        )
+
+    def resolve_line_path_segments(
+        self,
+        high_symmetry_points: Dict[str, List[float]],
+        segments: List[Tuple[str, str]],
+        n_line_points: int,
+        logger: BoundLogger,
+    ) -> List[LinePathSegment]:
+        """
+        Resolves the `line_path_segments` for the pairs of high-symmetry points in `segments`. Their `points` are
+        generated afterwards for all the segments at once by `resolve_line_path`.
+
+        Args:
+            high_symmetry_points (Dict[str, List[float]]): The coordinates of the high-symmetry points in units of the
+                `reciprocal_lattice_vectors`.
+            segments (List[Tuple[str, str]]): The pairs of high-symmetry points defining each segment.
+            n_line_points (int): The number of points in each segment.
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (List[LinePathSegment]): The list of `LinePathSegment` sections.
+        """
+        if any(
+            label not in high_symmetry_points for pair in segments for label in pair
+        ):
+            logger.warning(
+                'Could not find some of the `segments` labels in `high_symmetry_points`.'
+            )
+            return []
+        return [
+            LinePathSegment(high_symmetry_path=list(pair), n_line_points=n_line_points)
+            for pair in segments
+        ]
+
+    def resolve_line_path(
+        self, logger: BoundLogger
+    ) -> Optional[Tuple[np.ndarray, Optional[np.ndarray], np.ndarray]]:
+        """
+        Resolves the points of all the `line_path_segments` in a single vectorized pass into one contiguous buffer,
+        together with the cumulative Cartesian distance along the path. The distance does not increase across the
+        boundaries between segments, so discontinuous paths (e.g., 'K|U') are joined. The result is cached in
+        `m_cache['line_path']`.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[Tuple[np.ndarray, Optional[np.ndarray], np.ndarray]]): The (n_total, 3) points in units of the
+                `reciprocal_lattice_vectors`, the (n_total) cumulative distances in 1/meter (None if the
+                `reciprocal_lattice_vectors` are not defined), and the (n_segments + 1) offsets of each segment in
+                the buffer.
+        """
+        line_path = self.m_cache.get('line_path')
+        if line_path is not None:
+            return line_path
+        if not self.line_path_segments:
+            return None
+        if self.high_symmetry_points is None:
+            logger.warning(
+                'Could not find `KMesh.high_symmetry_points` to resolve the points of `KMesh.line_path_segments`.'
+            )
+            return None
+        try:
+            ends = np.array(
+                [
+                    [
+                        self.high_symmetry_points[label]
+                        for label in segment.high_symmetry_path
+                    ]
+                    for segment in self.line_path_segments
+                ],
+                dtype=np.float64,
+            ).reshape(-1, 2, 3)
+        except (KeyError, TypeError, ValueError):
+            logger.warning(
+                'Could not resolve the `LinePathSegment.high_symmetry_path` from `KMesh.high_symmetry_points`.'
+            )
+            return None
+
+        counts = np.array(
+            [segment.n_line_points or 0 for segment in self.line_path_segments]
+        )
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        segment_indices = np.repeat(np.arange(len(counts)), counts)
+        fractions = (np.arange(offsets[-1]) - offsets[segment_indices]) / np.maximum(
+            counts - 1, 1
+        )[segment_indices]
+        starts = ends[segment_indices, 0]
+        points = starts + fractions[:, np.newaxis] * (ends[segment_indices, 1] - starts)
+
+        distances = None
+        if self.reciprocal_lattice_vectors is not None:
+            steps = np.linalg.norm(
+                np.diff(points, axis=0)
+                @ self.reciprocal_lattice_vectors.to('1/meter').magnitude,
+                axis=-1,
+            )
+            boundaries = offsets[1:-1]
+            steps[boundaries[(boundaries > 0) & (boundaries < offsets[-1])] - 1] = 0
+            distances = np.concatenate([[0], np.cumsum(steps)])
+
+        line_path = (points, distances, offsets)
+        self.m_cache['line_path'] = line_path
+        return line_path
+
+    def resolve_reciprocal_lattice_vectors(
+        self, model_systems: List[ModelSystem], logger: BoundLogger
+    ) -> Optional[pint.Quantity]:
+        """
+        Resolves the `reciprocal_lattice_vectors` (including the $2 pi$ pre-factor) from the lattice vectors of the
+        first cell of the last `ModelSystem` of the list.
+
+        Args:
+            model_systems (List[ModelSystem]): The list of `ModelSystem` sections.
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[pint.Quantity]): The resolved `reciprocal_lattice_vectors`.
+        """
+        if not model_systems or not model_systems[-1].cell:
+            logger.warning('`ModelSystem.cell` was not found.')
+            return None
+        lattice_vectors = model_systems[-1].cell[0].lattice_vectors
+        if lattice_vectors is None:
+            logger.warning('`AtomicCell.lattice_vectors` was not found.')
+            return None
+        try:
+            inverse = np.linalg.inv(lattice_vectors.to('meter').magnitude)
+        except np.linalg.LinAlgError:
+            logger.warning('`AtomicCell.lattice_vectors` are linearly dependent.')
+            return None
+        return 2 * np.pi * inverse.T / ureg.meter
+
+    @staticmethod
+    def compute_k_line_densities(
+        grids: np.ndarray,
+        reciprocal_lattice_vectors: Any,
+        periodic: Optional[np.ndarray] = None,
+    ) -> pint.Quantity:
+        """
+        Computes the k-line densities of a stack of (grid, reciprocal lattice) pairs in a single vectorized pass.
+        The k-line density of each pair is the least precise sampling among the periodic axes:
+
+            k_line_density = min_i(grid_i / |b_i|),    for the periodic axes i.
+
+        Grids with less than 3 axes (1D and 2D meshes) are padded with non-periodic axes.
+
+        Args:
+            grids (np.ndarray): The (n_meshes, n_axes) grids, or a single grid.
+            reciprocal_lattice_vectors (Any): The (n_meshes, 3, 3) reciprocal lattice vectors including the $2 pi$
+                pre-factor, or a single set of them. Magnitudes without units are taken in 1/meter.
+            periodic (Optional[np.ndarray], optional): The (n_meshes, 3) mask of periodic axes. Defaults to the axes of
+                the `grids`.
+
+        Returns:
+            (pint.Quantity): The (n_meshes) k-line densities in meters. Pairs without periodic axes are NaN.
+        """
+        grids, reciprocal_lattice_vectors, periodic = KMesh._resolve_mesh_stacks(
+            grids, reciprocal_lattice_vectors, periodic
+        )
+        norms = np.linalg.norm(reciprocal_lattice_vectors, axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            densities = np.where(periodic, grids / norms, np.inf).min(axis=-1)
+        densities[~periodic.any(axis=-1)] = np.nan
+        return densities * ureg.meter
+
+    @staticmethod
+    def compute_grids_from_spacing(
+        k_spacings: Any,
+        reciprocal_lattice_vectors: Any,
+        periodic: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Computes the grids sampling a stack of reciprocal lattices with a target k-spacing in a single vectorized
+        pass, as:
+
+            grid_i = max(1, ceil(|b_i| / k_spacing)),    for the periodic axes i,
+
+        and 1 along the non-periodic axes.
+
+        Args:
+            k_spacings (Any): The (n_meshes) target k-spacings including the $2 pi$ pre-factor, or a single one.
+                Magnitudes without units are taken in 1/meter.
+            reciprocal_lattice_vectors (Any): The (n_meshes, 3, 3) reciprocal lattice vectors including the $2 pi$
+                pre-factor, or a single set of them. Magnitudes without units are taken in 1/meter.
+            periodic (Optional[np.ndarray], optional): The (n_meshes, 3) mask of periodic axes. Defaults to all axes.
+
+        Returns:
+            (np.ndarray): The (n_meshes, 3) grids.
+        """
+        if isinstance(k_spacings, pint.Quantity):
+            k_spacings = k_spacings.to('1/meter').magnitude
+        k_spacings = np.asarray(k_spacings, dtype=np.float64).reshape(-1, 1)
+        _, reciprocal_lattice_vectors, periodic = KMesh._resolve_mesh_stacks(
+            np.ones((len(k_spacings), 3)), reciprocal_lattice_vectors, periodic
+        )
+        ratios = np.linalg.norm(reciprocal_lattice_vectors, axis=-1) / k_spacings
+        # The tolerance avoids adding one point when the ratio is an integer up to rounding errors
+        grids = np.maximum(1, np.ceil(ratios - 1e-8 * np.maximum(ratios, 1)))
+        return np.where(periodic, grids, 1).astype(np.int32)
+
+    @staticmethod
+    def _resolve_mesh_stacks(
+        grids: np.ndarray,
+        reciprocal_lattice_vectors: Any,
+        periodic: Optional[np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Broadcasts the grids, reciprocal lattice vectors (in 1/meter) and periodic masks to common
+        (n_meshes, 3), (n_meshes, 3, 3) and (n_meshes, 3) stacks.
+        """
+        if isinstance(reciprocal_lattice_vectors, pint.Quantity):
+            reciprocal_lattice_vectors = reciprocal_lattice_vectors.to(
+                '1/meter'
+            ).magnitude
+        reciprocal_lattice_vectors = np.asarray(
+            reciprocal_lattice_vectors, dtype=np.float64
+        ).reshape(-1, 3, 3)
+        grids = np.atleast_2d(np.asarray(grids, dtype=np.float64))
+        n_axes = grids.shape[-1]
+        grids = np.pad(grids, ((0, 0), (0, 3 - n_axes)), constant_values=1)
+        if periodic is None:
+            periodic = np.arange(3) < n_axes
+        periodic = np.atleast_2d(np.asarray(periodic, dtype=bool))
+        n_meshes = max(len(grids), len(reciprocal_lattice_vectors), len(periodic))
+        return (
+            np.broadcast_to(grids, (n_meshes, 3)),
+            np.broadcast_to(reciprocal_lattice_vectors, (n_meshes, 3, 3)),
+            np.broadcast_to(periodic, (n_meshes, 3)),
+        )
 
     def get_k_line_density(
-        self, reciprocal_lattice_vectors: pint.Quantity, logger: BoundLogger
+        self,
+        reciprocal_lattice_vectors: pint.Quantity,
+        logger: BoundLogger,
+        periodic: Optional[np.ndarray] = None,
     ) -> Optional[np.float64]:
         """
         Gets the k-line density of the `KMesh`. This quantity is used as a precision measure
@@ -338,6 +1516,8 @@ class KMesh(Mesh):
 
         Args:
             reciprocal_lattice_vectors (pint.Quantity, [3, 3]): Reciprocal lattice vectors of the atomic cell.
+            logger (BoundLogger): The logger to log messages.
+            periodic (Optional[np.ndarray], optional): The mask of periodic axes. Defaults to the axes of the `grid`.
 
         Returns:
             (np.float64): The k-line density of the `KMesh`.
@@ -345,25 +1525,24 @@ class KMesh(Mesh):
         if reciprocal_lattice_vectors is None:
             logger.error('No `reciprocal_lattice_vectors` input found.')
             return None
-        if len(reciprocal_lattice_vectors) != 3 or len(self.grid) != 3:
+        if len(reciprocal_lattice_vectors) != 3 or len(self.grid) > 3:
             logger.error(
                 'The `reciprocal_lattice_vectors` and the `grid` should have the same dimensionality.'
             )
             return None
 
-        reciprocal_lattice_vectors = reciprocal_lattice_vectors.magnitude
-        return min(
-            [
-                k_point / (np.linalg.norm(k_vector))
-                for k_vector, k_point in zip(reciprocal_lattice_vectors, self.grid)
-            ]
-        )
+        k_line_density = self.compute_k_line_densities(
+            self.grid, reciprocal_lattice_vectors, periodic
+        )[0].magnitude
+        return None if np.isnan(k_line_density) else k_line_density
 
     def resolve_k_line_density(
         self, model_systems: List[ModelSystem], logger: BoundLogger
     ) -> Optional[pint.Quantity]:
         """
-        Resolves the `k_line_density` of the `KMesh` from the the list of `ModelSystem`.
+        Resolves the `k_line_density` of the `KMesh` from the last representative `ModelSystem` of the list. Only
+        the periodic axes of its cell (`AtomicCell.periodic_boundary_conditions`) are considered, so that 1D and 2D
+        systems are supported.
 
         Args:
             model_systems (List[ModelSystem]): The list of `ModelSystem` sections.
@@ -372,48 +1551,126 @@ class KMesh(Mesh):
         Returns:
             (Optional[pint.Quantity]): The resolved `k_line_density` of the `KMesh`.
         """
-        for model_system in model_systems:
-            # General checks to proceed with normalization
-            if is_not_representative(model_system, logger):
-                return None
-            # TODO extend this for other dimensions (@ndaelman-hu)
-            if model_system.type != 'bulk':
-                logger.warning('`ModelSystem.type` is not describing a bulk system.')
-                return None
-
-            atomic_cell = model_system.cell
-            if atomic_cell is None:
-                logger.warning('`ModelSystem.cell` was not found.')
-                return None
+        model_system = next(
+            (
+                model_system
+                for model_system in reversed(model_systems or [])
+                if model_system.is_representative
+            ),
+            None,
+        )
+        if model_system is None:
+            logger.warning('Could not find a representative `ModelSystem`.')
+            return None
+        if not model_system.cell:
+            logger.warning('`ModelSystem.cell` was not found.')
+            return None
+        atomic_cell = model_system.cell[0]
 
-            # Set the `reciprocal_lattice_vectors` using ASE
-            ase_atoms = atomic_cell[0].to_ase_atoms(logger)
-            if self.reciprocal_lattice_vectors is None:
-                self.reciprocal_lattice_vectors = (
-                    2 * np.pi * ase_atoms.get_reciprocal_cell() / ureg.angstrom
+        periodic = atomic_cell.periodic_boundary_conditions
+        if periodic is None:
+            if model_system.type != 'bulk':
+                logger.warning(
+                    'Could not resolve the periodic axes of a `ModelSystem` which is not describing a bulk system.'
                 )
+                return None
+            periodic = [True, True, True]
+        if self.reciprocal_lattice_vectors is None:
+            self.reciprocal_lattice_vectors = self.resolve_reciprocal_lattice_vectors(
+                [model_system], logger
+            )
 
-            # Resolve `k_line_density`
-            if k_line_density := self.get_k_line_density(
-                self.reciprocal_lattice_vectors, logger
-            ):
-                return k_line_density * ureg('m')
+        # Resolve `k_line_density`
+        if k_line_density := self.get_k_line_density(
+            self.reciprocal_lattice_vectors, logger, periodic
+        ):
+            return k_line_density * ureg('m')
         return None
 
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
+        model_systems = self.m_xpath('m_parent.m_parent.model_system', dict=False)
+
+        self.m_cache.pop('line_path', None)
+        if self.reciprocal_lattice_vectors is None and model_systems:
+            self.reciprocal_lattice_vectors = self.resolve_reciprocal_lattice_vectors(
+                model_systems, logger
+            )
+
+        # Resolve the high-symmetry points, and the standard band path only for explicit line path meshes
+        generate_line_path = (
+            self.is_line_path
+            and self.grid is None
+            and self.points is None
+            and not self.line_path_segments
+        )
+        # Non-periodic systems (e.g., molecules) have no band path, so they are skipped silently
+        if generate_line_path or (
+            self.high_symmetry_points is None and self.is_periodic_system(model_systems)
+        ):
+            template = self.resolve_bandpath_template(model_systems, logger)
+            if template is not None:
+                if self.high_symmetry_points is None:
+                    self.high_symmetry_points = template[0]
+                if generate_line_path:
+                    self.line_path_segments = self.resolve_line_path_segments(
+                        self.high_symmetry_points,
+                        template[1],
+                        _N_LINE_POINTS,
+                        logger,
+                    )
+
+        # Sample all the line path segments in a single pass, with the segments points as slices of the buffer
+        line_path = self.resolve_line_path(logger)
+        if line_path is not None:
+            points, distances, offsets = line_path
+            for segment, start, stop in zip(
+                self.line_path_segments, offsets[:-1], offsets[1:]
+            ):
+                if segment.points is None:
+                    segment.points = points[start:stop]
+            if self.line_path_distances is None and distances is not None:
+                self.line_path_distances = distances / ureg.meter
 
         # If `grid` is not defined, we do not normalize the KMesh
         if self.grid is None:
-            logger.warning('Could not find `KMesh.grid`.')
+            if not self.line_path_segments and self.points is None:
+                logger.warning('Could not find `KMesh.grid`.')
             return
 
-        # Normalize k mesh from grid sampling
-        if self.points is None and self.offset is None:
-            self.points, self.offset = self.resolve_points_and_offset(logger)
+        self.m_cache.pop('irreducible_mesh', None)
+
+        # Normalize k mesh from grid sampling, reduced to the irreducible wedge of the Brillouin zone. Regular
+        # meshes are stored implicitly, i.e., only the points of irregular meshes are materialized.
+        if self.offset is None:
+            self.offset = self.resolve_offset(logger)
+        mesh = (
+            self.resolve_irreducible_mesh(logger) if self.offset is not None else None
+        )
+        if mesh is not None:
+            points, multiplicities = mesh[:2]
+            if self.points is None or self.is_regular_mesh(self.points, points):
+                self.is_implicit = True
+                self.points = None
+                self.n_points = len(points)
+                if self.irreducible_indices is None:
+                    (
+                        self.irreducible_indices,
+                        self.rotation_indices,
+                        self.rotation_matrices,
+                        self.is_time_reversed,
+                    ) = mesh[2:]
+                if self.multiplicities is None:
+                    self.multiplicities = multiplicities
+                if self.weights is None:
+                    self.weights = multiplicities / multiplicities.sum()
+            if self.all_points is not None and self.is_regular_mesh(
+                self.all_points,
+                np.concatenate(list(self.iter_full_points(self.offset))),
+            ):
+                self.all_points = None
 
         # Calculate k_line_density for data quality measures
-        model_systems = self.m_xpath('m_parent.m_parent.model_system', dict=False)
         if self.k_line_density is None:
             self.k_line_density = self.resolve_k_line_density(model_systems, logger)
 
@@ -432,14 +1689,125 @@ class QuasiparticlesFrequencyMesh(Mesh):
         """,
     )
 
+    weights = Quantity(
+        type=np.float64,
+        shape=['n_points'],
+        unit='joule',
+        description="""
+        Integration weights of each point in joules, such that the integral of a function f over the frequency
+        is approximated by sum(weights * f(points)).
+        """,
+    )
+
+    frequency_scale = Quantity(
+        type=np.float64,
+        unit='joule',
+        description="""
+        Scale of the mapping of the `quadrature` nodes onto frequencies (see `spacing`). It is the upper bound of
+        `'Equidistant'` meshes, and the mid point of `'Logarithmic'` and `'Tan'` meshes.
+        """,
+    )
+
+    is_imaginary = Quantity(
+        type=bool,
+        default=False,
+        description="""
+        If True, the points lie on the imaginary frequency axis.
+        """,
+    )
+
     def __init__(self, m_def: Section = None, m_context: Context = None, **kwargs):
         super().__init__(m_def, m_context, **kwargs)
         # Set the name of the section
         self.name = self.m_def.name
 
+    def resolve_quadrature(
+        self, logger: BoundLogger
+    ) -> Optional[Tuple[pint.Quantity, pint.Quantity]]:
+        """
+        Resolves the frequency points and integration weights from the `quadrature` (defaults to 'Newton-Cotes'),
+        the `spacing`, the `n_points` and the `frequency_scale`. The unit-scale rules are cached by
+        (quadrature, spacing, n_points), so regenerating a mesh only costs the scaling.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[Tuple[pint.Quantity, pint.Quantity]]): The (n_points, 1) complex points and the (n_points)
+                weights, both in joules.
+        """
+        if not self.n_points or self.frequency_scale is None:
+            logger.warning(
+                'Could not resolve the `QuasiparticlesFrequencyMesh` from `n_points` and `frequency_scale`.'
+            )
+            return None
+        nodes, weights = _get_quadrature_rule(
+            self.quadrature or 'Newton-Cotes', self.spacing, int(self.n_points)
+        )
+        scale = self.frequency_scale.to('joule').magnitude
+        points = (1j if self.is_imaginary else 1) * scale * nodes[:, np.newaxis]
+        return points * ureg.joule, scale * weights * ureg.joule
+
+    def get_points(self, logger: BoundLogger) -> Optional[pint.Quantity]:
+        """
+        Gets the `points` of the `QuasiparticlesFrequencyMesh`, generating them if the mesh is stored implicitly.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[pint.Quantity]): The (n_points, dimensionality) points in joules.
+        """
+        if not self.is_implicit:
+            return self.points
+        quadrature = self.resolve_quadrature(logger)
+        return quadrature[0] if quadrature is not None else None
+
+    def get_weights(self, logger: BoundLogger) -> Optional[pint.Quantity]:
+        """
+        Gets the `weights` of the `QuasiparticlesFrequencyMesh`, generating them if the mesh is stored implicitly.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+
+        Returns:
+            (Optional[pint.Quantity]): The (n_points) integration weights in joules.
+        """
+        if self.weights is not None or not self.is_implicit:
+            return self.weights
+        quadrature = self.resolve_quadrature(logger)
+        return quadrature[1] if quadrature is not None else None
+
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
 
+        # Meshes defined by their quadrature are stored implicitly, unless the stored points differ. The magnitudes
+        # in joules are tiny, so they are only compared with a relative tolerance.
+        if self.n_points and self.frequency_scale is not None:
+            quadrature = self.resolve_quadrature(logger)
+            if quadrature is None:
+                return
+            points, weights = quadrature
+            if self.points is None or (
+                self.points.shape == points.shape
+                and np.allclose(
+                    self.points.to('joule').magnitude,
+                    points.magnitude,
+                    rtol=1e-6,
+                    atol=0,
+                )
+            ):
+                self.dimensionality = 1
+                self.is_implicit = True
+                self.points = None
+                if self.weights is not None and np.allclose(
+                    self.weights.to('joule').magnitude,
+                    weights.magnitude,
+                    rtol=1e-6,
+                    atol=0,
+                ):
+                    self.weights = None
+
 
 class SelfConsistency(NumericalSettings):
     """
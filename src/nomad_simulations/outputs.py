@@ -35,18 +35,1114 @@
 #
 
 import re
+import h5py
 import numpy as np
+import pint
+from structlog.stdlib import BoundLogger
+from scipy.special import erf
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, Optional, Tuple, Union
 
 from nomad.units import ureg
 from nomad.datamodel.data import ArchiveSection
+from nomad.datamodel.hdf5 import HDF5Reference, match_hdf5_reference
 from nomad.metainfo import Quantity, SubSection, SectionProxy, MEnum
 
+from .numerical_settings import SelfConsistency, KMesh
+from .model_method import ExcitedStateMethodology, TB
+from .atoms_state import OrbitalsState
+
+# Target size (in bytes) of the chunks of the external arrays
+_CHUNK_BYTES = 2**20
+
+# Maximum number of (k-point, band, energy) elements evaluated at once in the broadened DOS
+_DOS_CHUNK_SIZE = 2**22
+
+# Default number of energies in the DOS energy grid and extension of its range in units of the broadening
+_N_DOS_ENERGIES = 1000
+_DOS_ENERGY_MARGIN = 5
+
+
+class ChunkedArray(ArchiveSection):
+    """
+    Section referencing an array property stored outside of the archive in a chunked and compressed HDF5 dataset.
+    The HDF5 file is a raw file of the upload referenced by `reference` and accessed through the archive context
+    (`archive.m_context.raw_file`), so that it moves with the upload. The array is read lazily by slices, and
+    written and processed chunk by chunk along its first axis, so that it never has to fit in memory.
+    """
+
+    name = Quantity(
+        type=str,
+        description="""
+        Name of the array property, e.g., 'eigenvalues' or 'forces'.
+        """,
+    )
+
+    reference = Quantity(
+        type=HDF5Reference,
+        description="""
+        Reference to the HDF5 dataset storing the array, as 'file.h5#/path/to/dataset' with the file path relative
+        to the upload raw files.
+        """,
+    )
+
+    shape = Quantity(
+        type=np.int64,
+        shape=['*'],
+        description="""
+        Shape of the array. The first axis grows when appending chunks.
+        """,
+    )
+
+    chunk_shape = Quantity(
+        type=np.int64,
+        shape=['*'],
+        description="""
+        Shape of the chunks of the HDF5 dataset. By default, the chunks contain full rows along the first axis
+        and about 1 MiB of data.
+        """,
+    )
+
+    dtype = Quantity(
+        type=str,
+        description="""
+        NumPy data type of the array, e.g., 'float64' or 'complex128'.
+        """,
+    )
+
+    compression = Quantity(
+        type=MEnum('gzip', 'lzf'),
+        default='gzip',
+        description="""
+        Compression filter of the HDF5 dataset.
+        """,
+    )
+
+    array_unit = Quantity(
+        type=str,
+        description="""
+        Unit of the values of the array, e.g., 'joule'. Values are returned as pint quantities if defined.
+        """,
+    )
+
+    @contextmanager
+    def open_dataset(
+        self, logger: BoundLogger, mode: str = 'r'
+    ) -> Generator[Optional[Tuple[h5py.File, str]], None, None]:
+        """
+        Opens the HDF5 file of `reference` from the upload raw files through the archive context.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+            mode (str, optional): 'r' to read, or 'a' to create or modify the file.
+
+        Yields:
+            (Optional[Tuple[h5py.File, str]]): The open HDF5 file and the path of the dataset, or None if they could
+                not be resolved.
+        """
+        match = match_hdf5_reference(self.reference) if self.reference else None
+        context = self.m_root().m_context
+        if match is None or context is None:
+            logger.error(
+                'Could not resolve `ChunkedArray.reference` without an archive context.'
+            )
+            yield None
+            return
+        file_name, dataset_path = match['file_id'], match['path']
+        if mode == 'r':
+            if not context.raw_path_exists(file_name):
+                logger.error('Could not find the HDF5 file of the `ChunkedArray`.')
+                yield None
+                return
+            raw_mode = 'rb'
+        else:
+            raw_mode = 'r+b' if context.raw_path_exists(file_name) else 'wb'
+        with context.raw_file(file_name, raw_mode) as raw_file:
+            with h5py.File(raw_file, mode) as file:
+                yield file, dataset_path
+
+    def create(
+        self,
+        shape: Tuple[int, ...],
+        dtype: Any,
+        logger: BoundLogger,
+        chunk_shape: Optional[Tuple[int, ...]] = None,
+    ) -> bool:
+        """
+        Creates the (empty) HDF5 dataset of the array. The first axis can be extended by `append`. Existing datasets
+        are never overwritten.
+
+        Args:
+            shape (Tuple[int, ...]): The initial shape of the array.
+            dtype (Any): The NumPy data type of the array.
+            logger (BoundLogger): The logger to log messages.
+            chunk_shape (Optional[Tuple[int, ...]], optional): The shape of the chunks. Defaults to full rows
+                with about `_CHUNK_BYTES` bytes.
+
+        Returns:
+            (bool): True if the dataset was created.
+        """
+        shape = tuple(int(n) for n in shape)
+        dtype = np.dtype(dtype)
+        if chunk_shape is None:
+            row_bytes = dtype.itemsize * int(np.prod(shape[1:], dtype=np.int64))
+            chunk_shape = (max(1, _CHUNK_BYTES // max(row_bytes, 1)),) + shape[1:]
+        with self.open_dataset(logger, 'a') as opened:
+            if opened is None:
+                return False
+            file, dataset_path = opened
+            if dataset_path in file:
+                logger.error(
+                    'The HDF5 dataset of the `ChunkedArray` already exists and will not be overwritten.',
+                    reference=self.reference,
+                )
+                return False
+            file.create_dataset(
+                dataset_path,
+                shape=shape,
+                maxshape=(None,) + shape[1:],
+                dtype=dtype,
+                chunks=tuple(chunk_shape),
+                compression=self.compression,
+            )
+        self.dtype = dtype.name
+        self.shape = list(shape)
+        self.chunk_shape = list(chunk_shape)
+        return True
+
+    def _to_magnitude(self, values: Any) -> np.ndarray:
+        """
+        Converts the `values` to a NumPy array in the `array_unit`.
+        """
+        if isinstance(values, pint.Quantity):
+            values = (
+                values.to(self.array_unit).magnitude
+                if self.array_unit
+                else values.magnitude
+            )
+        return np.asarray(values, dtype=self.dtype)
+
+    def write(self, values: Any, logger: BoundLogger, start: int = 0) -> None:
+        """
+        Writes the `values` into the rows `start:start + len(values)` of the array, extending its first axis if
+        needed.
+
+        Args:
+            values (Any): The values (as an array or a pint quantity) to be written.
+            logger (BoundLogger): The logger to log messages.
+            start (int, optional): The first row written.
+        """
+        if self.dtype is None:
+            logger.error('The `ChunkedArray` dataset has not been created.')
+            return
+        values = self._to_magnitude(values)
+        stop = start + len(values)
+        with self.open_dataset(logger, 'a') as opened:
+            if opened is None:
+                return
+            file, dataset_path = opened
+            dataset = file[dataset_path]
+            if values.shape[1:] != dataset.shape[1:]:
+                logger.error(
+                    'The shape of the values does not match the shape of the `ChunkedArray`.'
+                )
+                return
+            if stop > dataset.shape[0]:
+                dataset.resize(stop, axis=0)
+            dataset[start:stop] = values
+            self.shape = list(dataset.shape)
+
+    def append(self, values: Any, logger: BoundLogger) -> None:
+        """
+        Appends the `values` as new rows at the end of the array.
+
+        Args:
+            values (Any): The values (as an array or a pint quantity) to be appended.
+            logger (BoundLogger): The logger to log messages.
+        """
+        self.write(
+            values, logger, start=int(self.shape[0]) if self.shape is not None else 0
+        )
+
+    def read(self, logger: BoundLogger, selection: Any = ()) -> Optional[Any]:
+        """
+        Reads a slice of the array lazily, i.e., only the chunks overlapping the `selection` are loaded.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+            selection (Any, optional): The NumPy-like selection, e.g., `np.s_[10:20, 0]`. Defaults to the full array.
+
+        Returns:
+            (Optional[Any]): The selected values, as a pint quantity if `array_unit` is defined.
+        """
+        with self.open_dataset(logger) as opened:
+            if opened is None:
+                return None
+            file, dataset_path = opened
+            if dataset_path not in file:
+                logger.error('Could not find the dataset of the `ChunkedArray`.')
+                return None
+            values = file[dataset_path][selection]
+        return values * ureg(self.array_unit) if self.array_unit else values
+
+    def iter_chunks(
+        self, logger: BoundLogger, chunk_size: Optional[int] = None
+    ) -> Generator[Tuple[slice, Any], None, None]:
+        """
+        Iterates over the array in chunks of rows, so that it can be processed without loading it in memory.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+            chunk_size (Optional[int], optional): The number of rows per chunk. Defaults to the rows of a stored chunk.
+
+        Yields:
+            (Tuple[slice, Any]): The slice of rows and their values.
+        """
+        if self.shape is None:
+            return
+        if chunk_size is None:
+            chunk_size = int(self.chunk_shape[0]) if self.chunk_shape is not None else 1
+        for start in range(0, int(self.shape[0]), chunk_size):
+            rows = slice(start, min(start + chunk_size, int(self.shape[0])))
+            values = self.read(logger, rows)
+            if values is None:
+                return
+            yield rows, values
+
+    def normalize(self, archive, logger) -> None:
+        super().normalize(archive, logger)
+
+        # Synchronize the metadata with the stored dataset
+        if self.reference is None:
+            return
+        with self.open_dataset(logger) as opened:
+            if opened is None:
+                return
+            file, dataset_path = opened
+            dataset = file.get(dataset_path)
+            if not isinstance(dataset, h5py.Dataset):
+                logger.warning('Could not find the dataset of the `ChunkedArray`.')
+                return
+            self.shape = list(dataset.shape)
+            self.dtype = dataset.dtype.name
+            if dataset.chunks is not None:
+                self.chunk_shape = list(dataset.chunks)
+
+
+class SCFHistory(ArchiveSection):
+    """
+    Section containing the history of the self-consistent field (SCF) iterations of a calculation, and the
+    evaluation of its convergence against the thresholds defined in `SelfConsistency`. A calculation is converged
+    if its last iteration is not above `n_max_iterations` and its total energy change or its charge density change
+    is below the threshold. Crossing a threshold at an intermediate iteration does not make a calculation converged.
+    """
+
+    n_iterations = Quantity(
+        type=np.int32,
+        description="""
+        Number of self-consistent iterations.
+        """,
+    )
+
+    energies = Quantity(
+        type=np.float64,
+        shape=['n_iterations'],
+        unit='joule',
+        description="""
+        Total energy at each self-consistent iteration.
+        """,
+    )
+
+    charge_density_changes = Quantity(
+        type=np.float64,
+        shape=['n_iterations'],
+        description="""
+        Average charge density change with respect to the previous self-consistent iteration.
+        """,
+    )
+
+    is_converged = Quantity(
+        type=bool,
+        description="""
+        If the SCF iterations converged according to the thresholds in `SelfConsistency`.
+        """,
+    )
+
+    convergence_iteration = Quantity(
+        type=np.int32,
+        description="""
+        Iteration (starting from 1) from which all the SCF iterations up to the last one satisfy the convergence
+        thresholds. Only defined if `is_converged`.
+        """,
+    )
+
+    first_threshold_iteration = Quantity(
+        type=np.int32,
+        description="""
+        First iteration (starting from 1) satisfying the convergence thresholds, even if the SCF iterations
+        diverged afterwards.
+        """,
+    )
+
+    final_energy_change = Quantity(
+        type=np.float64,
+        unit='joule',
+        description="""
+        Absolute total energy change between the last two self-consistent iterations.
+        """,
+    )
+
+    max_energy_change = Quantity(
+        type=np.float64,
+        unit='joule',
+        description="""
+        Maximum absolute total energy change between two subsequent self-consistent iterations.
+        """,
+    )
+
+    mean_energy_change = Quantity(
+        type=np.float64,
+        unit='joule',
+        description="""
+        Mean absolute total energy change between two subsequent self-consistent iterations.
+        """,
+    )
+
+    final_charge_density_change = Quantity(
+        type=np.float64,
+        description="""
+        Charge density change at the last self-consistent iteration.
+        """,
+    )
+
+    max_charge_density_change = Quantity(
+        type=np.float64,
+        description="""
+        Maximum charge density change over the self-consistent iterations.
+        """,
+    )
+
+    mean_charge_density_change = Quantity(
+        type=np.float64,
+        description="""
+        Mean charge density change over the self-consistent iterations.
+        """,
+    )
+
+    @staticmethod
+    def evaluate_convergence(
+        energies: Optional[Any],
+        charge_density_changes: Optional[Any],
+        threshold_energy_change: Optional[Any] = None,
+        threshold_charge_density_change: Optional[float] = None,
+        n_max_iterations: Optional[int] = None,
+        previous_energies: Optional[Any] = None,
+        iteration_offset: int = 0,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Evaluates the SCF convergence of one or many calculations at once. A calculation is converged if its last
+        iteration satisfies the thresholds within `n_max_iterations`. The arrays have the iterations
+        in their last axis, and histories of different lengths are padded with NaN. Energies are in joule if not
+        given as pint quantities.
+
+        The iterations can also be evaluated incrementally, in chunks: `previous_energies` is then the last
+        energy of the previous chunk, and `iteration_offset` its number of iterations.
+
+        Args:
+            energies (Optional[Any]): The total energies, with shape (..., n_iterations).
+            charge_density_changes (Optional[Any]): The charge density changes, with shape (..., n_iterations).
+            threshold_energy_change (Optional[Any], optional): The threshold for the total energy change.
+            threshold_charge_density_change (Optional[float], optional): The threshold for the charge density change.
+            n_max_iterations (Optional[int], optional): The maximum number of allowed iterations.
+            previous_energies (Optional[Any], optional): The energies preceding the first iteration, with shape (...).
+            iteration_offset (int, optional): The number of iterations preceding the first one.
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]): The convergence flags, the convergence
+                iterations (the first of the final iterations satisfying the thresholds, or -1 if not converged), the
+                first iterations satisfying the thresholds (or -1), and the residual statistics, i.e., the `final`,
+                `max`, `sum` and `count` of the `energy_change` and `charge_density_change` (the sums and counts
+                allow to merge the statistics of subsequent chunks).
+        """
+
+        def to_magnitude(values: Any) -> Optional[np.ndarray]:
+            if values is None:
+                return None
+            if isinstance(values, pint.Quantity):
+                values = values.to('joule').magnitude
+            return np.asarray(values, dtype=np.float64)
+
+        energies = to_magnitude(energies)
+        charge_density_changes = to_magnitude(charge_density_changes)
+        reference = energies if energies is not None else charge_density_changes
+        if reference is None:
+            return (
+                np.zeros(0, dtype=bool),
+                np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=np.int32),
+                {},
+            )
+        batch_shape, n_iterations = reference.shape[:-1], reference.shape[-1]
+
+        # Absolute energy changes with respect to the previous iteration
+        energy_changes = np.full(reference.shape, np.nan)
+        if energies is not None:
+            previous = to_magnitude(previous_energies)
+            if previous is None:
+                previous = np.full(batch_shape, np.nan)
+            energy_changes = np.abs(
+                np.diff(energies, axis=-1, prepend=previous[..., np.newaxis])
+            )
+        if charge_density_changes is None:
+            charge_density_changes = np.full(reference.shape, np.nan)
+        charge_density_changes = np.abs(charge_density_changes)
+
+        # Comparisons with NaN are False, so missing values and padding never converge
+        with np.errstate(invalid='ignore'):
+            converged = np.zeros(reference.shape, dtype=bool)
+            if threshold_energy_change is not None:
+                converged |= energy_changes < to_magnitude(threshold_energy_change)
+            if threshold_charge_density_change is not None:
+                converged |= charge_density_changes < threshold_charge_density_change
+        iterations = iteration_offset + np.arange(1, n_iterations + 1, dtype=np.int32)
+        if n_max_iterations is not None:
+            converged &= iterations <= n_max_iterations
+
+        # Only the last (non-padded) iteration decides the convergence
+        positions = np.arange(n_iterations)
+        is_valid = np.isfinite(reference)
+        last = n_iterations - 1 - np.argmax(is_valid[..., ::-1], axis=-1)
+        is_converged = (
+            is_valid.any(axis=-1)
+            & np.take_along_axis(converged, last[..., np.newaxis], axis=-1)[..., 0]
+        )
+        # Start of the final run of iterations satisfying the thresholds
+        last_unconverged = np.where(
+            ~converged & (positions <= last[..., np.newaxis]), positions, -1
+        ).max(axis=-1)
+        convergence_iterations = np.where(
+            is_converged, iteration_offset + last_unconverged + 2, -1
+        ).astype(np.int32)
+        first_threshold_iterations = np.where(
+            converged.any(axis=-1), iterations[np.argmax(converged, axis=-1)], -1
+        ).astype(np.int32)
+
+        statistics = {}
+        for name, changes in (
+            ('energy_change', energy_changes),
+            ('charge_density_change', charge_density_changes),
+        ):
+            is_finite = np.isfinite(changes)
+            count = is_finite.sum(axis=-1)
+            last = n_iterations - 1 - np.argmax(is_finite[..., ::-1], axis=-1)
+            final = np.take_along_axis(changes, last[..., np.newaxis], axis=-1)[..., 0]
+            statistics[f'final_{name}'] = np.where(count > 0, final, np.nan)
+            statistics[f'max_{name}'] = np.fmax.reduce(changes, axis=-1)
+            statistics[f'sum_{name}'] = np.where(is_finite, changes, 0.0).sum(axis=-1)
+            statistics[f'count_{name}'] = count
+        return (
+            is_converged,
+            convergence_iterations,
+            first_threshold_iterations,
+            statistics,
+        )
+
+    def resolve_self_consistency(self) -> Optional[SelfConsistency]:
+        """
+        Resolves the `SelfConsistency` settings from the last `ModelMethod` of the parent `Simulation`.
+
+        Returns:
+            (Optional[SelfConsistency]): The `SelfConsistency` section, or None if not found.
+        """
+        model_methods = self.m_xpath('m_parent.m_parent.model_method', dict=False)
+        if not model_methods:
+            return None
+        return next(
+            (
+                settings
+                for settings in reversed(model_methods[-1].numerical_settings)
+                if isinstance(settings, SelfConsistency)
+            ),
+            None,
+        )
+
+    def append_iterations(
+        self,
+        logger: BoundLogger,
+        energies: Optional[Any] = None,
+        charge_density_changes: Optional[Any] = None,
+        self_consistency: Optional[SelfConsistency] = None,
+    ) -> None:
+        """
+        Appends streamed SCF iterations to the history and updates the convergence evaluation incrementally,
+        i.e., without re-evaluating the previous iterations. The convergence is re-checked at the new last iteration.
+
+        Args:
+            logger (BoundLogger): The logger to log messages.
+            energies (Optional[Any], optional): The total energies of the new iterations.
+            charge_density_changes (Optional[Any], optional): The charge density changes of the new iterations.
+            self_consistency (Optional[SelfConsistency], optional): The convergence settings. Defaults to the
+                ones resolved from the parent `Simulation`.
+        """
+        if energies is None and charge_density_changes is None:
+            logger.warning('Could not find the new SCF iterations to append.')
+            return
+        if self_consistency is None:
+            self_consistency = self.resolve_self_consistency()
+        if self_consistency is None:
+            logger.warning('Could not resolve the `SelfConsistency` settings.')
+            return
+
+        n_previous = self.n_iterations or 0
+        previous_energies = (
+            self.energies[-1] if self.energies is not None and n_previous else None
+        )
+        (
+            is_converged,
+            convergence_iteration,
+            first_threshold_iteration,
+            statistics,
+        ) = self.evaluate_convergence(
+            energies,
+            charge_density_changes,
+            threshold_energy_change=self_consistency.threshold_energy_change,
+            threshold_charge_density_change=self_consistency.threshold_charge_density_change,
+            n_max_iterations=self_consistency.n_max_iterations,
+            previous_energies=previous_energies,
+            iteration_offset=n_previous,
+        )
+
+        # Extend the stored iterations
+        for name, values in (
+            ('energies', energies),
+            ('charge_density_changes', charge_density_changes),
+        ):
+            if values is None:
+                continue
+            if isinstance(values, pint.Quantity):
+                values = values.to('joule').magnitude
+            previous = getattr(self, name)
+            if isinstance(previous, pint.Quantity):
+                previous = previous.to('joule').magnitude
+            values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+            if previous is not None:
+                values = np.concatenate([previous, values])
+            setattr(self, name, values * ureg.joule if name == 'energies' else values)
+        self.n_iterations = n_previous + int(
+            np.size(energies if energies is not None else charge_density_changes)
+        )
+
+        # Merge the statistics with the ones of the previous iterations
+        cached = self.m_cache.get('scf_statistics')
+        if cached is not None:
+            for key, value in statistics.items():
+                if key.startswith('final_'):
+                    statistics[key] = np.where(np.isnan(value), cached[key], value)
+                elif key.startswith('max_'):
+                    statistics[key] = np.fmax(value, cached[key])
+                else:
+                    statistics[key] = value + cached[key]
+        self.m_cache['scf_statistics'] = statistics
+
+        # A final run of converged iterations starting with the new ones continues the previous run
+        if (
+            is_converged
+            and convergence_iteration == n_previous + 1
+            and self.is_converged
+        ):
+            convergence_iteration = self.convergence_iteration
+        self.is_converged = bool(is_converged)
+        self.convergence_iteration = (
+            int(convergence_iteration) if is_converged else None
+        )
+        if self.first_threshold_iteration is None and first_threshold_iteration != -1:
+            self.first_threshold_iteration = int(first_threshold_iteration)
+        self.set_statistics(statistics)
+
+    def set_statistics(self, statistics: Dict[str, np.ndarray]) -> None:
+        """
+        Sets the residual statistics quantities from the output of `evaluate_convergence`.
+
+        Args:
+            statistics (Dict[str, np.ndarray]): The residual statistics of a single calculation.
+        """
+        for name, unit in (('energy_change', ureg.joule), ('charge_density_change', 1)):
+            count = statistics[f'count_{name}']
+            if not count:
+                continue
+            setattr(self, f'final_{name}', float(statistics[f'final_{name}']) * unit)
+            setattr(self, f'max_{name}', float(statistics[f'max_{name}']) * unit)
+            setattr(
+                self, f'mean_{name}', float(statistics[f'sum_{name}'] / count) * unit
+            )
+
+    def normalize(self, archive, logger) -> None:
+        super().normalize(archive, logger)
+
+        # Re-evaluate the convergence of the full history
+        if self.energies is None and self.charge_density_changes is None:
+            return
+        self_consistency = self.resolve_self_consistency()
+        if self_consistency is None:
+            logger.warning('Could not resolve the `SelfConsistency` settings.')
+            return
+        (
+            is_converged,
+            convergence_iteration,
+            first_threshold_iteration,
+            statistics,
+        ) = self.evaluate_convergence(
+            self.energies,
+            self.charge_density_changes,
+            threshold_energy_change=self_consistency.threshold_energy_change,
+            threshold_charge_density_change=self_consistency.threshold_charge_density_change,
+            n_max_iterations=self_consistency.n_max_iterations,
+        )
+        self.n_iterations = len(
+            self.energies if self.energies is not None else self.charge_density_changes
+        )
+        self.is_converged = bool(is_converged)
+        self.convergence_iteration = (
+            int(convergence_iteration) if is_converged else None
+        )
+        self.first_threshold_iteration = (
+            int(first_threshold_iteration) if first_threshold_iteration != -1 else None
+        )
+        self.m_cache['scf_statistics'] = statistics
+        self.set_statistics(statistics)
+
+
+def _iter_row_chunks(
+    values: Union[ChunkedArray, Any], logger: BoundLogger, chunk_size: int
+) -> Generator[Tuple[slice, np.ndarray], None, None]:
+    """
+    Iterates over the rows (first axis) of an in-memory or a `ChunkedArray` array in chunks of at most
+    `chunk_size` rows. Pint quantities are converted to joules.
+    """
+    if isinstance(values, ChunkedArray):
+        chunks = values.iter_chunks(logger)
+    else:
+        chunks = iter([(slice(0, len(values)), values)])
+    for rows, chunk in chunks:
+        if isinstance(chunk, pint.Quantity):
+            chunk = chunk.to('joule').magnitude
+        chunk = np.asarray(chunk)
+        for start in range(0, len(chunk), chunk_size):
+            stop = min(start + chunk_size, len(chunk))
+            yield slice(rows.start + start, rows.start + stop), chunk[start:stop]
+
+
+class DensityOfStates(ArchiveSection):
+    """
+    Section containing the electronic density of states (DOS) generated from the eigenvalues on a `KMesh`, see
+    `Outputs.generate_dos`. The DOS is normalized to one state per band and spin channel.
+    """
+
+    method = Quantity(
+        type=MEnum('gaussian', 'lorentzian', 'tetrahedron'),
+        description="""
+        Method used to compute the DOS from the eigenvalues: broadening of each eigenvalue by a Gaussian or a
+        Lorentzian, or the linear tetrahedron method.
+        """,
+    )
+
+    broadening = Quantity(
+        type=np.float64,
+        unit='joule',
+        description="""
+        Full-width at half maximum of the Gaussian or Lorentzian broadening.
+        """,
+    )
+
+    n_spin_channels = Quantity(
+        type=np.int32,
+        description="""
+        Number of spin channels.
+        """,
+    )
+
+    n_energies = Quantity(
+        type=np.int32,
+        description="""
+        Number of energies in the energy grid.
+        """,
+    )
+
+    energies = Quantity(
+        type=np.float64,
+        shape=['n_energies'],
+        unit='joule',
+        description="""
+        Energy grid at which the DOS is evaluated.
+        """,
+    )
+
+    value = Quantity(
+        type=np.float64,
+        shape=['n_spin_channels', 'n_energies'],
+        unit='1/joule',
+        description="""
+        DOS of each spin channel.
+        """,
+    )
+
+    integrated_value = Quantity(
+        type=np.float64,
+        shape=['n_spin_channels', 'n_energies'],
+        description="""
+        Integrated DOS of each spin channel, i.e., the number of states per spin channel below each energy.
+        """,
+    )
+
+    n_orbitals = Quantity(
+        type=np.int32,
+        description="""
+        Number of orbitals onto which the DOS is projected.
+        """,
+    )
+
+    orbitals_ref = Quantity(
+        type=OrbitalsState,
+        shape=['n_orbitals'],
+        description="""
+        References to the `OrbitalsState` sections onto which the DOS is projected, i.e., `TB.orbitals_ref`.
+        """,
+    )
+
+    projected_value = Quantity(
+        type=np.float64,
+        shape=['n_spin_channels', 'n_orbitals', 'n_energies'],
+        unit='1/joule',
+        description="""
+        DOS of each spin channel projected onto the orbitals in `orbitals_ref`.
+        """,
+    )
+
+    @staticmethod
+    def compute_broadening_kernels(
+        energies: np.ndarray, energy_grid: np.ndarray, method: str, broadening: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the broadening functions of the `energies` and their integrals on the `energy_grid`.
+
+        Args:
+            energies (np.ndarray): The (n) energies in joules.
+            energy_grid (np.ndarray): The (n_energies) energy grid in joules.
+            method (str): The broadening function, 'gaussian' or 'lorentzian'.
+            broadening (float): The full-width at half maximum in joules.
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray]): The (n, n_energies) broadening functions and their integrals.
+        """
+        x = energy_grid[np.newaxis, :] - energies[:, np.newaxis]
+        if method == 'gaussian':
+            sigma = broadening / (2 * np.sqrt(2 * np.log(2)))
+            kernel = np.exp(-0.5 * (x / sigma) ** 2) / (sigma * np.sqrt(2 * np.pi))
+            integral = 0.5 * (1 + erf(x / (np.sqrt(2) * sigma)))
+        else:
+            gamma = broadening / 2
+            kernel = gamma / (np.pi * (x**2 + gamma**2))
+            integral = 0.5 + np.arctan(x / gamma) / np.pi
+        return kernel, integral
+
+    def normalize(self, archive, logger) -> None:
+        super().normalize(archive, logger)
+
 
 class Outputs(ArchiveSection):
-    """ """
+    """
+    Base section for the outputs of a simulation. Large array properties can be stored in chunked and compressed
+    external HDF5 files in `arrays`, see `ChunkedArray`.
+    """
 
     normalizer_level = 2
 
+    is_converged = Quantity(
+        type=bool,
+        description="""
+        If the calculation of the outputs converged. For self-consistent calculations, this is resolved from
+        `scf_history` and the `SelfConsistency` settings.
+        """,
+    )
+
+    arrays = SubSection(sub_section=ChunkedArray.m_def, repeats=True)
+
+    scf_history = SubSection(sub_section=SCFHistory.m_def, repeats=False)
+
+    density_of_states = SubSection(sub_section=DensityOfStates.m_def, repeats=True)
+
+    def get_array(self, name: str) -> Optional[ChunkedArray]:
+        """
+        Gets the `ChunkedArray` of the array property `name`.
+
+        Args:
+            name (str): The name of the array property.
+
+        Returns:
+            (Optional[ChunkedArray]): The `ChunkedArray` section, or None if not found.
+        """
+        return next((array for array in self.arrays if array.name == name), None)
+
+    def store_array(
+        self,
+        name: str,
+        values: Any,
+        file_name: str,
+        logger: BoundLogger,
+        unit: Optional[str] = None,
+        compression: str = 'gzip',
+    ) -> Optional[ChunkedArray]:
+        """
+        Stores an array property in a chunked HDF5 dataset in the upload raw file `file_name`. The dataset path is
+        the archive path of this section followed by `name`, so that different `Outputs` sections never share a
+        dataset. The `values` can be an array, a pint quantity, or an iterable of chunks of rows (e.g., a
+        generator), so that large arrays are written without being held in memory at once.
+
+        Args:
+            name (str): The name of the array property.
+            values (Any): The array or the iterable of chunks of rows.
+            file_name (str): The path of the HDF5 file relative to the upload raw files.
+            logger (BoundLogger): The logger to log messages.
+            unit (Optional[str], optional): The unit of the stored values.
+            compression (str, optional): The compression filter. Defaults to 'gzip'.
+
+        Returns:
+            (Optional[ChunkedArray]): The `ChunkedArray` section referencing the stored array.
+        """
+        chunks = (
+            iter([values])
+            if isinstance(values, (np.ndarray, pint.Quantity))
+            else iter(values)
+        )
+        first = next(chunks, None)
+        if first is None:
+            logger.warning('Could not store an empty array.')
+            return None
+        if unit is None and isinstance(first, pint.Quantity):
+            unit = str(first.units)
+        magnitude = first.magnitude if isinstance(first, pint.Quantity) else first
+        magnitude = np.asarray(magnitude)
+
+        if self.get_array(name) is not None:
+            logger.error(
+                'The array property is already stored in `Outputs.arrays`.', name=name
+            )
+            return None
+        array = ChunkedArray(name=name, compression=compression, array_unit=unit)
+        self.arrays.append(array)
+        array.reference = f'{file_name}#{self.m_path()}/{name}'
+        if not array.create((0,) + magnitude.shape[1:], magnitude.dtype, logger):
+            self.m_remove_sub_section(Outputs.arrays, len(self.arrays) - 1)
+            return None
+        array.append(first, logger)
+        for chunk in chunks:
+            array.append(chunk, logger)
+        return array
+
+    def resolve_dos_settings(
+        self,
+    ) -> Tuple[Optional[KMesh], Optional[pint.Quantity], Optional[list]]:
+        """
+        Resolves the `KMesh`, the broadening of `ExcitedStateMethodology` and the `TB.orbitals_ref` from the last
+        `ModelMethod` of the parent `Simulation`.
+
+        Returns:
+            (Tuple[Optional[KMesh], Optional[pint.Quantity], Optional[list]]): The k-mesh, the broadening and the
+                orbital references, or None if not found.
+        """
+        model_methods = self.m_xpath('m_parent.model_method', dict=False)
+        if not model_methods:
+            return None, None, None
+        model_method = model_methods[-1]
+        k_mesh = next(
+            (
+                settings
+                for settings in reversed(model_method.numerical_settings)
+                if isinstance(settings, KMesh)
+            ),
+            None,
+        )
+        broadening = (
+            model_method.broadening
+            if isinstance(model_method, ExcitedStateMethodology)
+            else None
+        )
+        orbitals_ref = (
+            model_method.orbitals_ref if isinstance(model_method, TB) else None
+        )
+        return k_mesh, broadening, orbitals_ref
+
+    def generate_dos(
+        self,
+        eigenvalues: Union[ChunkedArray, Any],
+        logger: BoundLogger,
+        method: str = 'gaussian',
+        broadening: Optional[pint.Quantity] = None,
+        energy_grid: Optional[pint.Quantity] = None,
+        projections: Optional[Union[ChunkedArray, Any]] = None,
+        k_mesh: Optional[KMesh] = None,
+    ) -> Optional[DensityOfStates]:
+        """
+        Generates the density of states (DOS) from the `eigenvalues` at the points of the `KMesh`, weighted by its
+        `weights`, and appends it to `density_of_states`. The broadened DOS is accumulated in chunks of k-points,
+        so that in-memory or `ChunkedArray` eigenvalues never have to be loaded at once. The tetrahedron DOS is
+        computed with `KMesh.compute_tetrahedron_dos` for each spin channel: the tetrahedra connect arbitrary
+        irreducible points, so the (n_points, n_bands) eigenvalues of one spin channel are loaded in memory at once
+        (only the tetrahedra are processed in chunks).
+
+        The eigenvalues have the k-points in their first axis, i.e., a (n_points, n_spin_channels, n_bands) or
+        (n_points, n_bands) shape, and the `projections` onto the `TB.orbitals_ref` the shape of the eigenvalues
+        plus a last (n_orbitals) axis.
+
+        Args:
+            eigenvalues (Union[ChunkedArray, Any]): The eigenvalues, as a pint quantity, in joules or stored in a
+                `ChunkedArray`.
+            logger (BoundLogger): The logger to log messages.
+            method (str, optional): The DOS method, 'gaussian', 'lorentzian' or 'tetrahedron'.
+            broadening (Optional[pint.Quantity], optional): The full-width at half maximum of the broadening.
+                Defaults to `ExcitedStateMethodology.broadening`.
+            energy_grid (Optional[pint.Quantity], optional): The energy grid. Defaults to `_N_DOS_ENERGIES` energies
+                spanning the eigenvalues.
+            projections (Optional[Union[ChunkedArray, Any]], optional): The weights of the eigenstates on the
+                orbitals.
+            k_mesh (Optional[KMesh], optional): The k-mesh of the eigenvalues. Defaults to the one resolved from
+                the parent `Simulation`, or to equally weighted points if not found.
+
+        Returns:
+            (Optional[DensityOfStates]): The generated `DensityOfStates` section.
+        """
+        resolved_k_mesh, resolved_broadening, orbitals_ref = self.resolve_dos_settings()
+        k_mesh = k_mesh if k_mesh is not None else resolved_k_mesh
+        broadening = broadening if broadening is not None else resolved_broadening
+        if method != 'tetrahedron':
+            if broadening is None:
+                logger.warning('Could not resolve the broadening of the DOS.')
+                return None
+            broadening = broadening.to('joule').magnitude
+        else:
+            if k_mesh is None:
+                logger.warning('Could not resolve the `KMesh` of the tetrahedron DOS.')
+                return None
+            broadening = 0.0
+            if projections is not None:
+                logger.warning(
+                    'The projected DOS is only supported for the broadened DOS.'
+                )
+                projections = None
+
+        shape = tuple(
+            eigenvalues.shape
+            if isinstance(eigenvalues, ChunkedArray)
+            else np.shape(eigenvalues)
+        )
+        if len(shape) not in (2, 3):
+            logger.error('The shape of the eigenvalues is not supported.')
+            return None
+        n_points, n_bands = shape[0], shape[-1]
+        n_spin_channels = shape[1] if len(shape) == 3 else 1
+        if k_mesh is not None:
+            weights = k_mesh.get_weights(logger)
+        else:
+            weights = np.full(n_points, 1 / n_points)
+        if weights is None or len(weights) != n_points:
+            logger.error('The eigenvalues do not match the points of the `KMesh`.')
+            return None
+        if projections is not None:
+            if orbitals_ref is None or (
+                len(orbitals_ref)
+                != (
+                    projections.shape
+                    if isinstance(projections, ChunkedArray)
+                    else np.shape(projections)
+                )[-1]
+            ):
+                logger.warning(
+                    'The projections do not match the orbitals in `TB.orbitals_ref`.'
+                )
+                projections = None
+
+        chunk_size = max(
+            1,
+            _DOS_CHUNK_SIZE
+            // (
+                n_spin_channels
+                * n_bands
+                * (len(energy_grid) if energy_grid is not None else _N_DOS_ENERGIES)
+            ),
+        )
+        if energy_grid is None:
+            # First pass over the eigenvalues to resolve their range
+            e_min, e_max = np.inf, -np.inf
+            for _, chunk in _iter_row_chunks(eigenvalues, logger, chunk_size):
+                e_min, e_max = min(e_min, chunk.min()), max(e_max, chunk.max())
+            margin = _DOS_ENERGY_MARGIN * broadening
+            energy_grid = np.linspace(e_min - margin, e_max + margin, _N_DOS_ENERGIES)
+        else:
+            energy_grid = energy_grid.to('joule').magnitude
+
+        dos = np.zeros((n_spin_channels, len(energy_grid)))
+        idos = np.zeros((n_spin_channels, len(energy_grid)))
+        pdos = None
+        if method == 'tetrahedron':
+            for spin in range(n_spin_channels):
+                if isinstance(eigenvalues, ChunkedArray):
+                    selection = np.s_[:, spin] if len(shape) == 3 else ()
+                    energies = eigenvalues.read(logger, selection)
+                else:
+                    energies = eigenvalues[:, spin] if len(shape) == 3 else eigenvalues
+                if isinstance(energies, pint.Quantity):
+                    energies = energies.to('joule').magnitude
+                result = k_mesh.compute_tetrahedron_dos(energies, energy_grid, logger)
+                if result is None:
+                    return None
+                dos[spin], idos[spin] = result
+        else:
+            if projections is not None:
+                pdos = np.zeros((n_spin_channels, len(orbitals_ref), len(energy_grid)))
+            for rows, chunk in _iter_row_chunks(eigenvalues, logger, chunk_size):
+                chunk = chunk.reshape(len(chunk), n_spin_channels, n_bands)
+                chunk_weights = np.repeat(weights[rows], n_bands)
+                if pdos is not None:
+                    projection_chunk = (
+                        projections.read(logger, rows)
+                        if isinstance(projections, ChunkedArray)
+                        else projections[rows]
+                    )
+                    projection_chunk = np.asarray(projection_chunk).reshape(
+                        len(chunk), n_spin_channels, n_bands, -1
+                    )
+                for spin in range(n_spin_channels):
+                    kernel, integral = DensityOfStates.compute_broadening_kernels(
+                        chunk[:, spin].ravel(), energy_grid, method, broadening
+                    )
+                    dos[spin] += chunk_weights @ kernel
+                    idos[spin] += chunk_weights @ integral
+                    if pdos is not None:
+                        orbital_weights = chunk_weights[
+                            :, np.newaxis
+                        ] * projection_chunk[:, spin].reshape(len(chunk_weights), -1)
+                        pdos[spin] += orbital_weights.T @ kernel
+
+        density_of_states = DensityOfStates(
+            method=method,
+            n_spin_channels=n_spin_channels,
+            n_energies=len(energy_grid),
+            energies=energy_grid * ureg.joule,
+            value=dos / ureg.joule,
+            integrated_value=idos,
+        )
+        if method != 'tetrahedron':
+            density_of_states.broadening = broadening * ureg.joule
+        if pdos is not None:
+            density_of_states.n_orbitals = len(orbitals_ref)
+            density_of_states.orbitals_ref = orbitals_ref
+            density_of_states.projected_value = pdos / ureg.joule
+        self.density_of_states.append(density_of_states)
+        return density_of_states
+
     def normalize(self, archive, logger) -> None:
         super().normalize(archive, logger)
         self.logger = logger
+
+        if self.is_converged is None and self.scf_history is not None:
+            self.is_converged = self.scf_history.is_converged
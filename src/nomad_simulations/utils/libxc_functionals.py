@@ -0,0 +1,321 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+
+
+class LibxcFunctional(NamedTuple):
+    """
+    Registry entry of a libxc functional (see https://www.tddft.org/programs/libxc/functionals/).
+
+    Attributes:
+        family (str): The libxc family, 'LDA', 'GGA', 'MGGA', 'HYB_GGA' or 'HYB_MGGA'.
+        jacobs_ladder (str): The rung in Jacob's ladder, as defined in `DFT.jacobs_ladder`.
+        exact_exchange_mixing_factor (Optional[float]): The fraction of exact exchange (the
+        short-range one for range-separated hybrids).
+        exact_exchange_long_range (Optional[float]): The fraction of long-range exact exchange for
+        range-separated hybrids.
+        range_separation_parameter (Optional[float]): The range-separation parameter omega (in 1/bohr)
+        for range-separated hybrids.
+    """
+
+    family: str
+    jacobs_ladder: str
+    exact_exchange_mixing_factor: Optional[float] = None
+    exact_exchange_long_range: Optional[float] = None
+    range_separation_parameter: Optional[float] = None
+
+
+# Mapping of the libxc family (name prefix) to the rung in Jacob's ladder
+LIBXC_FAMILY_JACOBS_LADDER: Mapping[str, str] = MappingProxyType(
+    {
+        'LDA': 'LDA',
+        'GGA': 'GGA',
+        'MGGA': 'metaGGA',
+        'HYB_MGGA': 'hyperGGA',
+        'HYB_GGA': 'hybrid',
+    }
+)
+
+# Order of the rungs used to select the highest one in a combination of functionals
+JACOBS_LADDER_ORDER: Mapping[str, int] = MappingProxyType(
+    {rung: i for i, rung in enumerate(LIBXC_FAMILY_JACOBS_LADDER.values())}
+)
+
+_LDA_FUNCTIONALS = (
+    'LDA_X',
+    'LDA_X_2D',
+    'LDA_C_WIGNER',
+    'LDA_C_RPA',
+    'LDA_C_HL',
+    'LDA_C_GL',
+    'LDA_C_XALPHA',
+    'LDA_C_VWN',
+    'LDA_C_VWN_RPA',
+    'LDA_C_VWN_1',
+    'LDA_C_VWN_2',
+    'LDA_C_VWN_3',
+    'LDA_C_VWN_4',
+    'LDA_C_PZ',
+    'LDA_C_PZ_MOD',
+    'LDA_C_OB_PZ',
+    'LDA_C_PW',
+    'LDA_C_PW_MOD',
+    'LDA_C_OB_PW',
+    'LDA_C_PW_RPA',
+    'LDA_C_VBH',
+    'LDA_C_ML1',
+    'LDA_C_ML2',
+    'LDA_C_GOMBAS',
+    'LDA_C_CHACHIYO',
+    'LDA_C_PK09',
+    'LDA_C_RC04',
+    'LDA_C_2D_AMGB',
+    'LDA_XC_TETER93',
+    'LDA_XC_KSDT',
+    'LDA_XC_ZLP',
+)
+
+_GGA_FUNCTIONALS = (
+    'GGA_X_PBE',
+    'GGA_X_PBE_R',
+    'GGA_X_PBE_SOL',
+    'GGA_X_PBE_JSJR',
+    'GGA_X_PBE_MOL',
+    'GGA_X_PBEA',
+    'GGA_X_PBEINT',
+    'GGA_X_PBEK1_VDW',
+    'GGA_X_MPBE',
+    'GGA_X_XPBE',
+    'GGA_X_APBE',
+    'GGA_X_RPBE',
+    'GGA_X_B86',
+    'GGA_X_B86_MGC',
+    'GGA_X_B88',
+    'GGA_X_OPTB88_VDW',
+    'GGA_X_OPTPBE_VDW',
+    'GGA_X_OPTX',
+    'GGA_X_PW86',
+    'GGA_X_PW91',
+    'GGA_X_WC',
+    'GGA_X_AM05',
+    'GGA_X_HTBS',
+    'GGA_X_C09X',
+    'GGA_X_SOGGA',
+    'GGA_X_SOGGA11',
+    'GGA_X_G96',
+    'GGA_X_LB',
+    'GGA_X_LBM',
+    'GGA_X_FT97_A',
+    'GGA_X_FT97_B',
+    'GGA_X_HCTH_A',
+    'GGA_X_N12',
+    'GGA_X_RGE2',
+    'GGA_X_Q2D',
+    'GGA_C_PBE',
+    'GGA_C_PBE_SOL',
+    'GGA_C_PBE_JRGX',
+    'GGA_C_PBE_MOL',
+    'GGA_C_PBEINT',
+    'GGA_C_APBE',
+    'GGA_C_XPBE',
+    'GGA_C_SPBE',
+    'GGA_C_LYP',
+    'GGA_C_P86',
+    'GGA_C_PW91',
+    'GGA_C_AM05',
+    'GGA_C_SOGGA11',
+    'GGA_C_WI',
+    'GGA_C_WL',
+    'GGA_C_OP_B88',
+    'GGA_C_FT97',
+    'GGA_C_REGTPSS',
+    'GGA_C_N12',
+    'GGA_C_Q2D',
+    'GGA_XC_HCTH_93',
+    'GGA_XC_HCTH_120',
+    'GGA_XC_HCTH_147',
+    'GGA_XC_HCTH_407',
+    'GGA_XC_EDF1',
+    'GGA_XC_XLYP',
+    'GGA_XC_KT2',
+    'GGA_XC_B97_D',
+    'GGA_XC_B97_GGA1',
+    'GGA_XC_PBE1W',
+    'GGA_XC_PBELYP1W',
+    'GGA_XC_MPWLYP1W',
+    'GGA_XC_MOHLYP',
+    'GGA_XC_OBLYP_D',
+    'GGA_XC_BEEFVDW',
+    'GGA_XC_VV10',
+)
+
+_MGGA_FUNCTIONALS = (
+    'MGGA_X_TPSS',
+    'MGGA_X_REVTPSS',
+    'MGGA_X_PKZB',
+    'MGGA_X_SCAN',
+    'MGGA_X_RSCAN',
+    'MGGA_X_R2SCAN',
+    'MGGA_X_REVSCAN',
+    'MGGA_X_MS0',
+    'MGGA_X_MS1',
+    'MGGA_X_MS2',
+    'MGGA_X_MVS',
+    'MGGA_X_TM',
+    'MGGA_X_BR89',
+    'MGGA_X_BJ06',
+    'MGGA_X_TB09',
+    'MGGA_X_RPP09',
+    'MGGA_X_GVT4',
+    'MGGA_X_M06_L',
+    'MGGA_X_M11_L',
+    'MGGA_X_MN12_L',
+    'MGGA_X_MN15_L',
+    'MGGA_C_TPSS',
+    'MGGA_C_REVTPSS',
+    'MGGA_C_PKZB',
+    'MGGA_C_SCAN',
+    'MGGA_C_RSCAN',
+    'MGGA_C_R2SCAN',
+    'MGGA_C_REVSCAN',
+    'MGGA_C_BC95',
+    'MGGA_C_VSXC',
+    'MGGA_C_M06_L',
+    'MGGA_C_M11_L',
+    'MGGA_C_MN12_L',
+    'MGGA_C_MN15_L',
+    'MGGA_XC_B97M_V',
+    'MGGA_XC_OTPSS_D',
+    'MGGA_XC_ZLP',
+)
+
+# Hybrid functionals: name -> (exact exchange, long-range exact exchange, range-separation parameter)
+_HYBRID_FUNCTIONALS: Dict[str, Tuple[float, Optional[float], Optional[float]]] = {
+    # Global hybrid GGAs
+    'HYB_GGA_XC_B3LYP': (0.2, None, None),
+    'HYB_GGA_XC_B3LYP3': (0.2, None, None),
+    'HYB_GGA_XC_B3LYP5': (0.2, None, None),
+    'HYB_GGA_XC_B3LYPS': (0.15, None, None),
+    'HYB_GGA_XC_REVB3LYP': (0.2, None, None),
+    'HYB_GGA_XC_MB3LYP_RC04': (0.2, None, None),
+    'HYB_GGA_XC_B3PW91': (0.2, None, None),
+    'HYB_GGA_XC_B3P86': (0.2, None, None),
+    'HYB_GGA_XC_O3LYP': (0.1161, None, None),
+    'HYB_GGA_XC_X3LYP': (0.218, None, None),
+    'HYB_GGA_XC_MPW3PW': (0.2, None, None),
+    'HYB_GGA_XC_MPW3LYP': (0.218, None, None),
+    'HYB_GGA_XC_B1LYP': (0.25, None, None),
+    'HYB_GGA_XC_B1PW91': (0.25, None, None),
+    'HYB_GGA_XC_MPW1PW': (0.25, None, None),
+    'HYB_GGA_XC_MPW1K': (0.428, None, None),
+    'HYB_GGA_XC_BHANDH': (0.5, None, None),
+    'HYB_GGA_XC_BHANDHLYP': (0.5, None, None),
+    'HYB_GGA_XC_KMLYP': (0.557, None, None),
+    'HYB_GGA_XC_PBEH': (0.25, None, None),
+    'HYB_GGA_XC_PBE_MOL0': (0.25, None, None),
+    'HYB_GGA_XC_PBE_SOL0': (0.25, None, None),
+    'HYB_GGA_XC_PBEB0': (0.25, None, None),
+    'HYB_GGA_XC_PBE_MOLB0': (0.25, None, None),
+    'HYB_GGA_XC_PBE0_13': (1 / 3, None, None),
+    'HYB_GGA_XC_PBE38': (3 / 8, None, None),
+    'HYB_GGA_XC_PBE50': (0.5, None, None),
+    'HYB_GGA_XC_PBE_2X': (0.56, None, None),
+    'HYB_GGA_XC_B97': (0.1943, None, None),
+    'HYB_GGA_XC_B97_1': (0.21, None, None),
+    'HYB_GGA_XC_B97_2': (0.21, None, None),
+    'HYB_GGA_XC_B97_3': (0.2693, None, None),
+    'HYB_GGA_XC_B97_K': (0.42, None, None),
+    # Range-separated hybrid GGAs
+    'HYB_GGA_XC_HSE03': (0.25, 0.0, 0.106066),
+    'HYB_GGA_XC_HSE06': (0.25, 0.0, 0.11),
+    'HYB_GGA_XC_HSE12': (0.313, 0.0, 0.185),
+    'HYB_GGA_XC_HSE12S': (0.425, 0.0, 0.408),
+    'HYB_GGA_XC_HSESOL': (0.25, 0.0, 0.11),
+    'HYB_GGA_XC_CAM_B3LYP': (0.19, 0.65, 0.33),
+    'HYB_GGA_XC_TUNED_CAM_B3LYP': (0.0799, 1.0, 0.15),
+    'HYB_GGA_XC_LC_WPBE': (0.0, 1.0, 0.4),
+    'HYB_GGA_XC_LRC_WPBE': (0.0, 1.0, 0.3),
+    'HYB_GGA_XC_LRC_WPBEH': (0.2, 1.0, 0.2),
+    'HYB_GGA_XC_WB97': (0.0, 1.0, 0.4),
+    'HYB_GGA_XC_WB97X': (0.157706, 1.0, 0.3),
+    'HYB_GGA_XC_WB97X_D': (0.222036, 1.0, 0.2),
+    'HYB_GGA_XC_WB97X_V': (0.167, 1.0, 0.3),
+    # Global hybrid meta-GGAs
+    'HYB_MGGA_XC_M05': (0.28, None, None),
+    'HYB_MGGA_XC_M05_2X': (0.56, None, None),
+    'HYB_MGGA_XC_M06': (0.27, None, None),
+    'HYB_MGGA_XC_M06_2X': (0.54, None, None),
+    'HYB_MGGA_XC_M06_HF': (1.0, None, None),
+    'HYB_MGGA_XC_M08_HX': (0.5223, None, None),
+    'HYB_MGGA_XC_M08_SO': (0.5679, None, None),
+    'HYB_MGGA_XC_MN15': (0.44, None, None),
+    'HYB_MGGA_XC_TPSSH': (0.1, None, None),
+    'HYB_MGGA_XC_REVTPSSH': (0.1, None, None),
+    'HYB_MGGA_XC_TPSS0': (0.25, None, None),
+    'HYB_MGGA_X_SCAN0': (0.25, None, None),
+    'HYB_MGGA_X_REVSCAN0': (0.25, None, None),
+    'HYB_MGGA_XC_B88B95': (0.28, None, None),
+    'HYB_MGGA_XC_B1B95': (0.28, None, None),
+    'HYB_MGGA_XC_BB1K': (0.42, None, None),
+    'HYB_MGGA_XC_PW6B95': (0.28, None, None),
+    'HYB_MGGA_XC_PWB6K': (0.46, None, None),
+    'HYB_MGGA_XC_MPW1B95': (0.31, None, None),
+    'HYB_MGGA_XC_MPWB1K': (0.44, None, None),
+    'HYB_MGGA_XC_X1B95': (0.3, None, None),
+    'HYB_MGGA_XC_XB1K': (0.43, None, None),
+    # Range-separated hybrid meta-GGAs
+    'HYB_MGGA_X_MN12_SX': (0.25, 0.0, 0.11),
+    'HYB_MGGA_XC_M11': (0.428, 1.0, 0.25),
+    'HYB_MGGA_XC_WB97M_V': (0.15, 1.0, 0.3),
+}
+
+
+def get_libxc_family(libxc_name: str) -> Optional[str]:
+    """
+    Gets the libxc family from the prefix of `libxc_name`, e.g., 'HYB_GGA' for 'HYB_GGA_XC_B3LYP'.
+
+    Args:
+        libxc_name (str): The libxc name of the functional.
+
+    Returns:
+        (Optional[str]): The libxc family or None if the prefix is not recognized.
+    """
+    prefix, _, rest = libxc_name.partition('_')
+    if prefix == 'HYB':
+        prefix = f'HYB_{rest.partition("_")[0]}'
+    return prefix if prefix in LIBXC_FAMILY_JACOBS_LADDER else None
+
+
+def _build_registry() -> Mapping[str, LibxcFunctional]:
+    registry = {}
+    for name in _LDA_FUNCTIONALS + _GGA_FUNCTIONALS + _MGGA_FUNCTIONALS:
+        family = get_libxc_family(name)
+        registry[name] = LibxcFunctional(family, LIBXC_FAMILY_JACOBS_LADDER[family])
+    for name, parameters in _HYBRID_FUNCTIONALS.items():
+        family = get_libxc_family(name)
+        registry[name] = LibxcFunctional(
+            family, LIBXC_FAMILY_JACOBS_LADDER[family], *parameters
+        )
+    return MappingProxyType(registry)
+
+
+# Registry of libxc functionals, built once at import time
+LIBXC_FUNCTIONALS: Mapping[str, LibxcFunctional] = _build_registry()
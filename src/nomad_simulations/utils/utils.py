@@ -17,8 +17,10 @@
 # limitations under the License.
 #
 
-from math import factorial
-from typing import Optional
+import numpy as np
+from functools import lru_cache
+from math import comb
+from typing import Optional, Dict, FrozenSet, Tuple
 from structlog.stdlib import BoundLogger
 
 from nomad.datamodel.data import ArchiveSection
@@ -67,30 +69,95 @@ def get_sibling_section(
     return sibling_section
 
 
+# Largest total angular momentum J covered by the precomputed tables. This covers all the
+# multiplets arising from s, p, d and f shells (L <= 6 for f electrons, S <= 7/2).
+_J_MAX = 10
+_MAX_MULTIPLICITY = int(2 * _J_MAX + 1)
+# `_BINOMIAL_TABLE[m, n]` is the number of ways of placing `n` electrons in `m` states
+_BINOMIAL_TABLE = np.array(
+    [
+        [comb(m, n) for n in range(_MAX_MULTIPLICITY + 1)]
+        for m in range(_MAX_MULTIPLICITY + 1)
+    ],
+    dtype=np.int64,
+)
+_BINOMIAL_TABLE.setflags(write=False)
+
+
 # ? Check if this utils deserves its own file after extending it
 class RussellSaundersState:
+    # J/MJ manifolds for J = 0, 1/2, 1, ..., `_J_MAX`, computed once at import time
+    _mj_manifolds: Dict[float, Tuple[float, ...]] = {
+        j / 2: tuple(-j / 2 + m for m in range(j + 1)) for j in range(_MAX_MULTIPLICITY)
+    }
+
     @classmethod
-    def generate_Js(cls, J1: float, J2: float, rising=True):
+    @lru_cache(maxsize=None)
+    def get_Js(cls, J1: float, J2: float, rising: bool = True) -> Tuple[float, ...]:
+        """
+        Returns the (cached) values of the total angular momentum J obtained from coupling J1 and J2.
+        """
         J_min, J_max = sorted([abs(J1), abs(J2)])
-        generator = range(
-            int(J_max - J_min) + 1
-        )  # works for both for fermions and bosons
+        n_Js = int(J_max - J_min) + 1  # works for both for fermions and bosons
         if rising:
-            for jj in generator:
-                yield J_min + jj
-        else:
-            for jj in generator:
-                yield J_max - jj
+            return tuple(J_min + jj for jj in range(n_Js))
+        return tuple(J_max - jj for jj in range(n_Js))
+
+    @classmethod
+    def get_MJs(cls, J: float, rising: bool = True) -> Tuple[float, ...]:
+        """
+        Returns the (cached) projections MJ = -J, -J + 1, ..., J of the total angular momentum J.
+        """
+        mjs = cls._mj_manifolds.get(J)
+        if mjs is None:
+            mjs = tuple(-J + m for m in range(int(2 * J + 1)))
+        return mjs if rising else mjs[::-1]
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_MJs_set(cls, J: float) -> FrozenSet[float]:
+        """
+        Returns the projections MJ of J as a frozenset for constant-time membership tests.
+        """
+        return frozenset(cls.get_MJs(J))
+
+    @classmethod
+    def generate_Js(cls, J1: float, J2: float, rising=True):
+        yield from cls.get_Js(J1, J2, rising)
 
     @classmethod
     def generate_MJs(cls, J, rising=True):
-        generator = range(int(2 * J + 1))
-        if rising:
-            for m in generator:
-                yield -J + m
-        else:
-            for m in generator:
-                yield J - m
+        yield from cls.get_MJs(J, rising)
+
+    @classmethod
+    def get_degeneracies(cls, Js: np.ndarray, occupations: np.ndarray) -> np.ndarray:
+        """
+        Returns the degeneracies of arrays of (J, occupation) pairs from the precomputed binomial table.
+        Non-integer multiplicities or occupations, and out-of-range occupations, have a degeneracy of 0.
+
+        Args:
+            Js (np.ndarray): The total angular momenta J.
+            occupations (np.ndarray): The number of electrons in each J manifold.
+
+        Returns:
+            (np.ndarray): The degeneracies of each (J, occupation) pair.
+        """
+        multiplicities_float = 2 * np.asarray(Js, dtype=np.float64) + 1
+        multiplicities = np.rint(multiplicities_float).astype(np.int64)
+        occupations = np.asarray(occupations, dtype=np.float64)
+        occupations_int = np.rint(occupations).astype(np.int64)
+        valid = (
+            (multiplicities_float == multiplicities)
+            & (occupations == occupations_int)
+            & (multiplicities >= 0)
+            & (multiplicities <= _MAX_MULTIPLICITY)
+            & (occupations_int >= 0)
+            & (occupations_int <= multiplicities)
+        )
+        degeneracies = _BINOMIAL_TABLE[
+            np.where(valid, multiplicities, 0), np.where(valid, occupations_int, 0)
+        ]
+        return np.where(valid, degeneracies, 0)
 
     def __init__(self, *args, **kwargs):
         self.J = kwargs.get('J')
@@ -106,9 +173,16 @@ class RussellSaundersState:
 
     @property
     def degeneracy(self):
-        return factorial(self.multiplicity) / (
-            factorial(self.multiplicity - self.occupation) * factorial(self.occupation)
-        )
+        # Same conventions as `get_degeneracies`: non-integer or out-of-range values have no states
+        multiplicity, occupation = self.multiplicity, self.occupation
+        if multiplicity != int(multiplicity) or occupation != int(occupation):
+            return 0.0
+        multiplicity, occupation = int(multiplicity), int(occupation)
+        if not 0 <= occupation <= multiplicity:
+            return 0.0
+        if multiplicity <= _MAX_MULTIPLICITY:
+            return float(_BINOMIAL_TABLE[multiplicity, occupation])
+        return float(comb(multiplicity, occupation))
 
 
 def is_not_representative(model_system, logger: BoundLogger = None):
@@ -0,0 +1,363 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from structlog.stdlib import BoundLogger
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from nomad.units import ureg
+
+from ..common import HoppingMatrix
+from ..model_method import Wannier
+
+# Size in bytes of the chunks read from the Wannier90 files
+_CHUNK_SIZE = 2**24
+
+# Lookup tables for the bytes of decimal numbers: allowed bytes (digits, space, '-', '.', and newline)
+# and digit values
+_FIXED_WIDTH_BYTES = np.zeros(256, dtype=bool)
+_FIXED_WIDTH_BYTES[[10, 32, 45, 46, *range(48, 58)]] = True
+_DIGIT_VALUES = np.zeros(256, dtype=np.float64)
+_DIGIT_VALUES[48:58] = np.arange(10)
+
+
+def _parse_fixed_width(data: bytes) -> Optional[np.ndarray]:
+    """
+    Parses a chunk of lines with a fixed-width layout, i.e., with the same length and with right-aligned
+    numbers ending at the same columns (as written by the Fortran formats of Wannier90, e.g., `(5I5,2F12.6)`).
+    The digits are decoded with vectorized arithmetic on the bytes, which avoids creating one Python object
+    per number. Returns None if the chunk does not follow such a layout or contains non-decimal numbers.
+    """
+    line_length = data.find(b'\n') + 1
+    if line_length <= 1 or len(data) % line_length:
+        return None
+    lines = np.frombuffer(data, dtype=np.uint8).reshape(-1, line_length)
+    if np.any(lines[:, -1] != 10) or not np.all(_FIXED_WIDTH_BYTES[lines]):
+        return None
+
+    # Fields are defined from the first line: the numbers have to end at the same columns and have
+    # their decimal point (if any) in the same column in all lines
+    is_space = lines == 32
+    is_space[:, -1] = True  # the newline
+    number_ends = ~is_space[:, :-1] & is_space[:, 1:]
+    ends = np.flatnonzero(number_ends[0]) + 1
+    if np.any(number_ends != number_ends[0]):
+        return None
+    is_dot = lines == 46
+    if np.any(is_dot != is_dot[0]):
+        return None
+    # a minus sign can only precede the digits
+    if np.any((lines[:, 1:] == 45) & ~is_space[:, :-1]):
+        return None
+
+    starts = np.concatenate(([0], ends[:-1]))
+    values = np.empty((len(lines), len(ends)), dtype=np.float64)
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        columns = np.arange(end - start)
+        dots = is_dot[0, start:end]
+        dot_position = dots.argmax() if dots.any() else end - start
+        weights = 10.0 ** (dot_position - columns - (columns < dot_position))
+        field = lines[:, start:end]
+        values[:, i] = _DIGIT_VALUES[field] @ weights
+        values[np.any(field == 45, axis=1), i] *= -1
+    return values
+
+
+def _parse_numbers(data: bytes) -> np.ndarray:
+    """
+    Parses the whitespace-separated numbers of `data` into a flat float64 array, using `_parse_fixed_width`
+    when possible and splitting the bytes otherwise.
+    """
+    values = _parse_fixed_width(data)
+    if values is not None:
+        return values.ravel()
+    return np.array(data.split(), dtype=np.float64)
+
+
+def _iter_chunks(file: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """
+    Streams the remaining content of `file` in chunks of about `chunk_size` bytes cut at line ends.
+    """
+    remainder = b''
+    while True:
+        data = file.read(chunk_size)
+        if not data:
+            break
+        data = remainder + data
+        cut = data.rfind(b'\n') + 1
+        if cut == 0:
+            remainder = data
+            continue
+        remainder = data[cut:]
+        yield data[:cut]
+    if remainder:
+        yield remainder
+
+
+def _iter_numbers(
+    file: BinaryIO, chunk_size: int = _CHUNK_SIZE, n_threads: Optional[int] = None
+) -> Iterator[np.ndarray]:
+    """
+    Streams the numbers of the remaining content of `file` chunk by chunk, yielding them in order as float64
+    arrays. The chunks are parsed in a thread pool (the fixed-width decoding runs in NumPy and releases the GIL),
+    keeping at most `n_threads + 1` chunks in flight to bound the memory.
+    """
+    n_workers = n_threads or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        pending = deque()
+        for data in _iter_chunks(file, chunk_size):
+            pending.append(executor.submit(_parse_numbers, data))
+            if len(pending) > n_workers:
+                numbers = pending.popleft().result()
+                if numbers.size:
+                    yield numbers
+        while pending:
+            numbers = pending.popleft().result()
+            if numbers.size:
+                yield numbers
+
+
+def _iter_records(
+    file: BinaryIO,
+    record_size: int,
+    n_records: int,
+    chunk_size: int = _CHUNK_SIZE,
+    n_threads: Optional[int] = None,
+) -> Iterator[np.ndarray]:
+    """
+    Streams `n_records` fixed-size numeric records from `file`, yielding (n_chunk_records, record_size)
+    arrays. The numbers which do not complete a record are carried to the next chunk, and the rest of
+    the file after `n_records` is not read.
+    """
+    carry = np.zeros(0, dtype=np.float64)
+    n_read = 0
+    for numbers in _iter_numbers(file, chunk_size, n_threads):
+        if carry.size:
+            numbers = np.concatenate((carry, numbers))
+        n_complete = min(len(numbers) // record_size, n_records - n_read)
+        carry = numbers[n_complete * record_size :]
+        if n_complete:
+            yield numbers[: n_complete * record_size].reshape(n_complete, record_size)
+            n_read += n_complete
+        if n_read == n_records:
+            return
+
+
+def _read_degeneracies(file: BinaryIO, n_wigner_seitz_points: int) -> np.ndarray:
+    """
+    Reads the degeneracies of the Wigner-Seitz points, written in lines of up to 15 integers.
+    """
+    degeneracies = []
+    while len(degeneracies) < n_wigner_seitz_points:
+        line = file.readline()
+        if not line:
+            break
+        degeneracies.extend(int(x) for x in line.split())
+    return np.array(degeneracies, dtype=np.int32)
+
+
+def _fill_blocks(
+    blocks: np.ndarray,
+    start: int,
+    orbital_1: np.ndarray,
+    orbital_2: np.ndarray,
+    real: np.ndarray,
+    imag: np.ndarray,
+) -> None:
+    """
+    Fills the (n_chunk, n_orbitals**2) elements of the records read into the blocks starting at `start`.
+    """
+    n_chunk = len(orbital_1)
+    ws_indices = np.arange(start, start + n_chunk)[:, np.newaxis]
+    blocks[
+        ws_indices, orbital_1.astype(np.int64) - 1, orbital_2.astype(np.int64) - 1
+    ] = real + 1j * imag
+
+
+def _resolve_hopping_matrix(
+    wigner_seitz_points: np.ndarray,
+    degeneracy_factors: np.ndarray,
+    blocks: np.ndarray,
+    wannier: Optional[Wannier],
+) -> HoppingMatrix:
+    """
+    Creates the `HoppingMatrix` section from the parsed arrays (energies in eV) and fills `n_orbitals`
+    of the `Wannier` section, if given.
+    """
+    n_orbitals = blocks.shape[-1]
+    if wannier is not None:
+        wannier.n_orbitals = n_orbitals
+    return HoppingMatrix(
+        n_orbitals=n_orbitals,
+        n_wigner_seitz_points=len(wigner_seitz_points),
+        degeneracy_factors=degeneracy_factors,
+        wigner_seitz_points=wigner_seitz_points,
+        blocks=(blocks * ureg.eV).to('joule'),
+    )
+
+
+def read_hr_dat(
+    filepath: str,
+    logger: BoundLogger,
+    wannier: Optional[Wannier] = None,
+    chunk_size: int = _CHUNK_SIZE,
+    n_threads: Optional[int] = None,
+) -> Optional[HoppingMatrix]:
+    """
+    Reads a Wannier90 `_hr.dat` file into a `HoppingMatrix` section. The file is streamed in chunks of
+    `chunk_size` bytes and the chunks are parsed in a thread pool with vectorized NumPy operations, so that
+    the memory is bounded by the resulting hopping blocks. The format is:
+
+        header line
+        num_wann
+        nrpts
+        degeneracies (15 per line)
+        R_1  R_2  R_3  m  n  Re[H(R)_mn]  Im[H(R)_mn]   (nrpts * num_wann**2 lines, energies in eV)
+
+    Args:
+        filepath (str): The path to the `_hr.dat` file.
+        logger (BoundLogger): The logger to log messages.
+        wannier (Optional[Wannier], optional): The `Wannier` section in which `n_orbitals` is filled. Defaults to None.
+        chunk_size (int, optional): The size in bytes of the chunks read. Defaults to `_CHUNK_SIZE`.
+        n_threads (Optional[int], optional): The number of threads parsing the chunks. Defaults to None (number of CPUs).
+
+    Returns:
+        (Optional[HoppingMatrix]): The resolved `HoppingMatrix` section.
+    """
+    try:
+        with open(filepath, 'rb') as file:
+            file.readline()  # header
+            n_orbitals = int(file.readline())
+            n_wigner_seitz_points = int(file.readline())
+            degeneracy_factors = _read_degeneracies(file, n_wigner_seitz_points)
+
+            n_elements = n_orbitals * n_orbitals
+            wigner_seitz_points = np.zeros((n_wigner_seitz_points, 3), dtype=np.int32)
+            blocks = np.zeros(
+                (n_wigner_seitz_points, n_orbitals, n_orbitals), dtype=np.complex128
+            )
+            n_read = 0
+            for records in _iter_records(
+                file, 7 * n_elements, n_wigner_seitz_points, chunk_size, n_threads
+            ):
+                records = records.reshape(len(records), n_elements, 7)
+                wigner_seitz_points[n_read : n_read + len(records)] = records[:, 0, :3]
+                _fill_blocks(
+                    blocks,
+                    n_read,
+                    records[..., 3],
+                    records[..., 4],
+                    records[..., 5],
+                    records[..., 6],
+                )
+                n_read += len(records)
+    except (OSError, ValueError, IndexError) as exc:
+        logger.warning(f'Could not read the Wannier90 `_hr.dat` file: {exc}')
+        return None
+
+    if n_read != n_wigner_seitz_points or len(degeneracy_factors) != n_read:
+        logger.warning(
+            'The Wannier90 `_hr.dat` file is incomplete.',
+            n_wigner_seitz_points=n_wigner_seitz_points,
+            n_read=n_read,
+        )
+        return None
+    return _resolve_hopping_matrix(
+        wigner_seitz_points, degeneracy_factors, blocks, wannier
+    )
+
+
+def read_tb_dat(
+    filepath: str,
+    logger: BoundLogger,
+    wannier: Optional[Wannier] = None,
+    chunk_size: int = _CHUNK_SIZE,
+    n_threads: Optional[int] = None,
+) -> Optional[Tuple[HoppingMatrix, np.ndarray]]:
+    """
+    Reads the Hamiltonian part of a Wannier90 `_tb.dat` file into a `HoppingMatrix` section, streaming
+    the file as in `read_hr_dat`. The position matrix elements written after the Hamiltonian are not read.
+    The format is:
+
+        header line
+        lattice vectors (3 lines, in angstrom)
+        num_wann
+        nrpts
+        degeneracies (15 per line)
+        for each R: empty line, R_1  R_2  R_3, and num_wann**2 lines  m  n  Re[H(R)_mn]  Im[H(R)_mn]
+
+    Args:
+        filepath (str): The path to the `_tb.dat` file.
+        logger (BoundLogger): The logger to log messages.
+        wannier (Optional[Wannier], optional): The `Wannier` section in which `n_orbitals` is filled. Defaults to None.
+        chunk_size (int, optional): The size in bytes of the chunks read. Defaults to `_CHUNK_SIZE`.
+        n_threads (Optional[int], optional): The number of threads parsing the chunks. Defaults to None (number of CPUs).
+
+    Returns:
+        (Optional[Tuple[HoppingMatrix, np.ndarray]]): The resolved `HoppingMatrix` section and the (3, 3) lattice
+        vectors in angstrom.
+    """
+    try:
+        with open(filepath, 'rb') as file:
+            file.readline()  # header
+            lattice_vectors = np.array(
+                [file.readline().split() for _ in range(3)], dtype=np.float64
+            )
+            n_orbitals = int(file.readline())
+            n_wigner_seitz_points = int(file.readline())
+            degeneracy_factors = _read_degeneracies(file, n_wigner_seitz_points)
+
+            n_elements = n_orbitals * n_orbitals
+            wigner_seitz_points = np.zeros((n_wigner_seitz_points, 3), dtype=np.int32)
+            blocks = np.zeros(
+                (n_wigner_seitz_points, n_orbitals, n_orbitals), dtype=np.complex128
+            )
+            n_read = 0
+            for records in _iter_records(
+                file, 3 + 4 * n_elements, n_wigner_seitz_points, chunk_size, n_threads
+            ):
+                wigner_seitz_points[n_read : n_read + len(records)] = records[:, :3]
+                elements = records[:, 3:].reshape(len(records), n_elements, 4)
+                _fill_blocks(
+                    blocks,
+                    n_read,
+                    elements[..., 0],
+                    elements[..., 1],
+                    elements[..., 2],
+                    elements[..., 3],
+                )
+                n_read += len(records)
+    except (OSError, ValueError, IndexError) as exc:
+        logger.warning(f'Could not read the Wannier90 `_tb.dat` file: {exc}')
+        return None
+
+    if n_read != n_wigner_seitz_points or len(degeneracy_factors) != n_read:
+        logger.warning(
+            'The Wannier90 `_tb.dat` file is incomplete.',
+            n_wigner_seitz_points=n_wigner_seitz_points,
+            n_read=n_read,
+        )
+        return None
+    hopping_matrix = _resolve_hopping_matrix(
+        wigner_seitz_points, degeneracy_factors, blocks, wannier
+    )
+    return hopping_matrix, lattice_vectors
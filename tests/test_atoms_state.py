@@ -0,0 +1,194 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import numpy as np
+import pytest
+from structlog.testing import capture_logs
+
+from nomad.datamodel import EntryArchive
+from nomad.units import ureg
+from nomad.utils import get_logger
+
+from nomad_simulations.atoms_state import HubbardInteractions, OrbitalsState
+
+logger = get_logger(__name__)
+
+ORBITALS = [
+    {'l_quantum_symbol': 'd'},
+    {'l_quantum_number': 1, 'ml_quantum_number': -1},
+    {'l_quantum_symbol': 'd', 'ml_quantum_symbol': 'z^2', 'ms_quantum_symbol': 'up'},
+    {'l_quantum_symbol': 'f', 'ml_quantum_symbol': 'xyz', 'ms_quantum_number': -0.5},
+    {'l_quantum_number': 0},
+    {'l_quantum_symbol': 'p', 'j_quantum_number': [0.5, 1.5]},
+    {'l_quantum_symbol': 'p', 'degeneracy': 4},
+]
+ORBITALS_QUANTITIES = [
+    'l_quantum_number',
+    'l_quantum_symbol',
+    'ml_quantum_number',
+    'ml_quantum_symbol',
+    'ms_quantum_number',
+    'ms_quantum_symbol',
+    'degeneracy',
+]
+SLATER_INTEGRALS = [8.0, 7.5, 4.7]  # F0, F2, F4 in eV
+
+
+def test_orbitals_state_resolve_in_batch():
+    """
+    Test that the batch resolution of `OrbitalsState` sections gives the same quantum numbers, symbols and
+    degeneracies as normalizing each section.
+    """
+    normalized = [OrbitalsState(**orbital) for orbital in ORBITALS]
+    for orbital in normalized:
+        orbital.normalize(EntryArchive(), logger)
+    batch = [OrbitalsState(**orbital) for orbital in ORBITALS]
+    OrbitalsState.resolve_in_batch(batch, logger)
+    for normalized_orbital, batch_orbital in zip(normalized, batch):
+        for name in ORBITALS_QUANTITIES:
+            assert getattr(batch_orbital, name) == getattr(normalized_orbital, name)
+
+
+def resolve_coulomb_tensor(**kwargs) -> np.ndarray:
+    """
+    Resolves the dense `coulomb_tensor` in eV of a d shell with `SLATER_INTEGRALS`.
+    """
+    hubbard = HubbardInteractions(slater_integrals=SLATER_INTEGRALS * ureg.eV, **kwargs)
+    return hubbard.resolve_coulomb_tensor(logger).to('eV').magnitude
+
+
+def test_coulomb_tensor_sum_rules():
+    """
+    Test the permutational symmetries of the d-shell `coulomb_tensor` and its averages over the shell,
+    which only depend on F0 and F2 + F4.
+    """
+    f0, f2, f4 = SLATER_INTEGRALS
+    tensor = resolve_coulomb_tensor()
+    assert tensor.shape == (5, 5, 5, 5)
+    assert np.allclose(tensor, tensor.transpose(1, 0, 3, 2))
+    assert np.allclose(tensor, tensor.transpose(2, 3, 0, 1))
+    assert np.allclose(tensor, tensor.transpose(2, 1, 0, 3))
+
+    u_matrix = np.einsum('abab->ab', tensor)
+    exchange = np.einsum('abba->ab', tensor)
+    off_diagonal = ~np.eye(5, dtype=bool)
+    assert u_matrix.mean() == pytest.approx(f0)
+    assert (u_matrix - exchange)[off_diagonal].mean() == pytest.approx(
+        f0 - (f2 + f4) / 14.0
+    )
+    assert np.allclose(np.diag(u_matrix), np.diag(exchange))
+
+
+def test_coulomb_tensor_compression():
+    """
+    Test that the compressed `coulomb_tensor` is expanded back into the dense one.
+    """
+    hubbard = HubbardInteractions(slater_integrals=SLATER_INTEGRALS * ureg.eV)
+    tensor = hubbard.resolve_coulomb_tensor(logger)
+    hubbard.n_orbitals = len(tensor)
+    (
+        hubbard.coulomb_tensor_indices,
+        hubbard.coulomb_tensor_values,
+        hubbard.coulomb_tensor_compression,
+    ) = hubbard.compress_coulomb_tensor(tensor, logger)
+    assert hubbard.coulomb_tensor_compression == 'permutational'
+    assert len(hubbard.coulomb_tensor_indices) < np.count_nonzero(tensor.magnitude)
+    expanded = hubbard.expand_coulomb_tensor(logger)
+    assert np.allclose(expanded.to('eV').magnitude, tensor.to('eV').magnitude)
+
+
+def test_coulomb_tensor_compression_noise():
+    """
+    Test that the numerical noise of a computed `coulomb_tensor` neither breaks its permutational symmetries nor
+    is stored in the compressed representation.
+    """
+    hubbard = HubbardInteractions(slater_integrals=SLATER_INTEGRALS * ureg.eV)
+    tensor = hubbard.resolve_coulomb_tensor(logger).to('eV').magnitude
+    noise = 1e-14 * np.random.default_rng(0).standard_normal(tensor.shape)
+    noisy_tensor = (tensor + noise) * ureg.eV
+    indices, values, compression = hubbard.compress_coulomb_tensor(noisy_tensor, logger)
+    assert compression == 'permutational'
+    assert np.abs(values.to('eV').magnitude).min() > 1e-10
+    _, reference_values, _ = hubbard.compress_coulomb_tensor(tensor * ureg.eV, logger)
+    assert len(values) == len(reference_values)
+
+
+def test_coulomb_tensor_shell_orbitals():
+    """
+    Test that a shell-level `orbitals_ref` (without `ml`) is expanded into all the real harmonics of the shell.
+    """
+    shell = resolve_coulomb_tensor(orbitals_ref=[OrbitalsState(l_quantum_symbol='d')])
+    assert np.allclose(shell, resolve_coulomb_tensor())
+
+    orbitals = [
+        OrbitalsState(l_quantum_symbol='d', ml_quantum_symbol=symbol)
+        for symbol in ['xy', 'xz']
+    ]
+    assert resolve_coulomb_tensor(orbitals_ref=orbitals).shape == (2, 2, 2, 2)
+
+
+@pytest.mark.parametrize(
+    'parameters, has_coulomb_tensor',
+    [
+        # Plain DFT+U
+        ({'u_interaction': 4.0 * ureg.eV}, False),
+        ({'u_interaction': 4.0 * ureg.eV, 'j_hunds_coupling': 0.9 * ureg.eV}, False),
+        ({'slater_integrals': SLATER_INTEGRALS * ureg.eV}, False),
+        # Orbital-resolved interactions
+        (
+            {
+                'u_interaction': 4.0 * ureg.eV,
+                'orbitals_ref': [OrbitalsState(l_quantum_symbol='d')],
+            },
+            False,
+        ),
+        (
+            {
+                'u_interaction': 4.0 * ureg.eV,
+                'j_hunds_coupling': 0.9 * ureg.eV,
+                'orbitals_ref': [OrbitalsState(l_quantum_symbol='d')],
+            },
+            True,
+        ),
+        (
+            {
+                'slater_integrals': SLATER_INTEGRALS * ureg.eV,
+                'orbitals_ref': [OrbitalsState(l_quantum_symbol='d')],
+            },
+            True,
+        ),
+    ],
+)
+def test_hubbard_interactions_normalize(parameters: dict, has_coulomb_tensor: bool):
+    """
+    Test that the `coulomb_tensor` and `u_matrix` are only built for `orbitals_ref` with Slater integrals or
+    Kanamori parameters, and that plain DFT+U interactions are normalized without warnings about them.
+    """
+    hubbard = HubbardInteractions(**parameters)
+    with capture_logs() as logs:
+        hubbard.normalize(EntryArchive(), logger)
+    assert (hubbard.coulomb_tensor_values is not None) == has_coulomb_tensor
+    assert (hubbard.u_matrix is not None) == has_coulomb_tensor
+    if has_coulomb_tensor:
+        assert hubbard.u_matrix.shape == (5, 5)
+    # Only the missing `u_effective` inputs can be reported
+    assert all(
+        'j_local_exchange_interaction' in log['event']
+        for log in logs
+        if log['log_level'] in ('warning', 'error')
+    )
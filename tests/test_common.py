@@ -0,0 +1,282 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import itertools
+import numpy as np
+import pytest
+from typing import Optional
+
+from nomad.datamodel import EntryArchive
+from nomad.units import ureg
+from nomad.utils import get_logger
+
+from nomad_simulations import common
+from nomad_simulations.common import HoppingMatrix
+
+logger = get_logger(__name__)
+
+
+def generate_blocks(n_wigner_seitz_points: int, n_orbitals: int) -> np.ndarray:
+    """
+    Generates random complex hopping blocks in joules.
+    """
+    rng = np.random.default_rng(0)
+    shape = (n_wigner_seitz_points, n_orbitals, n_orbitals)
+    return rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+
+
+@pytest.mark.parametrize('one_based', [False, True])
+def test_legacy_value_round_trip(one_based: bool):
+    """
+    Test that the legacy 7-columns `value` is converted back into the same Wigner-Seitz points and blocks.
+    """
+    wigner_seitz_points = np.array([[-1, 0, 0], [0, 0, 0], [1, 0, 0], [0, 2, -1]])
+    blocks = generate_blocks(4, 3)
+    value = HoppingMatrix.to_legacy_value(wigner_seitz_points, blocks, one_based)
+    assert value.shape == (4, 9, 7)
+    assert value[..., 3:5].min() == int(one_based)
+    points, converted_blocks = HoppingMatrix.from_legacy_value(value, logger)
+    assert np.array_equal(points, wigner_seitz_points)
+    assert np.array_equal(converted_blocks, blocks)
+
+
+def test_legacy_value_normalize():
+    """
+    Test that the legacy `value` is converted into `blocks` during normalization and kept as parsed.
+    """
+    wigner_seitz_points = np.array([[-1, 0, 0], [0, 0, 0], [1, 0, 0]])
+    blocks = generate_blocks(3, 2)
+    value = HoppingMatrix.to_legacy_value(wigner_seitz_points, blocks, one_based=True)
+    hopping_matrix = HoppingMatrix(value=value * ureg.joule)
+    hopping_matrix.normalize(EntryArchive(), logger)
+    assert np.array_equal(hopping_matrix.wigner_seitz_points, wigner_seitz_points)
+    assert np.allclose(hopping_matrix.blocks.to('joule').magnitude, blocks)
+    assert hopping_matrix.n_wigner_seitz_points == 3
+    assert hopping_matrix.n_orbitals == 2
+    assert np.array_equal(hopping_matrix.value.to('joule').magnitude, value)
+
+
+def test_get_block():
+    """
+    Test that `get_block` returns a zero-copy view of the block of a Wigner-Seitz point.
+    """
+    wigner_seitz_points = np.array([[-1, 0, 0], [0, 0, 0], [1, 0, 0]])
+    hopping_matrix = HoppingMatrix(
+        wigner_seitz_points=wigner_seitz_points,
+        blocks=generate_blocks(3, 2) * ureg.joule,
+    )
+    block = hopping_matrix.get_block((1, 0, 0))
+    assert np.array_equal(block, hopping_matrix.blocks.magnitude[2])
+    assert np.shares_memory(block, hopping_matrix.blocks.magnitude)
+    assert hopping_matrix.get_block((2, 0, 0)) is None
+
+
+def generate_hermitian_hopping_matrix() -> HoppingMatrix:
+    """
+    Generates a `HoppingMatrix` with random blocks fulfilling H(-R) = H(R)^dagger, so that H(k) is hermitian.
+    """
+    wigner_seitz_points = np.array(
+        [
+            [0, 0, 0],
+            [1, 0, 0],
+            [-1, 0, 0],
+            [0, 1, 0],
+            [0, -1, 0],
+            [1, 1, 0],
+            [-1, -1, 0],
+        ]
+    )
+    blocks = generate_blocks(len(wigner_seitz_points), 3)
+    blocks[0] = blocks[0] + blocks[0].conj().T
+    blocks[2::2] = blocks[1::2].conj().transpose(0, 2, 1)
+    return HoppingMatrix(
+        n_orbitals=3,
+        n_wigner_seitz_points=len(wigner_seitz_points),
+        wigner_seitz_points=wigner_seitz_points,
+        degeneracy_factors=[1, 2, 2, 1, 1, 3, 3],
+        blocks=blocks * ureg.joule,
+    )
+
+
+def dense_fourier_sum(
+    hopping_matrix: HoppingMatrix, k_points: np.ndarray
+) -> np.ndarray:
+    """
+    Computes H(k) = sum_R exp(2 pi i k.R) H(R) / deg(R) point by point.
+    """
+    blocks = hopping_matrix.blocks.to('joule').magnitude
+    return np.array(
+        [
+            sum(
+                np.exp(2j * np.pi * np.dot(k_point, point)) * block / degeneracy
+                for point, block, degeneracy in zip(
+                    hopping_matrix.wigner_seitz_points,
+                    blocks,
+                    hopping_matrix.degeneracy_factors,
+                )
+            )
+            for k_point in k_points
+        ]
+    )
+
+
+@pytest.mark.parametrize('chunk_size', [None, 3])
+def test_compute_hamiltonian(chunk_size: Optional[int]):
+    """
+    Test the batched Fourier interpolation of H(k) against the dense Fourier sum.
+    """
+    hopping_matrix = generate_hermitian_hopping_matrix()
+    k_points = np.random.default_rng(1).random((10, 3))
+    hamiltonian = (
+        hopping_matrix.compute_hamiltonian(k_points, logger, chunk_size=chunk_size)
+        .to('joule')
+        .magnitude
+    )
+    expected = dense_fourier_sum(hopping_matrix, k_points)
+    assert np.allclose(hamiltonian, expected)
+    assert np.allclose(hamiltonian, hamiltonian.conj().transpose(0, 2, 1))
+
+
+def test_compute_bands():
+    """
+    Test the band energies and eigenvectors solved in chunks against the dense diagonalization.
+    """
+    hopping_matrix = generate_hermitian_hopping_matrix()
+    k_points = np.random.default_rng(1).random((10, 3))
+    energies, vectors = hopping_matrix.compute_bands(
+        k_points, logger, eigenvectors=True, chunk_size=4, n_threads=2
+    )
+    energies = energies.to('joule').magnitude
+    hamiltonian = dense_fourier_sum(hopping_matrix, k_points)
+    assert np.allclose(energies, np.linalg.eigvalsh(hamiltonian))
+    assert np.allclose(hamiltonian @ vectors, vectors * energies[:, np.newaxis, :])
+
+
+def generate_chain_blocks(n_orbitals: int) -> tuple:
+    """
+    Generates the Wigner-Seitz points and the blocks of a supercell of a chain with `n_orbitals` sites, random
+    on-site energies and nearest-neighbour hoppings of -1 J.
+    """
+    onsite = np.diag(np.random.default_rng(2).uniform(-0.5, 0.5, n_orbitals))
+    onsite = onsite - np.eye(n_orbitals, k=1) - np.eye(n_orbitals, k=-1)
+    forward = np.zeros((n_orbitals, n_orbitals))
+    forward[-1, 0] = -1.0
+    wigner_seitz_points = np.array([[-1, 0, 0], [0, 0, 0], [1, 0, 0]])
+    return wigner_seitz_points, np.array([forward.T, onsite, forward]).astype(
+        np.complex128
+    )
+
+
+def test_compute_sparse_bands():
+    """
+    Test the sparse H(k) and the window of bands of the sparse eigensolver against the dense ones.
+    """
+    wigner_seitz_points, blocks = generate_chain_blocks(40)
+    hopping_matrix = HoppingMatrix(
+        wigner_seitz_points=wigner_seitz_points, blocks=blocks * ureg.joule
+    )
+    k_points = np.array([[0.0, 0.0, 0.0], [0.25, 0.0, 0.0], [0.5, 0.0, 0.0]])
+    dense_energies = hopping_matrix.compute_bands(k_points, logger).magnitude
+    dense_hamiltonian = hopping_matrix.compute_hamiltonian(k_points, logger).magnitude
+
+    hopping_matrix.compress_sparse(0.0, logger)
+    assert hopping_matrix.blocks is None
+    # Diagonal, nearest neighbours and the two bonds across the supercell
+    assert hopping_matrix.n_sparse_elements == 40 + 2 * 39 + 2
+    for k_point, hamiltonian in zip(k_points, dense_hamiltonian):
+        sparse_hamiltonian = hopping_matrix.compute_sparse_hamiltonian(k_point, logger)
+        assert np.allclose(sparse_hamiltonian.toarray(), hamiltonian)
+
+    lowest = hopping_matrix.compute_sparse_bands(k_points, logger, n_bands=4)
+    assert np.allclose(lowest.to('joule').magnitude, dense_energies[:, :4])
+    window = hopping_matrix.compute_sparse_bands(k_points, logger, n_bands=4, sigma=0.1)
+    for energies, dense in zip(window.to('joule').magnitude, dense_energies):
+        closest = np.sort(dense[np.argsort(np.abs(dense - 0.1))[:4]])
+        assert np.allclose(energies, closest)
+
+
+def test_sparse_truncation_error():
+    """
+    Test that the shift of the bands after discarding the small hoppings is bounded by `sparse_truncation_error`.
+    """
+    wigner_seitz_points, blocks = generate_chain_blocks(20)
+    blocks[1] += 1e-4 * (np.eye(20, k=2) + np.eye(20, k=-2))
+    hopping_matrix = HoppingMatrix(
+        wigner_seitz_points=wigner_seitz_points, blocks=blocks * ureg.joule
+    )
+    k_points = np.array([[0.1, 0.0, 0.0], [0.3, 0.0, 0.0]])
+    dense_energies = hopping_matrix.compute_bands(k_points, logger).magnitude
+    hopping_matrix.compress_sparse(1e-3, logger)
+    energies = hopping_matrix.compute_sparse_bands(k_points, logger, n_bands=5)
+    error = hopping_matrix.sparse_truncation_error.to('joule').magnitude
+    assert 0 < error
+    assert np.abs(energies.magnitude - dense_energies[:, :5]).max() <= error
+
+
+def brute_force_wigner_seitz_points(grid: list, lattice_vectors: np.ndarray) -> tuple:
+    """
+    Finds the Wigner-Seitz points of the supercell and their degeneracies point by point, as in Wannier90.
+    """
+    search = range(-2, 3)
+    images = np.array(list(itertools.product(search, repeat=3))) * grid
+    points, degeneracies = [], []
+    for point in itertools.product(*[range(-2 * n, 2 * n + 1) for n in grid]):
+        distances = np.linalg.norm((point - images) @ lattice_vectors, axis=-1)
+        if np.linalg.norm(point @ lattice_vectors) <= distances.min() + 1e-6:
+            points.append(point)
+            degeneracies.append(np.count_nonzero(distances <= distances.min() + 1e-6))
+    return np.array(points), np.array(degeneracies)
+
+
+@pytest.mark.parametrize(
+    'grid, lattice_vectors',
+    [
+        ([2, 2, 2], np.eye(3)),
+        (
+            [3, 3, 2],
+            np.array([[1.0, 0.0, 0.0], [-0.5, np.sqrt(3) / 2, 0.0], [0.0, 0.0, 1.6]]),
+        ),
+        ([4, 2, 1], np.array([[1.0, 0.1, 0.0], [0.3, 1.2, 0.0], [0.2, -0.1, 0.9]])),
+    ],
+)
+@pytest.mark.parametrize('chunk_size', [None, 7])
+def test_wigner_seitz_points(
+    monkeypatch, grid: list, lattice_vectors: np.ndarray, chunk_size: Optional[int]
+):
+    """
+    Test the chunked Wigner-Seitz points and degeneracies against a point by point search.
+    """
+    if chunk_size is not None:
+        monkeypatch.setattr(common, '_WIGNER_SEITZ_CHUNK_SIZE', chunk_size)
+    common._get_wigner_seitz_points.cache_clear()
+    points, degeneracies = HoppingMatrix.resolve_wigner_seitz_points(
+        grid, 3.5 * lattice_vectors * ureg.angstrom, logger
+    )
+    expected_points, expected_degeneracies = brute_force_wigner_seitz_points(
+        grid, lattice_vectors
+    )
+    assert points.tolist() == expected_points.tolist()
+    assert degeneracies.tolist() == expected_degeneracies.tolist()
+    # Each supercell point is counted once
+    assert np.sum(1 / degeneracies) == pytest.approx(np.prod(grid))
+    # The stored points are checked in any order
+    order = np.random.default_rng(0).permutation(len(points))
+    hopping_matrix = HoppingMatrix(
+        wigner_seitz_points=points[order], degeneracy_factors=degeneracies[order]
+    )
+    assert hopping_matrix.check_wigner_seitz_points(grid, lattice_vectors, logger)
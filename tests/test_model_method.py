@@ -0,0 +1,316 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import numpy as np
+import pytest
+from typing import Optional
+from structlog.testing import capture_logs
+
+from nomad.datamodel import EntryArchive
+from nomad.units import ureg
+from nomad.utils import get_logger
+
+from nomad_simulations.atoms_state import AtomsState, OrbitalsState
+from nomad_simulations.model_method import (
+    DFT,
+    TB,
+    SlaterKoster,
+    SlaterKosterBond,
+    XCFunctional,
+)
+from nomad_simulations.model_system import AtomicCell, ModelSystem
+from nomad_simulations.utils.libxc_functionals import (
+    LIBXC_FUNCTIONALS,
+    get_libxc_family,
+)
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.parametrize(
+    'libxc_name, family, jacobs_ladder',
+    [
+        ('LDA_C_PW', 'LDA', 'LDA'),
+        ('GGA_X_PBE', 'GGA', 'GGA'),
+        ('MGGA_X_SCAN', 'MGGA', 'metaGGA'),
+        ('HYB_GGA_XC_B3LYP', 'HYB_GGA', 'hybrid'),
+        ('HYB_GGA_XC_HSE06', 'HYB_GGA', 'hybrid'),
+    ],
+)
+def test_libxc_registry(libxc_name: str, family: str, jacobs_ladder: str):
+    """
+    Test the family and rung of the functionals in the libxc registry.
+    """
+    functional = LIBXC_FUNCTIONALS[libxc_name]
+    assert functional.family == family == get_libxc_family(libxc_name)
+    assert functional.jacobs_ladder == jacobs_ladder
+
+
+@pytest.mark.parametrize(
+    'libxc_names, jacobs_ladder, exact_exchange_mixing_factor, unknown_libxc_names',
+    [
+        (['LDA_X', 'LDA_C_PW'], 'LDA', None, []),
+        (['GGA_X_PBE', 'GGA_C_PBE'], 'GGA', None, []),
+        (['MGGA_X_SCAN', 'GGA_C_PBE'], 'metaGGA', None, []),
+        (['HYB_GGA_XC_B3LYP'], 'hybrid', 0.2, []),
+        # The short-range fraction of range-separated hybrids
+        (['HYB_GGA_XC_HSE06'], 'hybrid', 0.25, []),
+        # Weighted names are looked up without their weight
+        (['0.75*GGA_X_PBE', '0.25*HYB_GGA_XC_B3LYP'], 'hybrid', 0.2, []),
+        # Unknown names are classified by their family prefix and reported
+        (
+            ['GGA_X_UNKNOWN', 'MGGA_C_UNKNOWN'],
+            'metaGGA',
+            None,
+            ['GGA_X_UNKNOWN', 'MGGA_C_UNKNOWN'],
+        ),
+        (['UNKNOWN'], 'unavailable', None, ['UNKNOWN']),
+    ],
+)
+def test_dft_normalize(
+    libxc_names: list,
+    jacobs_ladder: str,
+    exact_exchange_mixing_factor: Optional[float],
+    unknown_libxc_names: list,
+):
+    """
+    Test the `jacobs_ladder` and `exact_exchange_mixing_factor` resolved from the libxc registry.
+    """
+    dft = DFT(xc_functionals=[XCFunctional(libxc_name=name) for name in libxc_names])
+    with capture_logs() as logs:
+        dft.normalize(EntryArchive(), logger)
+    assert dft.jacobs_ladder == jacobs_ladder
+    assert dft.exact_exchange_mixing_factor == exact_exchange_mixing_factor
+    warnings = [log for log in logs if 'libxc functionals registry' in log['event']]
+    if unknown_libxc_names:
+        assert len(warnings) == 1
+        assert warnings[0]['libxc_names'] == unknown_libxc_names
+    else:
+        assert not warnings
+
+
+def generate_tb_model_system(orbitals: list) -> ModelSystem:
+    """
+    Generates a representative `ModelSystem` with one atom per list of `orbitals`, all of them active.
+    """
+    atomic_cell = AtomicCell(
+        positions=np.arange(3 * len(orbitals)).reshape(-1, 3) * ureg.angstrom,
+        atoms_state=[
+            AtomsState(
+                chemical_symbol='C',
+                orbitals_state=[OrbitalsState(**orbital) for orbital in atom_orbitals],
+            )
+            for atom_orbitals in orbitals
+        ],
+    )
+    return ModelSystem(
+        is_representative=True,
+        cell=[atomic_cell],
+        model_system=[
+            ModelSystem(type='active_atom', atom_indices=[index])
+            for index in range(len(orbitals))
+        ],
+    )
+
+
+def test_resolve_orbital_index_map():
+    """
+    Test that the orbital index map resolves the quantum numbers of orbitals only defined by their symbols.
+    """
+    model_system = generate_tb_model_system(
+        [
+            [
+                {'l_quantum_symbol': 's'},
+                {'l_quantum_symbol': 'p', 'ml_quantum_symbol': 'z'},
+            ],
+            [
+                {
+                    'l_quantum_symbol': 'd',
+                    'ml_quantum_symbol': 'xy',
+                    'ms_quantum_symbol': 'down',
+                }
+            ],
+        ]
+    )
+    tb = TB()
+    orbital_index_map = tb.resolve_orbital_index_map([model_system], logger)
+    assert orbital_index_map['orbital_atom_indices'].tolist() == [0, 0, 1]
+    assert orbital_index_map['atom_orbital_offsets'].tolist() == [0, 2, 3]
+    assert orbital_index_map['orbital_quantum_numbers'].tolist() == [
+        [0, -128, -128],
+        [1, 0, -128],
+        [2, -2, -1],
+    ]
+    assert tb.m_cache['orbital_index_map'] is orbital_index_map
+    positions = tb.resolve_orbital_positions([model_system], logger)
+    assert np.allclose(positions.to('angstrom').magnitude[:, 0], [0, 0, 3])
+
+
+def test_resolve_orbital_index_map_unresolved():
+    """
+    Test that an orbital index map with unresolved `l_quantum_number` is not cached.
+    """
+    model_system = generate_tb_model_system([[{'l_quantum_symbol': 's'}, {}]])
+    tb = TB()
+    with capture_logs() as logs:
+        orbital_index_map = tb.resolve_orbital_index_map([model_system], logger)
+    assert orbital_index_map['orbital_quantum_numbers'][1, 0] == -128
+    assert 'orbital_index_map' not in tb.m_cache
+    assert any('l_quantum_number' in log['event'] for log in logs)
+
+
+SLATER_KOSTER_ORBITALS = [
+    {'l_quantum_symbol': 's'},
+    {'l_quantum_symbol': 'p', 'ml_quantum_symbol': 'x'},
+    {'l_quantum_symbol': 'p', 'ml_quantum_symbol': 'y'},
+    {'l_quantum_symbol': 'p', 'ml_quantum_symbol': 'z'},
+    {'l_quantum_symbol': 'd', 'ml_quantum_symbol': 'xy'},
+]
+# Basis index of the orbitals of each atom, and direction cosines of the bond from atom 0 to atom 1
+S, X, Y, Z, XY = range(5)
+DIRECTION = np.array([1.0, 2.0, 2.0]) / 3
+# Bond integrals in eV
+SLATER_KOSTER_INTEGRALS = {
+    'sps': 1.0,
+    'pps': 2.0,
+    'ppp': -0.5,
+    'sds': 1.5,
+    'pds': -1.2,
+    'pdp': 0.7,
+}
+
+
+def generate_slater_koster_system() -> ModelSystem:
+    """
+    Generates a `ModelSystem` with two atoms, each with s, p, and d_xy orbitals, along `DIRECTION`.
+    """
+    model_system = generate_tb_model_system([SLATER_KOSTER_ORBITALS] * 2)
+    atomic_cell = model_system.cell[0]
+    atomic_cell.positions = np.array([[0.0, 0.0, 0.0], 3 * DIRECTION]) * ureg.angstrom
+    atomic_cell.lattice_vectors = 10 * np.eye(3) * ureg.angstrom
+    return model_system
+
+
+def generate_slater_koster_bond(
+    model_system: ModelSystem, name: str, orbital_1: tuple, orbital_2: tuple
+) -> SlaterKosterBond:
+    """
+    Generates a `SlaterKosterBond` between the (atom index, orbital index) pairs `orbital_1` and `orbital_2`.
+    """
+    atoms_state = model_system.cell[0].atoms_state
+    return SlaterKosterBond(
+        name=name,
+        orbital_1=atoms_state[orbital_1[0]].orbitals_state[orbital_1[1]],
+        orbital_2=atoms_state[orbital_2[0]].orbitals_state[orbital_2[1]],
+        integral_value=SLATER_KOSTER_INTEGRALS[name] * ureg.eV,
+    )
+
+
+def test_slater_koster_table():
+    """
+    Test the Slater-Koster blocks against the direction-cosine table of https://doi.org/10.1103/PhysRev.94.1498.
+    """
+    model_system = generate_slater_koster_system()
+    bonds = [
+        generate_slater_koster_bond(model_system, name, (0, orbital_1), (1, orbital_2))
+        for name, orbital_1, orbital_2 in [
+            ('sps', S, X),
+            ('pps', X, Y),
+            ('ppp', Z, X),
+            ('sds', S, XY),
+            ('pds', Y, XY),
+            ('pdp', X, XY),
+        ]
+    ]
+    hopping_matrix = SlaterKoster().resolve_hopping_matrix(
+        bonds, [model_system], logger
+    )
+    assert hopping_matrix.wigner_seitz_points.tolist() == [[0, 0, 0]]
+    block = hopping_matrix.blocks[0].to('eV').magnitude
+    assert np.allclose(block, block.conj().T)
+    cos_x, cos_y, cos_z = DIRECTION
+    v = SLATER_KOSTER_INTEGRALS
+    expected = {
+        (S, X): cos_x * v['sps'],
+        (S, Z): cos_z * v['sps'],
+        (X, X): cos_x**2 * v['pps'] + (1 - cos_x**2) * v['ppp'],
+        (X, Y): cos_x * cos_y * (v['pps'] - v['ppp']),
+        (Y, Z): cos_y * cos_z * (v['pps'] - v['ppp']),
+        (S, XY): np.sqrt(3) * cos_x * cos_y * v['sds'],
+        (X, XY): np.sqrt(3) * cos_x**2 * cos_y * v['pds']
+        + cos_y * (1 - 2 * cos_x**2) * v['pdp'],
+        (Z, XY): cos_x * cos_y * cos_z * (np.sqrt(3) * v['pds'] - 2 * v['pdp']),
+    }
+    for (orbital_1, orbital_2), value in expected.items():
+        assert block[orbital_1, 5 + orbital_2] == pytest.approx(value)
+    # Orbitals on the same atom are not coupled by the bonds
+    assert np.allclose(block[:5, :5], 0.0)
+
+
+@pytest.mark.parametrize(
+    'name, orbital_1, orbital_2',
+    [('sps', S, X), ('sds', S, XY), ('pds', X, XY), ('pdp', Z, XY)],
+)
+def test_slater_koster_reversed_order(name: str, orbital_1: int, orbital_2: int):
+    """
+    Test that a bond with its orbitals in reversed order gets the parity factor (-1)^(l_1 + l_2), i.e., that it
+    gives the same Hamiltonian as the bond in the order of its `name`.
+    """
+    model_system = generate_slater_koster_system()
+    slater_koster = SlaterKoster()
+    blocks = []
+    for bond in [
+        generate_slater_koster_bond(model_system, name, (1, orbital_1), (0, orbital_2)),
+        generate_slater_koster_bond(model_system, name, (0, orbital_2), (1, orbital_1)),
+    ]:
+        hopping_matrix = slater_koster.resolve_hopping_matrix(
+            [bond], [model_system], logger
+        )
+        blocks.append(hopping_matrix.blocks[0].to('eV').magnitude)
+    assert np.allclose(blocks[0], blocks[1])
+    assert not np.allclose(blocks[0], 0.0)
+    # The odd p-d and s-p bonds change sign when the bond vector is reversed
+    l_symbols = [
+        SLATER_KOSTER_ORBITALS[index]['l_quantum_symbol']
+        for index in (orbital_1, orbital_2)
+    ]
+    is_odd = l_symbols.count('p') == 1
+    mirrored = generate_slater_koster_bond(
+        model_system, name, (0, orbital_1), (1, orbital_2)
+    )
+    hopping_matrix = slater_koster.resolve_hopping_matrix(
+        [mirrored], [model_system], logger
+    )
+    sign = -1 if is_odd else 1
+    assert blocks[1][orbital_2, 5 + orbital_1] == pytest.approx(
+        sign * hopping_matrix.blocks[0].to('eV').magnitude[orbital_1, 5 + orbital_2]
+    )
+
+
+def test_slater_koster_mismatched_bond():
+    """
+    Test that a bond whose orbitals do not match its `name` is not resolved.
+    """
+    model_system = generate_slater_koster_system()
+    bond = generate_slater_koster_bond(model_system, 'sps', (0, XY), (1, X))
+    with capture_logs() as logs:
+        hopping_matrix = SlaterKoster().resolve_hopping_matrix(
+            [bond], [model_system], logger
+        )
+    assert hopping_matrix is None
+    assert any('do not match' in log['event'] for log in logs)
@@ -0,0 +1,102 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import numpy as np
+
+from nomad.utils import get_logger
+
+from nomad_simulations.atoms_state import AtomsState
+from nomad_simulations.model_system import AtomicCell, Symmetry
+
+logger = get_logger(__name__)
+
+# Operations of a hexagonal cell (non-orthogonal fractional coordinates): identity, 6-fold screw, 3-fold and mirror
+HEXAGONAL_ROTATIONS = np.array(
+    [
+        [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+        [[1, -1, 0], [1, 0, 0], [0, 0, 1]],
+        [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
+        [[0, 1, 0], [1, 0, 0], [0, 0, 1]],
+    ]
+)
+HEXAGONAL_TRANSLATIONS = np.array(
+    [[0.0, 0.0, 0.0], [0.0, 0.0, 0.5], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+)
+
+
+def test_apply_symmetry_operations():
+    """
+    Test that the i-th transformed real and reciprocal space points correspond to the i-th symmetry operation,
+    i.e., that the phases `k . x` are invariant under each operation.
+    """
+    symmetry = Symmetry(
+        n_symmetry_operations=len(HEXAGONAL_ROTATIONS),
+        rotation_matrices=HEXAGONAL_ROTATIONS,
+        translation_vectors=HEXAGONAL_TRANSLATIONS,
+    )
+    rng = np.random.default_rng(0)
+    positions = rng.random((5, 3))
+    k_points = rng.random((7, 3))
+    transformed_positions = symmetry.apply_symmetry_operations(positions, logger)
+    transformed_k_points = symmetry.apply_symmetry_operations(
+        k_points, logger, reciprocal=True
+    )
+    assert transformed_positions.shape == (4, 5, 3)
+    assert transformed_k_points.shape == (4, 7, 3)
+    assert np.allclose(
+        transformed_positions,
+        np.einsum('oij,pj->opi', HEXAGONAL_ROTATIONS, positions)
+        + HEXAGONAL_TRANSLATIONS[:, np.newaxis],
+    )
+
+    rotated_positions = transformed_positions - HEXAGONAL_TRANSLATIONS[:, np.newaxis]
+    for operation in range(len(HEXAGONAL_ROTATIONS)):
+        assert np.allclose(
+            transformed_k_points[operation] @ rotated_positions[operation].T,
+            k_points @ positions.T,
+        )
+
+
+def test_resolve_chemical_symbols_and_numbers():
+    """
+    Test that resolving the chemical symbols and atomic numbers of a whole `AtomicCell` gives the same results
+    as resolving each `AtomsState`.
+    """
+    atoms = [
+        {'chemical_symbol': 'Ga'},
+        {'atomic_number': 33},
+        {'chemical_symbol': 'H', 'atomic_number': 1},
+        {'atomic_number': 200},
+        {'chemical_symbol': 'Og'},
+        {},
+    ]
+    atomic_cell = AtomicCell(atoms_state=[AtomsState(**atom) for atom in atoms])
+    atomic_cell.resolve_chemical_symbols_and_numbers(logger)
+    for atom, atom_state in zip(atoms, atomic_cell.atoms_state):
+        reference = AtomsState(**atom)
+        reference.resolve_chemical_symbol_and_number(logger)
+        assert atom_state.chemical_symbol == reference.chemical_symbol
+        assert atom_state.atomic_number == reference.atomic_number
+    assert [atom_state.atomic_number for atom_state in atomic_cell.atoms_state] == [
+        31,
+        33,
+        1,
+        200,
+        118,
+        None,
+    ]
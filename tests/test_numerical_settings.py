@@ -0,0 +1,474 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import itertools
+import numpy as np
+import pytest
+import spglib
+from structlog.testing import capture_logs
+from typing import Optional
+
+from nomad.datamodel import EntryArchive
+from nomad.units import ureg
+from nomad.utils import get_logger
+
+from nomad_simulations.general import Simulation
+from nomad_simulations.model_method import ModelMethod
+from nomad_simulations.model_system import AtomicCell, ModelSystem, Symmetry
+from nomad_simulations.numerical_settings import (
+    KMesh,
+    LinePathSegment,
+    QuasiparticlesFrequencyMesh,
+)
+
+logger = get_logger(__name__)
+
+FCC = (
+    np.array([[0.0, 0.5, 0.5], [0.5, 0.0, 0.5], [0.5, 0.5, 0.0]]),
+    [[0.0, 0.0, 0.0]],
+    [1],
+)
+WURTZITE = (
+    np.array([[1.0, 0.0, 0.0], [-0.5, np.sqrt(3) / 2, 0.0], [0.0, 0.0, 1.6]]),
+    [
+        [1 / 3, 2 / 3, 0.0],
+        [2 / 3, 1 / 3, 0.5],
+        [1 / 3, 2 / 3, 0.375],
+        [2 / 3, 1 / 3, 0.875],
+    ],
+    [1, 1, 2, 2],
+)
+
+
+def resolve_kmesh(cell: tuple, grid: list, center: str) -> tuple:
+    """
+    Resolves the irreducible mesh of a `KMesh` with the rotations of `cell`.
+    """
+    rotations = spglib.get_symmetry_dataset(cell).rotations
+    k_mesh = KMesh(grid=grid, center=center)
+    k_mesh.offset = k_mesh.resolve_offset(logger)
+    return k_mesh, k_mesh.resolve_irreducible_points(rotations, logger)
+
+
+def store_unfolding_maps(k_mesh: KMesh, mesh: tuple) -> None:
+    """
+    Stores the full-BZ unfolding maps of the resolved irreducible `mesh` in `k_mesh`.
+    """
+    (
+        k_mesh.irreducible_indices,
+        k_mesh.rotation_indices,
+        k_mesh.rotation_matrices,
+        k_mesh.is_time_reversed,
+    ) = mesh[2:]
+
+
+@pytest.mark.parametrize(
+    'cell, grid, center, is_shift',
+    [
+        (FCC, [6, 6, 3], 'Gamma-centered', [0, 0, 0]),
+        (FCC, [8, 8, 8], 'Gamma-centered', [0, 0, 0]),
+        (FCC, [4, 4, 4], 'Monkhorst-Pack', [1, 1, 1]),
+        (WURTZITE, [6, 6, 4], 'Gamma-centered', [0, 0, 0]),
+        (WURTZITE, [5, 5, 3], 'Gamma-centered', [0, 0, 0]),
+    ],
+)
+def test_irreducible_points(cell: tuple, grid: list, center: str, is_shift: list):
+    """
+    Test the number of irreducible points against spglib, and that their multiplicities add up to the full mesh.
+    """
+    _, (points, multiplicities, *_) = resolve_kmesh(cell, grid, center)
+    mapping, _ = spglib.get_ir_reciprocal_mesh(grid, cell, is_shift=is_shift)
+    assert len(points) == len(np.unique(mapping))
+    assert multiplicities.sum() == np.prod(grid)
+
+
+def test_stored_irreducible_mesh():
+    """
+    Test that the irreducible mesh regenerated from the stored unfolding maps is the resolved one.
+    """
+    k_mesh, mesh = resolve_kmesh(FCC, [6, 6, 3], 'Gamma-centered')
+    store_unfolding_maps(k_mesh, mesh)
+    for stored, resolved in zip(k_mesh.resolve_stored_irreducible_mesh(logger), mesh):
+        assert np.allclose(stored, resolved)
+
+
+@pytest.mark.parametrize('cell, grid', [(FCC, [6, 6, 3]), (WURTZITE, [6, 6, 4])])
+def test_unfolding_maps(cell: tuple, grid: list):
+    """
+    Test that rotating the irreducible points with the unfolding maps regenerates the full mesh.
+    """
+    k_mesh, mesh = resolve_kmesh(cell, grid, 'Gamma-centered')
+    points, _, irreducible_indices, rotation_indices, rotations, _ = mesh
+    full_points = np.concatenate(list(k_mesh.iter_full_points(k_mesh.offset)))
+    unfolded_points = np.einsum(
+        'pi,pij->pj',
+        points[irreducible_indices],
+        rotations[rotation_indices].astype(np.float64),
+    )
+    difference = unfolded_points - full_points
+    assert np.allclose(difference, np.rint(difference))
+
+
+def test_unfold_round_trip():
+    """
+    Test that unfolding a symmetric periodic function from the irreducible points gives its values on the full mesh.
+    """
+    k_mesh, mesh = resolve_kmesh(FCC, [8, 8, 8], 'Gamma-centered')
+    store_unfolding_maps(k_mesh, mesh)
+    # Nearest neighbours of the fcc lattice in fractional coordinates: f(k) = sum_n cos(2 pi k . n) is invariant
+    lattice_vectors = FCC[0]
+    candidates = np.array(list(itertools.product(range(-1, 2), repeat=3)))
+    lengths = np.linalg.norm(candidates @ lattice_vectors, axis=-1)
+    neighbours = candidates[np.isclose(lengths, lengths[lengths > 0].min())]
+
+    def function(points: np.ndarray) -> np.ndarray:
+        return np.cos(2 * np.pi * points @ neighbours.T).sum(axis=-1)
+
+    full_points = np.concatenate(list(k_mesh.iter_full_points(k_mesh.offset)))
+    unfolded = k_mesh.unfold(function(mesh[0]), logger)
+    assert np.allclose(unfolded, function(full_points))
+    # Folding back at the representatives recovers the irreducible values
+    _, representatives = np.unique(mesh[2], return_index=True)
+    assert np.allclose(unfolded[representatives], function(mesh[0]))
+
+
+def test_tetrahedron_dos_normalization():
+    """
+    Test that the tetrahedron DOS of a free-electron band integrates to one state per band.
+    """
+    k_mesh = KMesh(
+        grid=[12, 12, 12],
+        center='Gamma-centered',
+        reciprocal_lattice_vectors=np.eye(3) / ureg.angstrom,
+    )
+    rotations = spglib.get_symmetry_dataset(
+        (np.eye(3), [[0.0, 0.0, 0.0]], [1])
+    ).rotations
+    k_mesh.offset = k_mesh.resolve_offset(logger)
+    mesh = k_mesh.resolve_irreducible_points(rotations, logger)
+    k_mesh.m_cache['irreducible_mesh'] = mesh
+    store_unfolding_maps(k_mesh, mesh)
+
+    k_squared = ((2 * np.pi * mesh[0]) ** 2).sum(axis=-1)
+    energies = np.stack([k_squared, k_squared + 5.0], axis=-1)
+    energy_grid = np.linspace(-1.0, 40.0, 2000)
+    dos, idos = k_mesh.compute_tetrahedron_dos(energies, energy_grid, logger)
+    assert idos[0] == pytest.approx(0.0)
+    assert idos[-1] == pytest.approx(2.0)
+    assert np.all(np.diff(idos) >= -1e-12)
+    assert np.trapezoid(dos, energy_grid) == pytest.approx(2.0, rel=1e-3)
+
+
+def test_implicit_kmesh():
+    """
+    Test that a regular `KMesh` is stored implicitly, and that its points are generated on access.
+    """
+    k_mesh = KMesh(grid=[4, 4, 4], center='Monkhorst-Pack')
+    k_mesh.normalize(EntryArchive(), logger)
+    assert k_mesh.is_implicit
+    assert k_mesh.points is None and k_mesh.all_points is None
+    points = k_mesh.get_points(logger)
+    assert points.dtype == np.float64
+    assert k_mesh.n_points == len(points)
+    assert k_mesh.multiplicities.sum() == 64
+    assert np.sum(k_mesh.get_weights(logger)) == pytest.approx(1.0)
+    chunks = list(k_mesh.iter_points(logger, full=True, chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10] * 6 + [4]
+    assert np.allclose(
+        np.concatenate(chunks), k_mesh.resolve_points_and_offset(logger)[0]
+    )
+
+
+def test_explicit_kmesh():
+    """
+    Test that the stored points of a `KMesh` are only kept when they are not the regular mesh.
+    """
+    reference = KMesh(grid=[4, 4, 4], center='Gamma-centered')
+    reference.normalize(EntryArchive(), logger)
+    full_points = reference.resolve_points_and_offset(logger)[0]
+    # The regular points (up to reciprocal lattice vectors) are not stored
+    k_mesh = KMesh(
+        grid=[4, 4, 4],
+        center='Gamma-centered',
+        points=reference.get_points(logger) + 1,
+        all_points=full_points,
+    )
+    k_mesh.normalize(EntryArchive(), logger)
+    assert k_mesh.is_implicit
+    assert k_mesh.points is None and k_mesh.all_points is None
+    # Irregular points are materialized
+    points = np.array([[0.1, 0.0, 0.0], [0.2, 0.3, 0.0]])
+    k_mesh = KMesh(grid=[4, 4, 4], center='Gamma-centered', points=points)
+    k_mesh.normalize(EntryArchive(), logger)
+    assert not k_mesh.is_implicit
+    assert np.allclose(k_mesh.get_points(logger), points)
+
+
+def test_line_path():
+    """
+    Test that the line path segments are slices of one path buffer with a cumulative Cartesian distance axis.
+    """
+    k_mesh = KMesh(
+        reciprocal_lattice_vectors=2 * np.pi * np.eye(3) / ureg.angstrom,
+        high_symmetry_points={
+            'Gamma': [0.0, 0.0, 0.0],
+            'X': [0.5, 0.0, 0.0],
+            'M': [0.5, 0.5, 0.0],
+            'R': [0.5, 0.5, 0.5],
+        },
+        line_path_segments=[
+            LinePathSegment(high_symmetry_path=path, n_line_points=n_line_points)
+            for path, n_line_points in [
+                (['Gamma', 'X'], 5),
+                (['X', 'M'], 3),
+                (['R', 'Gamma'], 4),  # discontinuous path 'M|R'
+            ]
+        ],
+    )
+    k_mesh.normalize(EntryArchive(), logger)
+    points, distances, offsets = k_mesh.resolve_line_path(logger)
+    assert points.shape == (12, 3)
+    assert offsets.tolist() == [0, 5, 8, 12]
+    for segment, start, stop in zip(k_mesh.line_path_segments, offsets, offsets[1:]):
+        assert np.shares_memory(segment.points, points)
+        assert np.allclose(segment.points, points[start:stop])
+        resolved = segment.resolve_points(
+            segment.high_symmetry_path, segment.n_line_points, logger
+        )
+        assert np.allclose(resolved, segment.points)
+    assert np.allclose(points[:5, 0], np.linspace(0.0, 0.5, 5))
+    assert np.allclose(points[-1], [0.0, 0.0, 0.0])
+    # The distances are in 1/angstrom, and do not increase across the jump from 'M' to 'R'
+    distances = k_mesh.line_path_distances.to('1/angstrom').magnitude
+    assert np.all(np.diff(distances) >= 0)
+    assert distances[4] == pytest.approx(np.pi)
+    assert distances[8] == pytest.approx(distances[7])
+    assert distances[-1] == pytest.approx((2 + np.sqrt(3)) * np.pi)
+
+
+# Primitive lattice vectors of the fcc and bcc lattices in units of the conventional ones
+FCC_CENTRING = np.array([[0.0, 0.5, 0.5], [0.5, 0.0, 0.5], [0.5, 0.5, 0.0]])
+BCC_CENTRING = np.array([[-0.5, 0.5, 0.5], [0.5, -0.5, 0.5], [0.5, 0.5, -0.5]])
+
+
+@pytest.mark.parametrize(
+    'bravais_lattice, centring, has_primitive_cell, expected_points',
+    [
+        (None, None, False, {'X': [0.0, 0.5, 0.0], 'R': [0.5, 0.5, 0.5]}),
+        ('cP', None, False, {'X': [0.0, 0.5, 0.0], 'R': [0.5, 0.5, 0.5]}),
+        ('cF', FCC_CENTRING, False, {'X': [0.0, 1.0, 0.0], 'L': [0.5, 0.5, 0.5]}),
+        ('cF', FCC_CENTRING, True, {'X': [0.0, 1.0, 0.0], 'L': [0.5, 0.5, 0.5]}),
+        ('cI', BCC_CENTRING, False, {'H': [0.0, 0.0, 1.0], 'P': [0.5, 0.5, 0.5]}),
+    ],
+)
+def test_bandpath_template(
+    bravais_lattice: Optional[str],
+    centring: Optional[np.ndarray],
+    has_primitive_cell: bool,
+    expected_points: dict,
+):
+    """
+    Test that the band path of a conventional cubic cell is the one of its `Symmetry.bravais_lattice`, with the
+    high-symmetry points in units of the conventional reciprocal lattice vectors.
+    """
+    lattice_vectors = 3.6 * np.eye(3) * ureg.angstrom
+    cells = [AtomicCell(type='original', lattice_vectors=lattice_vectors)]
+    if has_primitive_cell:
+        cells.append(
+            AtomicCell(type='primitive', lattice_vectors=centring @ lattice_vectors)
+        )
+    model_system = ModelSystem(
+        cell=cells,
+        symmetry=[Symmetry(bravais_lattice=bravais_lattice)] if bravais_lattice else [],
+    )
+    with capture_logs() as logs:
+        template = KMesh().resolve_bandpath_template([model_system], logger)
+    assert not [log for log in logs if log['log_level'] in ['warning', 'error']]
+    high_symmetry_points, segments = template
+    assert {label for pair in segments for label in pair} == set(high_symmetry_points)
+    for label, point in expected_points.items():
+        # The points are equivalent up to the cubic symmetry operations
+        assert np.allclose(np.sort(np.abs(high_symmetry_points[label])), np.sort(point))
+
+
+def test_bandpath_template_molecule():
+    """
+    Test that the band path of a molecule is skipped without warnings.
+    """
+    simulation = Simulation(
+        model_system=[
+            ModelSystem(
+                type='molecule / cluster',
+                cell=[AtomicCell(positions=np.zeros((1, 3)) * ureg.angstrom)],
+            )
+        ],
+        model_method=[ModelMethod(numerical_settings=[KMesh(grid=[1, 1, 1])])],
+    )
+    k_mesh = simulation.model_method[0].numerical_settings[0]
+    with capture_logs() as logs:
+        k_mesh.normalize(EntryArchive(), logger)
+    assert k_mesh.high_symmetry_points is None
+    assert not [log for log in logs if 'band path' in log['event']]
+
+
+def test_k_line_densities():
+    """
+    Test the batched k-line densities against the per-mesh definition, for 3D, 2D, and 1D meshes.
+    """
+    rng = np.random.default_rng(0)
+    reciprocal_lattice_vectors = rng.normal(size=(4, 3, 3)) * 1e10
+    grids = np.array([[4, 4, 4], [8, 6, 2], [6, 6, 1], [5, 1, 1]])
+    periodic = np.array(
+        [
+            [True, True, True],
+            [True, True, True],
+            [True, True, False],
+            [True, False, False],
+        ]
+    )
+    densities = KMesh.compute_k_line_densities(
+        grids, reciprocal_lattice_vectors / ureg.meter, periodic
+    )
+    for density, grid, vectors, mask in zip(
+        densities, grids, reciprocal_lattice_vectors, periodic
+    ):
+        expected = min(
+            grid[i] / np.linalg.norm(vectors[i]) for i in range(3) if mask[i]
+        )
+        assert density.to('meter').magnitude == pytest.approx(expected)
+    # 2D grids are padded with a non-periodic axis, and meshes without periodic axes are NaN
+    densities = KMesh.compute_k_line_densities(
+        grids[:2, :2], reciprocal_lattice_vectors[:2], [[True, True, False]] * 2
+    )
+    assert np.allclose(
+        densities.magnitude,
+        (
+            grids[:2, :2] / np.linalg.norm(reciprocal_lattice_vectors[:2, :2], axis=-1)
+        ).min(axis=-1),
+    )
+    assert np.isnan(
+        KMesh.compute_k_line_densities([1, 1, 1], np.eye(3), [False] * 3)[0].magnitude
+    )
+
+
+def test_grids_from_spacing():
+    """
+    Test that the grids computed from a target k-spacing are the smallest ones reaching it.
+    """
+    rng = np.random.default_rng(1)
+    reciprocal_lattice_vectors = rng.normal(size=(5, 3, 3))
+    k_spacings = rng.uniform(0.1, 0.5, size=5)
+    grids = KMesh.compute_grids_from_spacing(k_spacings, reciprocal_lattice_vectors)
+    norms = np.linalg.norm(reciprocal_lattice_vectors, axis=-1)
+    assert np.all(norms / grids <= k_spacings[:, np.newaxis] + 1e-12)
+    assert np.all((grids == 1) | (norms / (grids - 1) > k_spacings[:, np.newaxis]))
+    # Commensurate spacings give exact grids, and non-periodic axes are not sampled
+    grids = KMesh.compute_grids_from_spacing(
+        0.2 / ureg.angstrom,
+        np.diag([1.0, 0.6, 0.4]) / ureg.angstrom,
+        [True, True, False],
+    )
+    assert grids.tolist() == [[5, 3, 1]]
+
+
+def test_resolve_k_line_density_2d():
+    """
+    Test the k-line density of a 2D system, resolved from the last representative `ModelSystem`.
+    """
+    model_system = ModelSystem(
+        is_representative=True,
+        type='2D',
+        cell=[
+            AtomicCell(
+                lattice_vectors=np.diag([3.0, 4.0, 20.0]) * ureg.angstrom,
+                periodic_boundary_conditions=[True, True, False],
+            )
+        ],
+    )
+    k_mesh = KMesh(grid=[6, 6, 1])
+    k_line_density = k_mesh.resolve_k_line_density(
+        [model_system, ModelSystem(is_representative=False)], logger
+    )
+    # The least precise periodic axis is the one along the shortest lattice vector
+    assert k_line_density.to('angstrom').magnitude == pytest.approx(
+        6 * 3.0 / (2 * np.pi)
+    )
+
+
+@pytest.mark.parametrize(
+    'points, weights, is_implicit',
+    [
+        # The midpoint rule of 4 points up to 40 eV
+        ([5.0, 15.0, 25.0, 35.0], [10.0] * 4, True),
+        # A different parsed mesh and its weights are kept
+        ([10.0, 20.0, 30.0, 40.0], [5.0, 10.0, 10.0, 15.0], False),
+        ([5.0, 15.0, 25.0, 35.0 + 1e-3], [10.0] * 4, False),
+    ],
+)
+def test_frequency_mesh_normalize(points: list, weights: list, is_implicit: bool):
+    """
+    Test that a parsed `QuasiparticlesFrequencyMesh` is only stored implicitly if it is the one generated from its
+    quadrature, even though the magnitudes in joules are tiny.
+    """
+    frequency_mesh = QuasiparticlesFrequencyMesh(
+        n_points=4,
+        frequency_scale=40.0 * ureg.eV,
+        points=np.array(points)[:, np.newaxis] * ureg.eV,
+        weights=np.array(weights) * ureg.eV,
+    )
+    frequency_mesh.normalize(EntryArchive(), logger)
+    assert frequency_mesh.is_implicit == is_implicit
+    assert (frequency_mesh.points is None) == is_implicit
+    assert (frequency_mesh.weights is None) == is_implicit
+    assert np.allclose(
+        frequency_mesh.get_points(logger).to('eV').magnitude[:, 0], points
+    )
+    assert np.allclose(frequency_mesh.get_weights(logger).to('eV').magnitude, weights)
+
+
+@pytest.mark.parametrize(
+    'quadrature, spacing, n_points, rtol',
+    [
+        ('Gauss-Legendre', 'Equidistant', 8, 1e-6),
+        ('Clenshaw-Curtis', 'Equidistant', 16, 1e-6),
+        ('Gauss-Legendre', 'Tan', 64, 1e-6),
+        ('Clenshaw-Curtis', 'Tan', 64, 1e-6),
+        # The logarithmic mapping has integrable singularities at the end points
+        ('Gauss-Legendre', 'Logarithmic', 256, 1e-2),
+    ],
+)
+def test_frequency_mesh_quadrature(
+    quadrature: str, spacing: str, n_points: int, rtol: float
+):
+    """
+    Test that the generated points and weights integrate a Lorentzian over the frequency interval of the `spacing`.
+    """
+    scale = 2.0
+    frequency_mesh = QuasiparticlesFrequencyMesh(
+        quadrature=quadrature,
+        spacing=spacing,
+        n_points=n_points,
+        frequency_scale=scale * ureg.eV,
+        is_implicit=True,
+    )
+    points = frequency_mesh.get_points(logger).to('eV').magnitude[:, 0].real
+    weights = frequency_mesh.get_weights(logger).to('eV').magnitude
+    integral = np.sum(weights * scale**2 / (scale**2 + points**2))
+    # The integral of the Lorentzian up to the scale, or up to infinity
+    expected = np.pi / 4 if spacing == 'Equidistant' else np.pi / 2
+    assert integral == pytest.approx(scale * expected, rel=rtol)
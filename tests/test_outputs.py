@@ -0,0 +1,177 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import numpy as np
+import pytest
+from typing import Optional
+
+from nomad.datamodel import EntryArchive
+from nomad.datamodel.context import ServerLocalContext
+from nomad.units import ureg
+from nomad.utils import get_logger
+
+from nomad_simulations.general import Simulation
+from nomad_simulations.numerical_settings import SelfConsistency
+from nomad_simulations.outputs import Outputs, SCFHistory
+
+logger = get_logger(__name__)
+
+SELF_CONSISTENCY = SelfConsistency(
+    threshold_energy_change=1e-3 * ureg.joule, n_max_iterations=10
+)
+
+
+@pytest.mark.parametrize(
+    'energies, is_converged, convergence_iteration, first_threshold_iteration',
+    [
+        # The threshold is crossed at an intermediate iteration, but the run diverges afterwards
+        ([0, 1, 1.0005, 3, 5, 8, 10, 12, 14, 16], False, None, 3),
+        # The last iterations are below the threshold
+        ([0, 1, 2, 2.5, 2.5002, 2.5004, 2.5005], True, 5, 5),
+        # The threshold is only reached after `n_max_iterations`, so it is not counted
+        ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9.0001, 9.0002], False, None, None),
+    ],
+)
+def test_scf_convergence(
+    energies: list,
+    is_converged: bool,
+    convergence_iteration: Optional[int],
+    first_threshold_iteration: Optional[int],
+):
+    """
+    Test that the SCF convergence is judged on the last iteration, both for the full history and for the
+    iterations appended in chunks.
+    """
+    for chunks in ([energies], np.array_split(energies, 3)):
+        scf_history = SCFHistory()
+        for chunk in chunks:
+            scf_history.append_iterations(
+                logger,
+                energies=chunk * ureg.joule,
+                self_consistency=SELF_CONSISTENCY,
+            )
+        assert scf_history.n_iterations == len(energies)
+        assert scf_history.is_converged == is_converged
+        assert scf_history.convergence_iteration == convergence_iteration
+        assert scf_history.first_threshold_iteration == first_threshold_iteration
+
+
+def test_scf_convergence_is_rechecked():
+    """
+    Test that a converged history is not latched when diverging iterations are appended.
+    """
+    scf_history = SCFHistory()
+    for chunk, is_converged in [
+        ([0, 1, 1.0001], True),
+        ([2, 3], False),
+        ([3.0001, 3.0002], True),
+    ]:
+        scf_history.append_iterations(
+            logger, energies=chunk * ureg.joule, self_consistency=SELF_CONSISTENCY
+        )
+        assert scf_history.is_converged == is_converged
+    assert scf_history.convergence_iteration == 6
+    assert scf_history.first_threshold_iteration == 3
+
+
+def test_evaluate_convergence_batch():
+    """
+    Test the convergence of several histories of different lengths padded with NaN.
+    """
+    energies = np.array(
+        [
+            [0, 1, 1.0005, 3, 5, np.nan],
+            [0, 1, 1.0001, 1.0002, np.nan, np.nan],
+        ]
+    )
+    (
+        is_converged,
+        convergence_iterations,
+        first_threshold_iterations,
+        statistics,
+    ) = SCFHistory.evaluate_convergence(
+        energies,
+        None,
+        threshold_energy_change=1e-3,
+        n_max_iterations=10,
+    )
+    assert is_converged.tolist() == [False, True]
+    assert convergence_iterations.tolist() == [-1, 3]
+    assert first_threshold_iterations.tolist() == [3, 3]
+    assert statistics['final_energy_change'] == pytest.approx([2.0, 1e-4])
+    assert statistics['count_energy_change'].tolist() == [4, 3]
+
+
+@pytest.mark.parametrize('n_spin_channels', [1, 2])
+def test_broadened_dos_normalization(n_spin_channels: int):
+    """
+    Test that the Gaussian DOS of each spin channel integrates to the number of bands.
+    """
+    rng = np.random.default_rng(0)
+    shape = (8, n_spin_channels, 3) if n_spin_channels == 2 else (8, 3)
+    eigenvalues = rng.uniform(-5.0, 5.0, shape) * ureg.eV
+    density_of_states = Outputs().generate_dos(
+        eigenvalues, logger, method='gaussian', broadening=0.1 * ureg.eV
+    )
+    assert density_of_states.n_spin_channels == n_spin_channels
+    energies = density_of_states.energies.to('joule').magnitude
+    dos = density_of_states.value.to('1/joule').magnitude
+    assert np.allclose(density_of_states.integrated_value[:, -1], 3.0)
+    assert np.allclose(np.trapezoid(dos, energies, axis=-1), 3.0, rtol=1e-3)
+
+
+def test_chunked_array(tmp_path):
+    """
+    Test that a `ChunkedArray` is written chunk by chunk into an upload raw file, and read back by slices.
+    """
+    outputs = Outputs()
+    EntryArchive(
+        m_context=ServerLocalContext(tmp_path), data=Simulation(outputs=[outputs])
+    )
+    values = np.random.default_rng(0).random((12, 5))
+    array = outputs.store_array(
+        'eigenvalues',
+        (chunk * ureg.eV for chunk in np.split(values, 3)),
+        'outputs.h5',
+        logger,
+    )
+    assert (tmp_path / 'outputs.h5').exists()
+    assert array.reference == 'outputs.h5#/data/outputs/0/eigenvalues'
+    assert array.shape.tolist() == [12, 5]
+    assert array.dtype == 'float64'
+    assert outputs.get_array('eigenvalues') is array
+    assert np.allclose(array.read(logger).to('eV').magnitude, values)
+    assert np.allclose(
+        array.read(logger, np.s_[5:9, 2]).to('eV').magnitude, values[5:9, 2]
+    )
+
+    # Rows are appended and converted to the unit of the array
+    array.append(np.ones((2, 5)) * ureg.keV, logger)
+    assert array.shape.tolist() == [14, 5]
+    chunks = list(array.iter_chunks(logger, chunk_size=5))
+    assert [rows for rows, _ in chunks] == [slice(0, 5), slice(5, 10), slice(10, 14)]
+    stored = np.concatenate([chunk.to('eV').magnitude for _, chunk in chunks])
+    assert np.allclose(stored, np.concatenate([values, 1e3 * np.ones((2, 5))]))
+
+    # The metadata is synchronized with the dataset, which is never overwritten
+    array.shape = None
+    array.normalize(None, logger)
+    assert array.shape.tolist() == [14, 5]
+    assert outputs.store_array('eigenvalues', values, 'outputs.h5', logger) is None
+    assert not array.create((3, 5), np.float64, logger)
+    assert array.read(logger).shape == (14, 5)
@@ -0,0 +1,61 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import numpy as np
+import pytest
+from math import comb
+
+from nomad_simulations.utils import RussellSaundersState
+from nomad_simulations.utils.utils import _J_MAX
+
+
+@pytest.mark.parametrize('J', np.arange(0, _J_MAX + 0.5, 0.5))
+def test_russell_saunders_degeneracies(J: float):
+    """
+    Test that the vectorized `get_degeneracies` matches `RussellSaundersState.degeneracy` across the table,
+    including non-integer and out-of-range occupations.
+    """
+    multiplicity = int(2 * J + 1)
+    occupations = np.concatenate(
+        [np.arange(-1, multiplicity + 2), [0.5, multiplicity - 0.5]]
+    )
+    degeneracies = [
+        RussellSaundersState(J=J, occ=occupation).degeneracy
+        for occupation in occupations
+    ]
+    assert all(isinstance(degeneracy, float) for degeneracy in degeneracies)
+    assert np.array_equal(
+        RussellSaundersState.get_degeneracies(
+            np.full(len(occupations), J), occupations
+        ),
+        degeneracies,
+    )
+    for occupation, degeneracy in zip(occupations, degeneracies):
+        is_valid = occupation == int(occupation) and 0 <= occupation <= multiplicity
+        expected = comb(multiplicity, int(occupation)) if is_valid else 0
+        assert degeneracy == expected
+
+
+def test_russell_saunders_non_integer_multiplicity():
+    """
+    Test that a non-integer multiplicity has no states instead of being rounded.
+    """
+    assert RussellSaundersState(J=0.25, occ=1).degeneracy == 0.0
+    assert (
+        RussellSaundersState.get_degeneracies(np.array([0.25]), np.array([1]))[0] == 0
+    )
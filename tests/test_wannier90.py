@@ -0,0 +1,77 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import numpy as np
+import pytest
+
+from nomad.utils import get_logger
+
+from nomad_simulations.utils.wannier90 import read_hr_dat, read_tb_dat
+
+logger = get_logger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data', 'wannier90')
+
+# Two-orbital chain with nearest-neighbour hoppings, in eV
+WIGNER_SEITZ_POINTS = [[-1, 0, 0], [0, 0, 0], [1, 0, 0]]
+DEGENERACY_FACTORS = [2, 1, 2]
+HOPPING = np.array([[-1.0, 0.25], [0.25, -1.0]])
+ONSITE = np.array([[0.5, 0.1 + 0.2j], [0.1 - 0.2j, -0.5]])
+
+
+def check_hopping_matrix(hopping_matrix):
+    """
+    Checks the `HoppingMatrix` parsed from the chain fixtures.
+    """
+    assert hopping_matrix.n_orbitals == 2
+    assert hopping_matrix.n_wigner_seitz_points == 3
+    assert np.array_equal(hopping_matrix.wigner_seitz_points, WIGNER_SEITZ_POINTS)
+    assert np.array_equal(hopping_matrix.degeneracy_factors, DEGENERACY_FACTORS)
+    blocks = hopping_matrix.blocks.to('eV').magnitude
+    assert np.allclose(blocks, [HOPPING, ONSITE, HOPPING])
+
+
+@pytest.mark.parametrize('chunk_size', [64, 2**20])
+def test_read_hr_dat(chunk_size: int):
+    """
+    Test the parsing of a Wannier90 `_hr.dat` file, streamed in small and large chunks.
+    """
+    hopping_matrix = read_hr_dat(
+        os.path.join(DATA_DIR, 'chain_hr.dat'), logger, chunk_size=chunk_size
+    )
+    check_hopping_matrix(hopping_matrix)
+
+
+@pytest.mark.parametrize('chunk_size', [64, 2**20])
+def test_read_tb_dat(chunk_size: int):
+    """
+    Test the parsing of a Wannier90 `_tb.dat` file and its lattice vectors.
+    """
+    hopping_matrix, lattice_vectors = read_tb_dat(
+        os.path.join(DATA_DIR, 'chain_tb.dat'), logger, chunk_size=chunk_size
+    )
+    check_hopping_matrix(hopping_matrix)
+    assert np.allclose(lattice_vectors, np.diag([2.5, 10.0, 10.0]))
+
+
+def test_read_hr_dat_missing_file(tmp_path):
+    """
+    Test that a missing `_hr.dat` file is not parsed.
+    """
+    assert read_hr_dat(str(tmp_path / 'missing_hr.dat'), logger) is None